@@ -0,0 +1,144 @@
+"""
+Задержка посторонних страниц во время потока входов в аккаунт.
+
+Запуск из корня проекта:
+    python -m benchmarks.login_burst --executor thread
+    python -m benchmarks.login_burst --executor inline
+
+inline - хеширование в event loop (поведение до выноса в пул),
+thread/process - хеширование в пуле PasswordWorkerPool.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault('PROJECT_NAME', 'benchmark')
+os.environ.setdefault('SECRET', 'benchmark-secret')
+os.environ.setdefault('POSTGRES_USER', 'benchmark')
+os.environ.setdefault('POSTGRES_PASSWORD', 'benchmark')
+os.environ.setdefault('POSTGRES_DB', 'benchmark')
+os.environ.setdefault('LOGIN_RATE_PER_MINUTE_IP', '0')
+os.environ.setdefault('LOGIN_RATE_PER_MINUTE_EMAIL', '0')
+os.environ.setdefault('REGISTER_RATE_PER_MINUTE_IP', '0')
+
+from httpx import AsyncClient, ASGITransport  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    create_async_engine,
+    async_sessionmaker
+)
+
+from src.app.database import Base, get_db  # noqa: E402
+from src.app.main import app  # noqa: E402
+from src.app.models.user import User  # noqa: E402
+from src.app.auth.password_pool import PasswordWorkerPool  # noqa: E402
+from src.app.auth import password_pool as password_pool_module  # noqa: E402
+from src.app.auth import user_manager as user_manager_module  # noqa: E402
+
+EMAIL = 'bench@example.com'
+PASSWORD = 'Password123'
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    index = min(int(len(ordered) * q), len(ordered) - 1)
+    return ordered[index]
+
+
+async def run(args: argparse.Namespace) -> None:
+    pool = PasswordWorkerPool(
+        executor=args.executor,
+        workers=args.workers,
+        max_queue=args.logins * 2
+    )
+    password_pool_module.password_pool = pool
+    user_manager_module.password_pool = pool
+
+    db_file = tempfile.NamedTemporaryFile(suffix='.sqlite3', delete=False)
+    engine = create_async_engine(f'sqlite+aiosqlite:///{db_file.name}')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add(User(
+            first_name='Bench',
+            last_name='User',
+            email=EMAIL,
+            hashed_password=await PasswordWorkerPool(
+                'inline', 1, 1
+            ).hash(PASSWORD)
+        ))
+        await session.commit()
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    deadline = time.perf_counter() + args.duration
+    latencies: list[float] = []
+    logins = 0
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url='http://bench') as c:
+        async def hammer_login():
+            nonlocal logins
+            while time.perf_counter() < deadline:
+                await c.post(
+                    '/auth/login',
+                    data={'username': EMAIL, 'password': PASSWORD}
+                )
+                logins += 1
+
+        async def probe_page():
+            # Задержка считается от запланированного момента запроса,
+            # чтобы учитывать время блокировки event loop
+            scheduled = time.perf_counter()
+            while scheduled < deadline:
+                await asyncio.sleep(max(scheduled - time.perf_counter(), 0))
+                await c.get('/auth/register')
+                latencies.append((time.perf_counter() - scheduled) * 1000)
+                scheduled += args.probe_interval
+
+        await asyncio.gather(
+            *(hammer_login() for _ in range(args.logins)),
+            *(probe_page() for _ in range(args.probes))
+        )
+
+    app.dependency_overrides.clear()
+    pool.shutdown()
+    await engine.dispose()
+    os.unlink(db_file.name)
+
+    print(f'executor={args.executor} workers={args.workers}')
+    print(f'logins={logins} ({logins / args.duration:.1f}/s)')
+    print(
+        f'/auth/register: n={len(latencies)} '
+        f'p50={statistics.median(latencies):.1f}ms '
+        f'p99={percentile(latencies, 0.99):.1f}ms '
+        f'max={max(latencies):.1f}ms'
+    )
+    print(f'pool: {pool.stats()}')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        '--executor',
+        choices=['inline', 'thread', 'process'],
+        default='thread'
+    )
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--logins', type=int, default=16)
+    parser.add_argument('--probes', type=int, default=4)
+    parser.add_argument('--probe-interval', type=float, default=0.05)
+    parser.add_argument('--duration', type=float, default=10.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
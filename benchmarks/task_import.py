@@ -0,0 +1,134 @@
+"""
+Время массового импорта задач через /tasks/admin/import.
+
+Запуск из корня проекта:
+    python -m benchmarks.task_import --tasks 100000
+    python -m benchmarks.task_import --tasks 100000 --format ndjson
+
+Используется временный файл SQLite.
+"""
+import argparse
+import asyncio
+import csv
+import io
+import json
+import os
+import tempfile
+import time
+
+os.environ.setdefault('PROJECT_NAME', 'benchmark')
+os.environ.setdefault('SECRET', 'benchmark-secret')
+os.environ.setdefault('POSTGRES_USER', 'benchmark')
+os.environ.setdefault('POSTGRES_PASSWORD', 'benchmark')
+os.environ.setdefault('POSTGRES_DB', 'benchmark')
+
+from httpx import AsyncClient, ASGITransport  # noqa: E402
+from sqlalchemy import func, select  # noqa: E402
+from sqlalchemy.ext.asyncio import (  # noqa: E402
+    create_async_engine,
+    async_sessionmaker
+)
+
+from src.app.database import Base, get_db  # noqa: E402
+from src.app.main import app  # noqa: E402
+from src.app.auth.dependencies import get_current_user  # noqa: E402
+from src.app.models.user import User  # noqa: E402
+from src.app.models.team import Team  # noqa: E402
+from src.app.models.task import Task  # noqa: E402
+
+FIELDS = ['title', 'description', 'team_id', 'performer_email']
+
+
+def build_file(args: argparse.Namespace) -> bytes:
+    rows = (
+        {
+            'title': f'Task {number}',
+            'description': 'Imported',
+            'team_id': number % args.teams + 1,
+            'performer_email': f'user{number % args.users + 1}@example.com',
+        }
+        for number in range(args.tasks)
+    )
+    buffer = io.StringIO()
+    if args.format == 'csv':
+        writer = csv.DictWriter(buffer, FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        buffer.writelines(json.dumps(row) + '\n' for row in rows)
+    return buffer.getvalue().encode()
+
+
+async def run(args: argparse.Namespace) -> None:
+    db_file = tempfile.NamedTemporaryFile(suffix='.sqlite3', delete=False)
+    engine = create_async_engine(f'sqlite+aiosqlite:///{db_file.name}')
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with session_factory() as session:
+        session.add_all(
+            Team(id=team_id, name=f'Team {team_id}', code=f'T{team_id}')
+            for team_id in range(1, args.teams + 1)
+        )
+        session.add_all(
+            User(
+                first_name='User',
+                last_name=str(user_id),
+                email=f'user{user_id}@example.com',
+                hashed_password='x',
+                role='admin' if user_id == 1 else 'user'
+            )
+            for user_id in range(1, args.users + 1)
+        )
+        await session.commit()
+        admin = await session.get(User, 1)
+
+    async def override_get_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: admin
+
+    content = build_file(args)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(
+        transport=transport,
+        base_url='http://bench',
+        timeout=None
+    ) as c:
+        start = time.perf_counter()
+        response = await c.post(
+            '/tasks/admin/import',
+            files={'file': (f'tasks.{args.format}', content)}
+        )
+        elapsed = time.perf_counter() - start
+
+    async with session_factory() as session:
+        stored = await session.scalar(select(func.count(Task.id)))
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+    os.unlink(db_file.name)
+
+    report = response.json()
+    print(
+        f'format={args.format} tasks={args.tasks} '
+        f'imported={report["imported"]} errors={len(report["errors"])} '
+        f'stored={stored}'
+    )
+    print(f'{elapsed:.2f}s ({args.tasks / elapsed:.0f} tasks/s)')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tasks', type=int, default=100000)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--teams', type=int, default=10)
+    parser.add_argument('--format', choices=['csv', 'ndjson'], default='csv')
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,73 +1,89 @@
 #!/usr/bin/env bash
 set -e
 
-wait_for_db() {
-  echo "Waiting for database at ${POSTGRES_HOST}:${POSTGRES_PORT}..."
+# Ожидание БД с экспоненциальной задержкой и проверка версии схемы.
+# Выводит действие для миграций: skip, upgrade или stamp:<ревизия>
+migration_action() {
   python - <<PY
-import os, time
+import os
+import sys
+import time
+
 import psycopg2
+from alembic.config import Config
+from alembic.script import ScriptDirectory
 
 host = os.getenv("POSTGRES_HOST", "db")
 port = int(os.getenv("POSTGRES_PORT", "5432"))
-user = os.getenv("POSTGRES_USER", "postgres")
-password = os.getenv("POSTGRES_PASSWORD", "")
-dbname = os.getenv("POSTGRES_DB", "postgres")
+timeout = float(os.getenv("DB_WAIT_TIMEOUT", "60"))
 
-dsn = f"dbname={dbname} user={user} password={password} host={host} port={port}"
-for i in range(60):
+deadline = time.monotonic() + timeout
+delay = 0.05
+while True:
     try:
-        conn = psycopg2.connect(dsn)
-        conn.close()
-        print("Database is up!")
+        conn = psycopg2.connect(
+            dbname=os.getenv("POSTGRES_DB", "postgres"),
+            user=os.getenv("POSTGRES_USER", "postgres"),
+            password=os.getenv("POSTGRES_PASSWORD", ""),
+            host=host,
+            port=port,
+            connect_timeout=2,
+        )
         break
-    except Exception:
-        print("DB not ready, sleeping 1s...")
-        time.sleep(1)
-else:
-    print("Timed out waiting for database.")
-    raise SystemExit(1)
-PY
-}
-
-wait_for_db
-
-if [ -f "alembic.ini" ]; then
-  echo "Alembic found."
+    except psycopg2.OperationalError as e:
+        if time.monotonic() + delay > deadline:
+            print(f"Timed out waiting for database: {e}", file=sys.stderr)
+            raise SystemExit(1)
+        time.sleep(delay)
+        delay = min(delay * 2, 2.0)
+print(f"Database at {host}:{port} is up.", file=sys.stderr)
 
-  VERSION_COUNT=$(python - <<PY
-import os
-import psycopg2
-
-conn = psycopg2.connect(
-    dbname=os.getenv("POSTGRES_DB"),
-    user=os.getenv("POSTGRES_USER"),
-    password=os.getenv("POSTGRES_PASSWORD"),
-    host=os.getenv("POSTGRES_HOST", "db"),
-    port=os.getenv("POSTGRES_PORT", "5432")
-)
 cur = conn.cursor()
-try:
-    cur.execute("SELECT COUNT(*) FROM alembic_version;")
-    count = cur.fetchone()[0]
-except:
-    count = 0
+cur.execute("SELECT to_regclass('alembic_version'), to_regclass('revoked_tokens')")
+version_table, revoked_tokens = cur.fetchone()
+versions = set()
+if version_table:
+    cur.execute("SELECT version_num FROM alembic_version")
+    versions = {row[0] for row in cur.fetchall()}
 cur.close()
 conn.close()
-print(count)
+
+script = ScriptDirectory.from_config(Config("alembic.ini"))
+heads = set(script.get_heads())
+known = {revision.revision for revision in script.walk_revisions()}
+
+if versions == heads:
+    print("skip")
+elif versions and not versions & known:
+    # База создана автогенерацией до появления версий миграций
+    print("stamp:" + (
+        "0002_revoked_tokens" if revoked_tokens else "0001_initial_schema"
+    ))
+else:
+    print("upgrade")
 PY
-)
+}
 
-  if [ "$VERSION_COUNT" -eq 0 ]; then
-    echo "No migration applied in DB. Generating initial migration..."
-    alembic revision --autogenerate -m "Initial migration"
-  else
-    echo "Migration already applied in DB. Skipping generation."
-  fi
+if [ -f "alembic.ini" ]; then
+  ACTION=$(migration_action)
 
-  echo "Applying migrations..."
-  alembic upgrade head || echo "Alembic returned non-zero (continuing)..."
+  case "$ACTION" in
+    skip)
+      echo "Database schema is up to date."
+      ;;
+    stamp:*)
+      echo "Legacy migration found in DB. Stamping ${ACTION#stamp:}..."
+      alembic stamp --purge "${ACTION#stamp:}"
+      echo "Applying migrations..."
+      alembic upgrade head
+      ;;
+    upgrade)
+      echo "Applying migrations..."
+      alembic upgrade head
+      ;;
+  esac
 else
   echo "No alembic.ini found — skipping migrations."
 fi
 
-exec "$@"
\ No newline at end of file
+exec "$@"
@@ -15,10 +15,18 @@ from src.app.admin.views import (
 from src.app.database import async_session
 from src.app.config import settings
 from src.app.models.user import User
+from src.app.auth.user_cache import UserCache
+from src.app.auth.revocation import revocation_store
 
 SECRET_KEY = settings.SECRET
 ALGORITHM = 'HS256'
 
+# Кэш токенов, для которых уже подтверждена роль admin
+admin_cache = UserCache(
+    ttl=settings.ADMIN_CACHE_TTL,
+    max_size=settings.ADMIN_CACHE_MAX_SIZE
+)
+
 
 class AdminAuth(AuthenticationBackend):
     async def login(self, request: Request) -> bool:
@@ -33,6 +41,8 @@ class AdminAuth(AuthenticationBackend):
             raise HTTPException(status_code=403, detail="Not authorized")
 
         token = raw_token.replace('Bearer ', '')
+        if admin_cache.get(token) is not None:
+            return True
 
         try:
             payload = jwt.decode(
@@ -42,7 +52,7 @@ class AdminAuth(AuthenticationBackend):
                 audience='fastapi-users:auth'
             )
             user_id = payload.get("sub")
-            if not user_id:
+            if not user_id or revocation_store.is_revoked(payload):
                 raise HTTPException(status_code=403, detail="Invalid token")
         except JWTError:
             raise HTTPException(status_code=403, detail="Invalid token")
@@ -56,6 +66,7 @@ class AdminAuth(AuthenticationBackend):
             if not user or user.role != "admin":
                 raise HTTPException(status_code=403, detail="Forbidden")
 
+        admin_cache.set(token, user)
         return True
 
 
@@ -0,0 +1,41 @@
+from sqlalchemy import Select, or_
+from sqlalchemy.orm import InstrumentedAttribute
+from starlette.requests import Request
+
+from src.app.services.text_search import TextSearch
+
+
+class TrigramSearchMixin:
+    """
+    Поиск по column_searchable_list через триграммные индексы:
+    pg_trgm в Postgres, индекс в памяти процесса в SQLite.
+    Диалект выбирается один раз при создании представления,
+    запросы не меняют его состояние
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        bind = self.session_maker.kw['bind']
+        self.text_search = TextSearch(bind.dialect.name)
+
+    def search_columns(self) -> tuple[InstrumentedAttribute, ...]:
+        return tuple(
+            getattr(self.model, column) if isinstance(column, str) else column
+            for column in self.column_searchable_list
+        )
+
+    async def refresh_search(self) -> None:
+        """Актуализация индексов в памяти перед поиском"""
+        async with self.session_maker(expire_on_commit=False) as session:
+            await self.text_search.refresh(session, self.search_columns())
+
+    async def list(self, request: Request):
+        if request.query_params.get('search'):
+            await self.refresh_search()
+        return await super().list(request)
+
+    def search_query(self, stmt: Select, term: str) -> Select:
+        return stmt.where(or_(*(
+            self.text_search.contains(column, term)
+            for column in self.search_columns()
+        )))
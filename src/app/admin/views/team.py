@@ -1,9 +1,10 @@
 from sqladmin import ModelView
 
 from src.app.models.team import Team
+from src.app.admin.views.search import TrigramSearchMixin
 
 
-class TeamAdmin(ModelView, model=Team):
+class TeamAdmin(TrigramSearchMixin, ModelView, model=Team):
     name = 'Team'
     name_plural = 'Teams'
     icon = 'fa-solid fa-users'
@@ -14,7 +15,7 @@ class TeamAdmin(ModelView, model=Team):
         Team.code
     ]
 
-    column_searchable_list = [Team.name]
+    column_searchable_list = [Team.name, Team.code]
     column_sortable_list = [Team.id, Team.name]
 
     form_columns = [
@@ -1,11 +1,12 @@
 from sqladmin import ModelView
 from wtforms import PasswordField
-from passlib.hash import bcrypt
 
 from src.app.models.user import User
+from src.app.admin.views.search import TrigramSearchMixin
+from src.app.auth.password_pool import password_pool
 
 
-class UserAdmin(ModelView, model=User):
+class UserAdmin(TrigramSearchMixin, ModelView, model=User):
     name = 'User'
     name_plural = 'Users'
     icon = 'fa-solid fa-user'
@@ -40,5 +41,5 @@ class UserAdmin(ModelView, model=User):
     async def on_model_change(self, data, model, is_created, request):
         password = data.pop('password', None)
         if password:
-            model.hashed_password = bcrypt.hash(password)
+            model.hashed_password = await password_pool.hash(password)
         return await super().on_model_change(data, model, is_created, request)
@@ -1,11 +1,11 @@
 from fastapi_users import FastAPIUsers
 from fastapi_users.authentication import (
     AuthenticationBackend,
-    BearerTransport,
-    JWTStrategy
+    BearerTransport
 )
 
 from src.app.auth.user_manager import get_user_manager, SECRET
+from src.app.auth.revocation import RevocableJWTStrategy
 from src.app.models.user import User
 
 access_transport = BearerTransport(tokenUrl='auth/jwt/login')
@@ -13,14 +13,22 @@ access_transport = BearerTransport(tokenUrl='auth/jwt/login')
 refresh_transport = BearerTransport(tokenUrl='auth/jwt/refresh')
 
 
-def get_access_jwt_strategy() -> JWTStrategy:
-    return JWTStrategy(secret=SECRET, lifetime_seconds=3600)
-    # 1 час
+ACCESS_TOKEN_LIFETIME = 3600  # 1 час
+REFRESH_TOKEN_LIFETIME = 2592000  # 30 дней
 
 
-def get_refresh_jwt_strategy() -> JWTStrategy:
-    return JWTStrategy(secret=SECRET + '_REFRESH', lifetime_seconds=2592000)
-    # 30 дней
+def get_access_jwt_strategy() -> RevocableJWTStrategy:
+    return RevocableJWTStrategy(
+        secret=SECRET,
+        lifetime_seconds=ACCESS_TOKEN_LIFETIME
+    )
+
+
+def get_refresh_jwt_strategy() -> RevocableJWTStrategy:
+    return RevocableJWTStrategy(
+        secret=SECRET + '_REFRESH',
+        lifetime_seconds=REFRESH_TOKEN_LIFETIME
+    )
 
 
 access_backend = AuthenticationBackend(
@@ -3,9 +3,12 @@ from typing import Optional
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.security.utils import get_authorization_scheme_param
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.app.database import get_db
 from src.app.auth.auth import access_backend
 from src.app.auth.user_manager import get_user_manager, UserManager
+from src.app.auth.user_cache import user_cache
 from src.app.models.user import User
 
 
@@ -29,8 +32,13 @@ security = OptionalHTTPBearer()
 
 async def get_current_user(
     request: Request,
+    db: AsyncSession = Depends(get_db),
     user_manager: UserManager = Depends(get_user_manager)
 ) -> Optional[User]:
+    """
+    Получение текущего пользователя.
+    Пользователь привязывается к сессии запроса, общей с обработчиком
+    """
     auth_header = request.headers.get('Authorization')
     token = None
     if auth_header and auth_header.lower().startswith('bearer '):
@@ -45,15 +53,22 @@ async def get_current_user(
     if not token:
         return None
 
+    user = user_cache.get(token)
+    if user is not None:
+        return await db.merge(user, load=False)
+
     try:
         user = await (
             access_backend.get_strategy()
             .read_token(token, user_manager)
         )
-        return user
     except Exception:
         return None
 
+    if user is not None:
+        user_cache.set(token, user)
+    return user
+
 
 def require_role(*roles: str):
     '''Проверка роли пользователя'''
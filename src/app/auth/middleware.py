@@ -0,0 +1,136 @@
+from fastapi_users.db import SQLAlchemyUserDatabase
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.app.config import settings
+from src.app.database import async_session
+from src.app.models.user import User
+from src.app.auth.auth import access_backend, refresh_backend
+from src.app.auth.user_cache import UserCache, user_cache
+from src.app.auth.revocation import revocation_store
+from src.app.auth.user_manager import UserManager
+
+# Кэш проверенных refresh токенов, отдельный от кэша access токенов
+refresh_cache = UserCache(
+    ttl=settings.USER_CACHE_TTL,
+    max_size=settings.USER_CACHE_MAX_SIZE
+)
+
+
+def _strip_bearer(value: str | None) -> str | None:
+    if not value:
+        return None
+    return value.removeprefix('Bearer ').strip() or None
+
+
+def _is_access_token_valid(token: str) -> bool:
+    """Проверка подписи, срока действия и отзыва без запроса к БД"""
+    payload = access_backend.get_strategy().decode_token(token)
+    return payload is not None and not revocation_store.is_revoked(payload)
+
+
+async def _read_refresh_user(token: str) -> User | None:
+    """Получение пользователя по refresh токену"""
+    user = refresh_cache.get(token)
+    if user is not None:
+        return user
+
+    async with async_session() as session:
+        user_manager = UserManager(SQLAlchemyUserDatabase(session, User))
+        user = await (
+            refresh_backend.get_strategy()
+            .read_token(token, user_manager)
+        )
+
+    if user is not None:
+        refresh_cache.set(token, user)
+    return user
+
+
+def _cookie_name(set_cookie: str) -> str:
+    return set_cookie.split('=', 1)[0].strip()
+
+
+def _replace_access_cookie(scope: Scope, access_token: str) -> None:
+    """Подмена access токена в заголовке Cookie входящего запроса"""
+    headers = []
+    cookie_parts = []
+    for name, value in scope['headers']:
+        if name == b'cookie':
+            cookie_parts.extend(
+                part.strip() for part in value.decode('latin-1').split(';')
+                if part.strip()
+                and part.split('=', 1)[0].strip() != 'access_token'
+            )
+        else:
+            headers.append((name, value))
+
+    cookie_parts.append(f'access_token="Bearer {access_token}"')
+    headers.append((b'cookie', '; '.join(cookie_parts).encode('latin-1')))
+    scope['headers'] = headers
+
+
+class TokenRefreshMiddleware:
+    """
+    Выпуск нового access токена по refresh токену в рамках того же запроса.
+    Новый токен подставляется в запрос и устанавливается в cookie ответа,
+    если обработчик сам не устанавливает и не удаляет эту cookie
+    (например, при выходе из аккаунта)
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        connection = HTTPConnection(scope)
+        access_token = _strip_bearer(connection.cookies.get('access_token'))
+        refresh_token = _strip_bearer(connection.cookies.get('refresh_token'))
+
+        if (
+            not refresh_token
+            or 'authorization' in connection.headers
+            or (access_token and _is_access_token_valid(access_token))
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        cookies = Response()
+        user = await _read_refresh_user(refresh_token)
+        if user is None:
+            cookies.delete_cookie('refresh_token')
+        else:
+            new_access_token = (
+                await access_backend.get_strategy().write_token(user)
+            )
+            user_cache.set(new_access_token, user)
+            _replace_access_cookie(scope, new_access_token)
+            cookies.set_cookie(
+                'access_token',
+                f'Bearer {new_access_token}',
+                httponly=True
+            )
+
+        set_cookie_headers = [
+            value.decode('latin-1') for name, value in cookies.raw_headers
+            if name == b'set-cookie'
+        ]
+
+        async def send_with_cookies(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                headers = MutableHeaders(scope=message)
+                handled = {
+                    _cookie_name(value)
+                    for value in headers.getlist('set-cookie')
+                }
+                for value in set_cookie_headers:
+                    if _cookie_name(value) not in handled:
+                        headers.append('set-cookie', value)
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookies)
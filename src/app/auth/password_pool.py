@@ -0,0 +1,154 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+from fastapi import HTTPException, status
+from fastapi_users.password import PasswordHelper
+
+from src.app.config import settings
+
+password_helper = PasswordHelper()
+
+
+def _hash(password: str) -> str:
+    return password_helper.hash(password)
+
+
+def _verify_and_update(
+        plain_password: str,
+        hashed_password: str
+) -> tuple[bool, str | None]:
+    return password_helper.verify_and_update(plain_password, hashed_password)
+
+
+class PasswordWorkerPool:
+    """
+    Пул для хеширования и проверки паролей вне event loop.
+    executor: thread, process или inline (выполнение в event loop)
+    """
+
+    def __init__(self, executor: str, workers: int, max_queue: int):
+        if executor not in ('thread', 'process', 'inline'):
+            raise ValueError(f'Неизвестный тип пула: {executor}')
+
+        self.executor_type = executor
+        self.workers = workers
+        self.max_queue = max_queue
+
+        self._executor: Executor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+
+        self.queued = 0
+        self.in_flight = 0
+        self.max_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait = 0.0
+        self.total_run = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix='password'
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.workers)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Выполнить функцию в пуле с ограничением очереди"""
+        if self.executor_type == 'inline':
+            return func(*args)
+
+        if self.queued >= self.max_queue:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail='Сервер перегружен, попробуйте позже'
+            )
+
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        queued_at = time.perf_counter()
+        waiting = True
+        try:
+            async with self._get_semaphore():
+                started_at = time.perf_counter()
+                self.queued -= 1
+                waiting = False
+                self.total_wait += started_at - queued_at
+                self.in_flight += 1
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(
+                        self._get_executor(),
+                        func,
+                        *args
+                    )
+                finally:
+                    self.in_flight -= 1
+                    self.completed += 1
+                    self.total_run += time.perf_counter() - started_at
+        finally:
+            if waiting:
+                self.queued -= 1
+
+    async def hash(self, password: str) -> str:
+        """Хеширование пароля"""
+        return await self.run(_hash, password)
+
+    async def verify_and_update(
+            self,
+            plain_password: str,
+            hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """Проверка пароля и обновление хеша при необходимости"""
+        return await self.run(
+            _verify_and_update,
+            plain_password,
+            hashed_password
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Метрики очереди пула"""
+        return {
+            'executor': self.executor_type,
+            'workers': self.workers,
+            'max_queue': self.max_queue,
+            'queued': self.queued,
+            'in_flight': self.in_flight,
+            'max_queued': self.max_queued,
+            'completed': self.completed,
+            'rejected': self.rejected,
+            'avg_wait_ms': (
+                self.total_wait / self.completed * 1000
+                if self.completed else 0.0
+            ),
+            'avg_run_ms': (
+                self.total_run / self.completed * 1000
+                if self.completed else 0.0
+            ),
+        }
+
+    def shutdown(self) -> None:
+        """Остановить пул"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_pool = PasswordWorkerPool(
+    executor=settings.PASSWORD_HASHER_EXECUTOR,
+    workers=settings.PASSWORD_HASHER_WORKERS,
+    max_queue=settings.PASSWORD_HASHER_MAX_QUEUE
+)
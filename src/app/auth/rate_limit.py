@@ -0,0 +1,151 @@
+import importlib
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from src.app.config import settings
+
+
+class RateLimitStorage(ABC):
+    """
+    Базовое хранилище состояния бакетов.
+    Для нескольких процессов подключается общее хранилище
+    через настройку RATE_LIMIT_STORAGE ('module:attribute')
+    """
+
+    @abstractmethod
+    async def take(
+            self,
+            key: str,
+            capacity: int,
+            refill_rate: float
+    ) -> float:
+        """
+        Забрать один токен из бакета.
+        Возвращает 0, если запрос разрешен, иначе время ожидания в секундах
+        """
+
+    @abstractmethod
+    async def reset(self) -> None:
+        """Сбросить состояние всех бакетов"""
+
+
+class MemoryRateLimitStorage(RateLimitStorage):
+    """Хранилище бакетов в памяти процесса с ограничением числа ключей"""
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(
+            self,
+            key: str,
+            capacity: int,
+            refill_rate: float
+    ) -> float:
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+
+        if tokens >= 1:
+            retry_after = 0.0
+            tokens -= 1
+        else:
+            retry_after = (1 - tokens) / refill_rate
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+        return retry_after
+
+    async def reset(self) -> None:
+        self._buckets.clear()
+
+
+class TokenBucketLimiter:
+    """Ограничитель частоты запросов по алгоритму token bucket"""
+
+    def __init__(
+            self,
+            name: str,
+            per_minute: int,
+            storage: RateLimitStorage
+    ):
+        self.name = name
+        self.capacity = per_minute
+        self.refill_rate = per_minute / 60
+        self.storage = storage
+        self.allowed = 0
+        self.throttled = 0
+
+    async def hit(self, key: str) -> int:
+        """
+        Учесть запрос для ключа.
+        Возвращает 0, если запрос разрешен, иначе секунды до повтора
+        """
+        if self.capacity <= 0:
+            return 0
+
+        retry_after = await self.storage.take(
+            f'{self.name}:{key}',
+            self.capacity,
+            self.refill_rate
+        )
+        if retry_after:
+            self.throttled += 1
+            return max(math.ceil(retry_after), 1)
+
+        self.allowed += 1
+        return 0
+
+    def stats(self) -> dict[str, int]:
+        """Счетчики разрешенных и отклоненных запросов"""
+        return {
+            'per_minute': self.capacity,
+            'allowed': self.allowed,
+            'throttled': self.throttled,
+        }
+
+
+def load_storage(path: str | None) -> RateLimitStorage:
+    """Загрузка хранилища по пути 'module:attribute'"""
+    if not path:
+        return MemoryRateLimitStorage()
+
+    module_name, _, attribute = path.partition(':')
+    storage = getattr(importlib.import_module(module_name), attribute)
+    return storage() if isinstance(storage, type) else storage
+
+
+rate_limit_storage = load_storage(settings.RATE_LIMIT_STORAGE)
+
+login_ip_limiter = TokenBucketLimiter(
+    'login_ip',
+    settings.LOGIN_RATE_PER_MINUTE_IP,
+    rate_limit_storage
+)
+login_email_limiter = TokenBucketLimiter(
+    'login_email',
+    settings.LOGIN_RATE_PER_MINUTE_EMAIL,
+    rate_limit_storage
+)
+register_ip_limiter = TokenBucketLimiter(
+    'register_ip',
+    settings.REGISTER_RATE_PER_MINUTE_IP,
+    rate_limit_storage
+)
+
+
+def rate_limit_stats() -> dict[str, dict[str, int]]:
+    """Счетчики всех ограничителей"""
+    return {
+        limiter.name: limiter.stats()
+        for limiter in (
+            login_ip_limiter,
+            login_email_limiter,
+            register_ip_limiter
+        )
+    }
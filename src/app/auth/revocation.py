@@ -0,0 +1,221 @@
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime, timedelta, UTC
+from typing import Any, Optional
+
+import jwt
+from fastapi_users import exceptions, models
+from fastapi_users.authentication import JWTStrategy
+from fastapi_users.jwt import decode_jwt, generate_jwt
+from fastapi_users.manager import BaseUserManager
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.app.models.revoked_token import RevokedToken
+from src.app.auth.user_cache import invalidate_user
+
+logger = logging.getLogger(__name__)
+
+# Запас по времени при синхронизации, чтобы не пропустить записи
+# из транзакций, зафиксированных позже соседних
+SYNC_OVERLAP = timedelta(seconds=60)
+
+
+def _timestamp(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.timestamp()
+
+
+class RevocationStore:
+    """
+    Хранилище отозванных токенов в памяти процесса.
+    Проверка отзыва выполняется за O(1) без обращения к БД,
+    таблица revoked_tokens используется для синхронизации процессов
+    """
+
+    def __init__(self):
+        self._jtis: dict[str, float] = {}
+        self._user_cutoffs: dict[int, tuple[float, float]] = {}
+        self._synced_at: datetime | None = None
+
+    def is_revoked(self, payload: dict[str, Any]) -> bool:
+        """Проверка отзыва токена по его payload"""
+        jti = payload.get('jti')
+        if jti is not None and jti in self._jtis:
+            return True
+
+        try:
+            user_id = int(payload.get('sub'))
+        except (TypeError, ValueError):
+            return False
+
+        cutoff = self._user_cutoffs.get(user_id)
+        if cutoff is None:
+            return False
+        return payload.get('iat', 0) < cutoff[0]
+
+    def _remember(self, row: RevokedToken) -> None:
+        expires_at = _timestamp(row.expires_at)
+        if row.jti is not None:
+            if row.jti in self._jtis:
+                return
+            self._jtis[row.jti] = expires_at
+        else:
+            revoked_at = _timestamp(row.revoked_at)
+            current = self._user_cutoffs.get(row.user_id)
+            if current is not None and current[0] >= revoked_at:
+                return
+            self._user_cutoffs[row.user_id] = (revoked_at, expires_at)
+
+        invalidate_user(row.user_id)
+
+    async def revoke_token(
+            self,
+            db: AsyncSession,
+            payload: dict[str, Any]
+    ) -> None:
+        """Отозвать один токен по jti"""
+        jti = payload.get('jti')
+        if jti is None or jti in self._jtis:
+            return
+
+        row = RevokedToken(
+            jti=jti,
+            user_id=int(payload['sub']),
+            expires_at=datetime.fromtimestamp(payload['exp'], UTC)
+        )
+        db.add(row)
+        await db.flush()
+        self._remember(row)
+
+    async def revoke_user(
+            self,
+            db: AsyncSession,
+            user_id: int,
+            lifetime_seconds: int
+    ) -> None:
+        """Отозвать все выпущенные ранее токены пользователя"""
+        now = datetime.now(UTC)
+        row = RevokedToken(
+            user_id=user_id,
+            revoked_at=now,
+            expires_at=now + timedelta(seconds=lifetime_seconds)
+        )
+        db.add(row)
+        await db.flush()
+        self._remember(row)
+
+    async def sync(self, db: AsyncSession) -> None:
+        """Загрузка записей, добавленных другими процессами"""
+        now = datetime.now(UTC)
+        stmt = select(RevokedToken).where(RevokedToken.expires_at > now)
+        if self._synced_at is not None:
+            stmt = stmt.where(
+                RevokedToken.revoked_at >= self._synced_at - SYNC_OVERLAP
+            )
+
+        result = await db.execute(stmt)
+        for row in result.scalars():
+            self._remember(row)
+        self._synced_at = now
+
+        self._purge_memory(now.timestamp())
+
+    async def purge(self, db: AsyncSession) -> None:
+        """Удаление истекших записей из таблицы"""
+        await db.execute(
+            delete(RevokedToken)
+            .where(RevokedToken.expires_at <= datetime.now(UTC))
+        )
+        await db.commit()
+
+    def _purge_memory(self, now: float) -> None:
+        self._jtis = {
+            jti: expires_at for jti, expires_at in self._jtis.items()
+            if expires_at > now
+        }
+        self._user_cutoffs = {
+            user_id: cutoff for user_id, cutoff in self._user_cutoffs.items()
+            if cutoff[1] > now
+        }
+
+    def clear(self) -> None:
+        """Очистить состояние в памяти"""
+        self._jtis.clear()
+        self._user_cutoffs.clear()
+        self._synced_at = None
+
+    async def run(
+            self,
+            session_factory: async_sessionmaker,
+            interval: float
+    ) -> None:
+        """Периодическая синхронизация с таблицей revoked_tokens"""
+        purge_every = max(int(3600 / interval), 1)
+        iteration = 0
+        while True:
+            try:
+                async with session_factory() as session:
+                    await self.sync(session)
+                    if iteration % purge_every == 0:
+                        await self.purge(session)
+            except Exception:
+                logger.exception('Ошибка синхронизации отозванных токенов')
+            iteration += 1
+            await asyncio.sleep(interval)
+
+
+revocation_store = RevocationStore()
+
+
+class RevocableJWTStrategy(JWTStrategy):
+    """JWT стратегия с идентификатором токена (jti) и проверкой отзыва"""
+
+    def decode_token(self, token: Optional[str]) -> dict[str, Any] | None:
+        """Проверка подписи и срока действия, payload или None"""
+        if token is None:
+            return None
+        try:
+            return decode_jwt(
+                token,
+                self.decode_key,
+                self.token_audience,
+                algorithms=[self.algorithm]
+            )
+        except jwt.PyJWTError:
+            return None
+
+    async def read_token(
+        self,
+        token: Optional[str],
+        user_manager: BaseUserManager[models.UP, models.ID]
+    ) -> Optional[models.UP]:
+        data = self.decode_token(token)
+        if data is None or data.get('sub') is None:
+            return None
+
+        if revocation_store.is_revoked(data):
+            return None
+
+        try:
+            parsed_id = user_manager.parse_id(data['sub'])
+            return await user_manager.get(parsed_id)
+        except (exceptions.UserNotExists, exceptions.InvalidID):
+            return None
+
+    async def write_token(self, user: models.UP) -> str:
+        data = {
+            'sub': str(user.id),
+            'aud': self.token_audience,
+            'jti': uuid.uuid4().hex,
+            'iat': time.time(),
+        }
+        return generate_jwt(
+            data,
+            self.encode_key,
+            self.lifetime_seconds,
+            algorithm=self.algorithm
+        )
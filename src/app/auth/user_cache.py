@@ -0,0 +1,156 @@
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Any
+
+import jwt
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from src.app.config import settings
+from src.app.models.team import Team
+from src.app.models.user import User
+
+
+def _token_lifetime(token: str) -> float | None:
+    """Оставшееся время жизни уже проверенного токена в секундах"""
+    try:
+        payload = jwt.decode(token, options={'verify_signature': False})
+    except jwt.PyJWTError:
+        return None
+    exp = payload.get('exp')
+    if exp is None:
+        return None
+    return exp - time.time()
+
+
+def _snapshot(user: User) -> dict[str, Any]:
+    """Снимок значений колонок пользователя"""
+    return {
+        attr.key: getattr(user, attr.key)
+        for attr in inspect(User).column_attrs
+    }
+
+
+def _restore(snapshot: dict[str, Any]) -> User:
+    """Восстановление отсоединенного объекта пользователя из снимка"""
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return user
+
+
+_caches: list['UserCache'] = []
+
+
+class UserCache:
+    """
+    LRU-кэш проверенных токенов и снимков пользователей.
+    Запись живет не дольше ttl секунд и не дольше самого токена
+    """
+
+    def __init__(self, ttl: int, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._tokens_by_user: dict[int, set[str]] = {}
+        _caches.append(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, token: str) -> User | None:
+        """Получить пользователя по токену"""
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+
+        expires_at, snapshot = entry
+        if expires_at <= time.monotonic():
+            self._discard(token)
+            return None
+
+        self._entries.move_to_end(token)
+        return _restore(snapshot)
+
+    def set(self, token: str, user: User) -> None:
+        """Сохранить пользователя для проверенного токена"""
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+
+        ttl = self.ttl
+        token_lifetime = _token_lifetime(token)
+        if token_lifetime is not None:
+            ttl = min(ttl, token_lifetime)
+        if ttl <= 0:
+            return
+
+        self._discard(token)
+        self._entries[token] = (time.monotonic() + ttl, _snapshot(user))
+        self._tokens_by_user.setdefault(user.id, set()).add(token)
+
+        while len(self._entries) > self.max_size:
+            oldest_token = next(iter(self._entries))
+            self._discard(oldest_token)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Удалить все записи пользователя"""
+        for token in self._tokens_by_user.pop(user_id, set()):
+            self._entries.pop(token, None)
+
+    def clear(self) -> None:
+        """Очистить кэш"""
+        self._entries.clear()
+        self._tokens_by_user.clear()
+
+    def _discard(self, token: str) -> None:
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+
+        user_id = entry[1]['id']
+        tokens = self._tokens_by_user.get(user_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[user_id]
+
+
+user_cache = UserCache(
+    ttl=settings.USER_CACHE_TTL,
+    max_size=settings.USER_CACHE_MAX_SIZE
+)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Удалить записи пользователя из всех кэшей"""
+    for cache in _caches:
+        cache.invalidate_user(user_id)
+
+
+def clear_all() -> None:
+    """Очистить все кэши"""
+    for cache in _caches:
+        cache.clear()
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_flushed_users(session: Session, flush_context) -> None:
+    """Сброс кэша при изменении или удалении пользователей и команд"""
+    for obj in chain(session.dirty, session.deleted):
+        if isinstance(obj, User) and obj.id is not None:
+            invalidate_user(obj.id)
+        elif isinstance(obj, Team) and obj in session.deleted:
+            clear_all()
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _invalidate_bulk_changes(orm_execute_state) -> None:
+    """Сброс кэша при массовых UPDATE и DELETE пользователей"""
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in (User, Team):
+        clear_all()
@@ -2,11 +2,14 @@ import os
 from typing import Any, Dict
 
 from dotenv import load_dotenv
-from fastapi_users import BaseUserManager, schemas, models
+from fastapi_users import BaseUserManager, schemas, models, exceptions
 from fastapi_users.db import SQLAlchemyUserDatabase
 from fastapi import Depends, Request, HTTPException, status
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.app.database import async_session
+from src.app.database import get_db
+from src.app.auth.password_pool import password_pool
 from src.app.models.user import User
 
 load_dotenv()
@@ -40,7 +43,7 @@ class UserManager(BaseUserManager[User, int]):
 
         user_dict = {
             "email": user_create.email,
-            "hashed_password": self.password_helper.hash(user_create.password),
+            "hashed_password": await self.hash_password(user_create.password),
             "is_active": True,
             "is_superuser": False,
         }
@@ -80,9 +83,8 @@ class UserManager(BaseUserManager[User, int]):
             user_update,
             'password'
         ) and user_update.password is not None:
-            update_dict["hashed_password"] = (
-                self.password_helper
-                .hash(user_update.password)
+            update_dict["hashed_password"] = await self.hash_password(
+                user_update.password
             )
 
         if hasattr(
@@ -123,6 +125,41 @@ class UserManager(BaseUserManager[User, int]):
 
         return user
 
+    async def authenticate(
+        self,
+        credentials: OAuth2PasswordRequestForm
+    ) -> models.UP | None:
+        """
+        Переопределение метода authenticate,
+        проверка пароля выполняется в пуле вне event loop
+        """
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            await self.hash_password(credentials.password)
+            return None
+
+        verified, updated_password_hash = (
+            await password_pool.verify_and_update(
+                credentials.password,
+                user.hashed_password
+            )
+        )
+        if not verified:
+            return None
+
+        if updated_password_hash is not None:
+            await self.user_db.update(
+                user,
+                {"hashed_password": updated_password_hash}
+            )
+
+        return user
+
+    async def hash_password(self, password: str) -> str:
+        """Хеширование пароля в пуле вне event loop"""
+        return await password_pool.hash(password)
+
     def parse_id(self, id: str) -> int:
         return int(id)
 
@@ -149,9 +186,9 @@ class UserManager(BaseUserManager[User, int]):
         print(f'Пользователь {user.id} зарегистрирован.')
 
 
-async def get_user_db():
-    async with async_session() as session:
-        yield SQLAlchemyUserDatabase(session, User)
+async def get_user_db(session: AsyncSession = Depends(get_db)):
+    """Адаптер fastapi-users поверх сессии текущего запроса"""
+    yield SQLAlchemyUserDatabase(session, User)
 
 
 async def get_user_manager(user_db=Depends(get_user_db)):
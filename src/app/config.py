@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,8 +13,46 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = 'localhost'
     POSTGRES_PORT: int = 5432
 
+    REPLICA_DATABASE_URL: str | None = None
+    READ_YOUR_WRITES_SECONDS: int = 10
+
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE: int = 1800
+
+    SERVER_TIMING_HEADER: bool = True
+    SLOW_QUERY_MS: float | None = None
+
+    TASKS_PAGE_COUNT: Literal['exact', 'estimate', 'none'] = 'estimate'
+    MEETINGS_PAGE_COUNT: Literal['exact', 'estimate', 'none'] = 'estimate'
+    UPCOMING_MEETINGS_DAYS: int = 14
+    CALENDAR_FEED_CACHE_MAX_SIZE: int = 10000
+    COUNT_CACHE_TTL: int = 30
+    COUNT_CACHE_MAX_SIZE: int = 10000
+
+    EXPORT_BATCH_SIZE: int = 1000
+    TASK_IMPORT_BATCH_SIZE: int = 5000
+
     SECRET: str
 
+    USER_CACHE_TTL: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+    ADMIN_CACHE_TTL: int = 300
+    ADMIN_CACHE_MAX_SIZE: int = 1000
+
+    REVOCATION_SYNC_INTERVAL: float = 5.0
+
+    PASSWORD_HASHER_EXECUTOR: str = 'thread'
+    PASSWORD_HASHER_WORKERS: int = 4
+    PASSWORD_HASHER_MAX_QUEUE: int = 100
+
+    LOGIN_RATE_PER_MINUTE_IP: int = 30
+    LOGIN_RATE_PER_MINUTE_EMAIL: int = 5
+    REGISTER_RATE_PER_MINUTE_IP: int = 5
+    RATE_LIMIT_STORAGE: str | None = None
+
     model_config = SettingsConfigDict(
         env_file='.env',
         env_file_encoding='utf-8'
@@ -1,27 +1,137 @@
+import time
 from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     create_async_engine,
     async_sessionmaker
 )
 from sqlalchemy.orm import declarative_base
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
 from .config import settings
+from .metrics import TimedAsyncAdaptedQueuePool, instrument_engine
+from .instrumentation import track_queries
+
+# Запросы с этими методами читают из реплики
+READ_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+# Cookie с временем, до которого чтение идет из основной БД
+PRIMARY_PIN_COOKIE = 'db_primary_until'
+
+
+def create_engine(url: str) -> AsyncEngine:
+    """Создание движка с настройками пула и учетом SQL запросов"""
+    engine = create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        future=True,
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_recycle=settings.DB_POOL_RECYCLE
+    )
+    track_queries(engine)
+    return engine
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True
-)
+
+engine = create_engine(settings.DATABASE_URL)
+pool_metrics = instrument_engine(engine)
 
 async_session = async_sessionmaker(
     bind=engine,
     expire_on_commit=False
 )
 
+if settings.REPLICA_DATABASE_URL:
+    replica_engine = create_engine(settings.REPLICA_DATABASE_URL)
+    replica_pool_metrics = instrument_engine(replica_engine)
+    replica_session = async_sessionmaker(
+        bind=replica_engine,
+        expire_on_commit=False
+    )
+else:
+    replica_engine = engine
+    replica_pool_metrics = None
+    replica_session = async_session
+
 Base = declarative_base()
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session() as session:
+def replica_enabled() -> bool:
+    return replica_session is not async_session
+
+
+def reads_from_replica(request: Request) -> bool:
+    """
+    Чтение из реплики для безопасных методов, если клиент
+    недавно не выполнял запись (read-your-writes)
+    """
+    if request.method not in READ_METHODS:
+        return False
+
+    try:
+        pinned_until = float(request.cookies.get(PRIMARY_PIN_COOKIE, 0))
+    except ValueError:
+        pinned_until = 0
+    return pinned_until <= time.time()
+
+
+def get_session_factory(request: Request) -> async_sessionmaker:
+    """
+    Фабрика сессий для кода, который открывает сессию сам
+    (например, потоковые ответы, работающие после выхода из зависимостей)
+    """
+    return replica_session if reads_from_replica(request) else async_session
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with get_session_factory(request)() as session:
         yield session
+
+
+class ReadYourWritesMiddleware:
+    """
+    После успешного изменяющего запроса закрепляет клиента
+    за основной БД на READ_YOUR_WRITES_SECONDS секунд,
+    чтобы следующие чтения не зависели от отставания реплики
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope['type'] != 'http'
+            or scope['method'] in READ_METHODS
+            or not replica_enabled()
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message: Message) -> None:
+            if (
+                message['type'] == 'http.response.start'
+                and message['status'] < 400
+            ):
+                lifetime = settings.READ_YOUR_WRITES_SECONDS
+                cookie = Response()
+                cookie.set_cookie(
+                    PRIMARY_PIN_COOKIE,
+                    str(time.time() + lifetime),
+                    max_age=lifetime,
+                    httponly=True
+                )
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    'set-cookie',
+                    cookie.headers['set-cookie']
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
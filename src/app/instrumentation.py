@@ -0,0 +1,150 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.app.config import settings
+
+logger = logging.getLogger(__name__)
+slow_query_logger = logging.getLogger(f'{__name__}.slow')
+
+# Максимальная длина параметров запроса в журнале медленных запросов
+MAX_PARAMS_LENGTH = 1000
+
+
+class QueryStats:
+    """Статистика SQL запросов в рамках одного HTTP запроса"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement: str | None = None
+
+    def record(self, statement: str, duration_ms: float) -> None:
+        self.count += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.slowest_ms:
+            self.slowest_ms = duration_ms
+            self.slowest_statement = statement
+
+    def server_timing(self, app_ms: float) -> str:
+        """Значение заголовка Server-Timing"""
+        return (
+            f'db;dur={self.total_ms:.1f};desc="{self.count} queries", '
+            f'app;dur={app_ms:.1f}'
+        )
+
+
+_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    'query_stats',
+    default=None
+)
+
+
+def current_query_stats() -> QueryStats | None:
+    """Статистика текущего HTTP запроса"""
+    return _query_stats.get()
+
+
+def _before_cursor_execute(
+        conn,
+        cursor,
+        statement,
+        parameters,
+        context,
+        executemany
+):
+    conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+        conn,
+        cursor,
+        statement,
+        parameters,
+        context,
+        executemany
+):
+    start = conn.info['query_start_time'].pop()
+    duration_ms = (time.perf_counter() - start) * 1000
+
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.record(statement, duration_ms)
+
+    slow_query_ms = settings.SLOW_QUERY_MS
+    if slow_query_ms is not None and duration_ms >= slow_query_ms:
+        slow_query_logger.warning(
+            'Медленный запрос %.1f мс: %s; параметры: %s',
+            duration_ms,
+            statement,
+            repr(parameters)[:MAX_PARAMS_LENGTH]
+        )
+
+
+def track_queries(engine: AsyncEngine) -> None:
+    """Подключение учета SQL запросов к движку"""
+    sync_engine = engine.sync_engine
+    if event.contains(
+        sync_engine,
+        'before_cursor_execute',
+        _before_cursor_execute
+    ):
+        return
+    event.listen(sync_engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(sync_engine, 'after_cursor_execute', _after_cursor_execute)
+
+
+class QueryTimingMiddleware:
+    """
+    Сбор статистики SQL запросов для каждого HTTP запроса.
+    Итоги отдаются в заголовке Server-Timing и пишутся в журнал
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _query_stats.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+                if settings.SERVER_TIMING_HEADER:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        'server-timing',
+                        stats.server_timing(
+                            (time.perf_counter() - start) * 1000
+                        )
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _query_stats.reset(token)
+            logger.info(json.dumps({
+                'method': scope['method'],
+                'path': scope['path'],
+                'status': status_code,
+                'duration_ms': round((time.perf_counter() - start) * 1000, 1),
+                'db_queries': stats.count,
+                'db_ms': round(stats.total_ms, 1),
+                'db_slowest_ms': round(stats.slowest_ms, 1),
+                'db_slowest': stats.slowest_statement,
+            }, ensure_ascii=False))
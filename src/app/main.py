@@ -1,8 +1,11 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Depends
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 
 from .config import settings
-from .database import engine
+from .database import engine, async_session, ReadYourWritesMiddleware
 from src.app.admin.admin_config import setup_admin
 from src.app.routers import (
     users,
@@ -11,10 +14,28 @@ from src.app.routers import (
     teams,
     evaluations,
     meetings,
+    metrics,
     index
 )
 from src.app.models import User
 from src.app.auth.dependencies import require_role
+from src.app.auth.password_pool import password_pool
+from src.app.auth.middleware import TokenRefreshMiddleware
+from src.app.auth.revocation import revocation_store
+from src.app.instrumentation import QueryTimingMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    revocation_sync = asyncio.create_task(
+        revocation_store.run(
+            async_session,
+            settings.REVOCATION_SYNC_INTERVAL
+        )
+    )
+    yield
+    revocation_sync.cancel()
+    password_pool.shutdown()
 
 
 def create_application() -> FastAPI:
@@ -23,14 +44,20 @@ def create_application() -> FastAPI:
         debug=settings.DEBUG,
         docs_url=None,
         redoc_url=None,
+        lifespan=lifespan,
     )
 
+    app.add_middleware(TokenRefreshMiddleware)
+    app.add_middleware(ReadYourWritesMiddleware)
+    app.add_middleware(QueryTimingMiddleware)
+
     app.include_router(users.router)
     app.include_router(auth.router)
     app.include_router(tasks.router)
     app.include_router(teams.router)
     app.include_router(evaluations.router)
     app.include_router(meetings.router)
+    app.include_router(metrics.router)
     app.include_router(index.router)
 
     return app
@@ -0,0 +1,141 @@
+import time
+from bisect import bisect_left
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Границы корзин гистограммы ожидания соединения, мс
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Histogram:
+    """Гистограмма с фиксированными границами корзин"""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def snapshot(self) -> dict[str, Any]:
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            buckets[f'le_{bound}'] = cumulative
+        buckets['le_inf'] = self.count
+        return {
+            'count': self.count,
+            'avg': round(self.total / self.count, 3) if self.count else 0.0,
+            'max': round(self.max, 3),
+            'buckets': buckets,
+        }
+
+
+class PoolMetrics:
+    """Счетчики пула соединений"""
+
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.overflow_checkouts = 0
+        self.max_overflow_used = 0
+        self.max_checked_out = 0
+        self.wait_ms = Histogram(WAIT_BUCKETS_MS)
+
+    def record_checkout(self, pool: Pool) -> None:
+        self.checkouts += 1
+        if isinstance(pool, QueuePool):
+            overflow = max(pool.overflow(), 0)
+            if overflow:
+                self.overflow_checkouts += 1
+            self.max_overflow_used = max(self.max_overflow_used, overflow)
+            self.max_checked_out = max(
+                self.max_checked_out,
+                pool.checkedout()
+            )
+
+    def snapshot(self, pool: Pool) -> dict[str, Any]:
+        data = {
+            'pool_class': type(pool).__name__,
+            'connects': self.connects,
+            'checkouts': self.checkouts,
+            'checkins': self.checkins,
+            'invalidations': self.invalidations,
+            'timeouts': self.timeouts,
+            'overflow_checkouts': self.overflow_checkouts,
+            'max_overflow_used': self.max_overflow_used,
+            'max_checked_out': self.max_checked_out,
+            'wait_ms': self.wait_ms.snapshot(),
+        }
+        if isinstance(pool, QueuePool):
+            data.update({
+                'size': pool.size(),
+                'checked_in': pool.checkedin(),
+                'checked_out': pool.checkedout(),
+                'overflow': pool.overflow(),
+            })
+        return data
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Пул, измеряющий время ожидания свободного соединения"""
+
+    metrics: PoolMetrics | None = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.timeouts += 1
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.wait_ms.observe(
+                    (time.perf_counter() - start) * 1000
+                )
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def instrument_engine(engine: AsyncEngine) -> PoolMetrics:
+    """Подключение счетчиков к пулу соединений движка"""
+    metrics = PoolMetrics()
+    pool = engine.sync_engine.pool
+    if isinstance(pool, TimedAsyncAdaptedQueuePool):
+        pool.metrics = metrics
+
+    @event.listens_for(pool, 'connect')
+    def on_connect(dbapi_connection, connection_record):
+        metrics.connects += 1
+
+    @event.listens_for(pool, 'checkout')
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.record_checkout(engine.sync_engine.pool)
+
+    @event.listens_for(pool, 'checkin')
+    def on_checkin(dbapi_connection, connection_record):
+        metrics.checkins += 1
+
+    @event.listens_for(pool, 'invalidate')
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.invalidations += 1
+
+    return metrics
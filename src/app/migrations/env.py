@@ -9,10 +9,17 @@ from src.app.config import settings
 from src.app.database import Base
 from src.app.models.user import User
 from src.app.models.team import Team
-from src.app.models.task import Task
-from src.app.models.meeting import Meeting
+from src.app.models.task import Task, is_search_object
+from src.app.models.trigram import is_trigram_index
+from src.app.models.meeting import Meeting, is_period_object
 from src.app.models.meeting_participants import MeetingParticipant
+from src.app.models.meeting_series import (
+    MeetingSeries,
+    MeetingSeriesParticipant,
+    MeetingSeriesException
+)
 from src.app.models.evaluation import Evaluation
+from src.app.models.revoked_token import RevokedToken
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -29,6 +36,16 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    """Объекты поиска задач и встреч и триграммные индексы создаются DDL"""
+    return not (
+        is_search_object(name)
+        or is_trigram_index(name)
+        or is_period_object(name)
+    )
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -52,6 +69,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -74,7 +92,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,169 @@
+"""Initial schema
+
+Revision ID: 0001_initial_schema
+Revises:
+Create Date: 2025-10-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_initial_schema'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'teams',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(), nullable=False),
+        sa.Column('code', sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('code'),
+        sa.UniqueConstraint('name')
+    )
+    op.create_index(op.f('ix_teams_id'), 'teams', ['id'], unique=False)
+
+    op.create_table(
+        'users',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('first_name', sa.String(), nullable=False),
+        sa.Column('last_name', sa.String(), nullable=False),
+        sa.Column('email', sa.String(), nullable=False),
+        sa.Column('hashed_password', sa.String(), nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('is_superuser', sa.Boolean(), nullable=False),
+        sa.Column(
+            'role',
+            sa.Enum('user', 'manager', 'admin', name='userrole'),
+            nullable=False
+        ),
+        sa.Column('team_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['team_id'], ['teams.id'], ondelete='SET NULL'
+        ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+
+    op.create_table(
+        'tasks',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column(
+            'status',
+            sa.Enum('open', 'in_progress', 'done', name='taskstatus'),
+            nullable=False
+        ),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('deadline_date', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('performer_id', sa.Integer(), nullable=True),
+        sa.Column('manager_id', sa.Integer(), nullable=True),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['manager_id'], ['users.id'], ondelete='SET NULL'
+        ),
+        sa.ForeignKeyConstraint(
+            ['performer_id'], ['users.id'], ondelete='SET NULL'
+        ),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_tasks_id'), 'tasks', ['id'], unique=False)
+
+    op.create_table(
+        'meetings',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('scheduled_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('organizer_id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['organizer_id'], ['users.id'], ondelete='CASCADE'
+        ),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_meetings_id'), 'meetings', ['id'], unique=False)
+
+    op.create_table(
+        'meeting_participants',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('meeting_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['meeting_id'], ['meetings.id'], ondelete='CASCADE'
+        ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('meeting_id', 'user_id', name='uq_meeting_user')
+    )
+    op.create_index(
+        op.f('ix_meeting_participants_id'),
+        'meeting_participants',
+        ['id'],
+        unique=False
+    )
+
+    op.create_table(
+        'evaluations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column(
+            'grade',
+            sa.Enum(
+                'ONE', 'TWO', 'THREE', 'FOUR', 'FIVE',
+                name='evaluationgrade',
+                native_enum=False
+            ),
+            nullable=False
+        ),
+        sa.Column('comment', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('manager_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['manager_id'], ['users.id'], ondelete='CASCADE'
+        ),
+        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        op.f('ix_evaluations_id'),
+        'evaluations',
+        ['id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_evaluations_id'), table_name='evaluations')
+    op.drop_table('evaluations')
+    op.drop_index(
+        op.f('ix_meeting_participants_id'),
+        table_name='meeting_participants'
+    )
+    op.drop_table('meeting_participants')
+    op.drop_index(op.f('ix_meetings_id'), table_name='meetings')
+    op.drop_table('meetings')
+    op.drop_index(op.f('ix_tasks_id'), table_name='tasks')
+    op.drop_table('tasks')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_teams_id'), table_name='teams')
+    op.drop_table('teams')
+    sa.Enum(name='taskstatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='userrole').drop(op.get_bind(), checkfirst=True)
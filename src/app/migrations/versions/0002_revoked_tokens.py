@@ -0,0 +1,53 @@
+"""Revoked tokens
+
+Revision ID: 0002_revoked_tokens
+Revises: 0001_initial_schema
+Create Date: 2025-10-02 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_revoked_tokens'
+down_revision: Union[str, None] = '0001_initial_schema'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'revoked_tokens',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('jti', sa.String(), nullable=True),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('revoked_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('jti')
+    )
+    op.create_index(
+        op.f('ix_revoked_tokens_id'),
+        'revoked_tokens',
+        ['id'],
+        unique=False
+    )
+    op.create_index(
+        op.f('ix_revoked_tokens_revoked_at'),
+        'revoked_tokens',
+        ['revoked_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_revoked_tokens_revoked_at'),
+        table_name='revoked_tokens'
+    )
+    op.drop_index(op.f('ix_revoked_tokens_id'), table_name='revoked_tokens')
+    op.drop_table('revoked_tokens')
@@ -0,0 +1,103 @@
+"""Indexes for hot filter columns
+
+Revision ID: 0003_hot_filter_indexes
+Revises: 0002_revoked_tokens
+Create Date: 2025-10-03 00:00:00.000000
+
+На Postgres индексы создаются через CREATE INDEX CONCURRENTLY
+вне транзакции, чтобы не блокировать запись в таблицы.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_hot_filter_indexes'
+down_revision: Union[str, None] = '0002_revoked_tokens'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (имя индекса, таблица, колонки)
+INDEXES = (
+    # tasks_page: фильтр по команде и статусу, сортировка по id
+    ('ix_tasks_team_id_status_id', 'tasks', ['team_id', 'status', 'id']),
+    # админские списки задач команды с фильтром по дедлайну
+    ('ix_tasks_team_id_deadline_date', 'tasks', ['team_id', 'deadline_date']),
+    # index и "мои задачи": задачи исполнителя по статусу
+    ('ix_tasks_performer_id_status', 'tasks', ['performer_id', 'status']),
+    # meetings_page: встречи команды по дате
+    (
+        'ix_meetings_team_id_scheduled_at_id',
+        'meetings',
+        ['team_id', 'scheduled_at', 'id']
+    ),
+    # встречи пользователя, (meeting_id, user_id) покрыт uq_meeting_user
+    (
+        'ix_meeting_participants_user_id_meeting_id',
+        'meeting_participants',
+        ['user_id', 'meeting_id']
+    ),
+    ('ix_evaluations_user_id', 'evaluations', ['user_id']),
+    ('ix_evaluations_task_id', 'evaluations', ['task_id']),
+    ('ix_users_team_id', 'users', ['team_id']),
+)
+
+
+def _is_postgresql() -> bool:
+    return op.get_context().dialect.name == 'postgresql'
+
+
+def _drop_invalid_index(name: str) -> None:
+    """
+    Удаление невалидного индекса, оставшегося после прерванного
+    CREATE INDEX CONCURRENTLY, иначе IF NOT EXISTS его пропустит
+    """
+    if context.is_offline_mode():
+        return
+
+    invalid = op.get_bind().execute(
+        sa.text(
+            'SELECT 1 FROM pg_class c '
+            'JOIN pg_index i ON i.indexrelid = c.oid '
+            'WHERE c.relname = :name AND NOT i.indisvalid'
+        ),
+        {'name': name}
+    ).scalar()
+    if invalid:
+        op.execute(sa.text(f'DROP INDEX CONCURRENTLY IF EXISTS {name}'))
+
+
+def upgrade() -> None:
+    if not _is_postgresql():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            _drop_invalid_index(name)
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    if not _is_postgresql():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
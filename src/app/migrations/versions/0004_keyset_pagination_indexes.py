@@ -0,0 +1,53 @@
+"""Indexes for keyset pagination
+
+Revision ID: 0004_keyset_pagination_indexes
+Revises: 0003_hot_filter_indexes
+Create Date: 2025-10-04 00:00:00.000000
+
+tasks_page без фильтра по статусу сортирует задачи команды по id.
+Остальные списки покрыты первичными ключами и индексами 0003.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_keyset_pagination_indexes'
+down_revision: Union[str, None] = '0003_hot_filter_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        op.create_index(
+            'ix_tasks_team_id_id',
+            'tasks',
+            ['team_id', 'id'],
+            if_not_exists=True
+        )
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_team_id_id',
+            'tasks',
+            ['team_id', 'id'],
+            postgresql_concurrently=True,
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        op.drop_index('ix_tasks_team_id_id', table_name='tasks', if_exists=True)
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_team_id_id',
+            table_name='tasks',
+            postgresql_concurrently=True,
+            if_exists=True
+        )
@@ -0,0 +1,42 @@
+"""Version columns for optimistic concurrency
+
+Revision ID: 0005_version_columns
+Revises: 0004_keyset_pagination_indexes
+Create Date: 2025-10-05 00:00:00.000000
+
+Номер версии строки для изменений с проверкой If-Match.
+server_default заполняет существующие строки без перезаписи таблицы
+на Postgres 11+.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_version_columns'
+down_revision: Union[str, None] = '0004_keyset_pagination_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('tasks', 'meetings', 'evaluations')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                'version',
+                sa.Integer(),
+                nullable=False,
+                server_default='1'
+            )
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('version')
@@ -0,0 +1,59 @@
+"""Trigram indexes for admin user and team search
+
+Revision ID: 0007_trigram_indexes
+Revises: 0006_task_search
+Create Date: 2025-10-08 00:00:00.000000
+
+Postgres: расширение pg_trgm и GIN индексы gin_trgm_ops
+для ILIKE '%...%' и оператора сходства %, индексы строятся CONCURRENTLY.
+SQLite: триграммный индекс строится в памяти процесса, миграция пустая.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007_trigram_indexes'
+down_revision: Union[str, None] = '0006_task_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (индекс, таблица, столбец)
+INDEXES = (
+    ('ix_users_email_trgm', 'users', 'email'),
+    ('ix_teams_name_trgm', 'teams', 'name'),
+    ('ix_teams_code_trgm', 'teams', 'code'),
+)
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, _ in INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
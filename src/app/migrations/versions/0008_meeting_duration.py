@@ -0,0 +1,70 @@
+"""Meeting duration and interval index
+
+Revision ID: 0008_meeting_duration
+Revises: 0007_trigram_indexes
+Create Date: 2025-10-09 00:00:00.000000
+
+Длительность встречи в минутах, server_default заполняет
+существующие строки без перезаписи таблицы.
+Postgres: IMMUTABLE функция meeting_period и GiST индекс по ней
+для поиска пересекающихся встреч, индекс строится CONCURRENTLY.
+SQLite: интервалы хранятся в памяти процесса.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008_meeting_duration'
+down_revision: Union[str, None] = '0007_trigram_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+POSTGRES_FUNCTION = """
+CREATE OR REPLACE FUNCTION meeting_period(
+    scheduled_at timestamptz,
+    duration_minutes integer
+) RETURNS tstzrange
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT tstzrange(
+        scheduled_at,
+        scheduled_at + make_interval(mins => duration_minutes)
+    )
+$$
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        'meetings',
+        sa.Column(
+            'duration_minutes',
+            sa.Integer(),
+            nullable=False,
+            server_default='60'
+        )
+    )
+    if op.get_context().dialect.name != 'postgresql':
+        return
+
+    op.execute(POSTGRES_FUNCTION)
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_meetings_period '
+            'ON meetings USING gist '
+            '(meeting_period(scheduled_at, duration_minutes))'
+        )
+
+
+def downgrade() -> None:
+    if op.get_context().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_meetings_period')
+        op.execute(
+            'DROP FUNCTION IF EXISTS meeting_period(timestamptz, integer)'
+        )
+
+    with op.batch_alter_table('meetings') as batch_op:
+        batch_op.drop_column('duration_minutes')
@@ -0,0 +1,133 @@
+"""Recurring meeting series
+
+Revision ID: 0009_meeting_series
+Revises: 0008_meeting_duration
+Create Date: 2025-10-10 00:00:00.000000
+
+Правило повторения, участники и отмененные встречи серии хранятся
+один раз, отдельные встречи разворачиваются при чтении.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0009_meeting_series'
+down_revision: Union[str, None] = '0008_meeting_duration'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'meeting_series',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('starts_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('duration_minutes', sa.Integer(), nullable=False),
+        sa.Column(
+            'frequency',
+            sa.Enum('daily', 'weekly', 'monthly', name='meetingfrequency'),
+            nullable=False
+        ),
+        sa.Column('interval', sa.Integer(), nullable=False),
+        sa.Column('until', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('organizer_id', sa.Integer(), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['organizer_id'], ['users.id'], ondelete='CASCADE'
+        ),
+        sa.ForeignKeyConstraint(['team_id'], ['teams.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        op.f('ix_meeting_series_id'),
+        'meeting_series',
+        ['id'],
+        unique=False
+    )
+    op.create_index(
+        'ix_meeting_series_team_id_starts_at',
+        'meeting_series',
+        ['team_id', 'starts_at'],
+        unique=False
+    )
+
+    op.create_table(
+        'meeting_series_participants',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('series_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['series_id'], ['meeting_series.id'], ondelete='CASCADE'
+        ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'series_id',
+            'user_id',
+            name='uq_meeting_series_user'
+        )
+    )
+    op.create_index(
+        op.f('ix_meeting_series_participants_id'),
+        'meeting_series_participants',
+        ['id'],
+        unique=False
+    )
+    op.create_index(
+        'ix_meeting_series_participants_user_id_series_id',
+        'meeting_series_participants',
+        ['user_id', 'series_id'],
+        unique=False
+    )
+
+    op.create_table(
+        'meeting_series_exceptions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('series_id', sa.Integer(), nullable=False),
+        sa.Column('occurs_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['series_id'], ['meeting_series.id'], ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'series_id',
+            'occurs_at',
+            name='uq_meeting_series_occurrence'
+        )
+    )
+    op.create_index(
+        op.f('ix_meeting_series_exceptions_id'),
+        'meeting_series_exceptions',
+        ['id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_meeting_series_exceptions_id'),
+        table_name='meeting_series_exceptions'
+    )
+    op.drop_table('meeting_series_exceptions')
+    op.drop_index(
+        'ix_meeting_series_participants_user_id_series_id',
+        table_name='meeting_series_participants'
+    )
+    op.drop_index(
+        op.f('ix_meeting_series_participants_id'),
+        table_name='meeting_series_participants'
+    )
+    op.drop_table('meeting_series_participants')
+    op.drop_index(
+        'ix_meeting_series_team_id_starts_at',
+        table_name='meeting_series'
+    )
+    op.drop_index(op.f('ix_meeting_series_id'), table_name='meeting_series')
+    op.drop_table('meeting_series')
+    sa.Enum(name='meetingfrequency').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,43 @@
+"""Meeting and meeting series updated_at
+
+Revision ID: 0010_updated_at
+Revises: 0009_meeting_series
+Create Date: 2025-10-11 00:00:00.000000
+
+Время последнего изменения встреч и серий для Last-Modified и ETag
+календарной ленты. Существующие строки получают created_at.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0010_updated_at'
+down_revision: Union[str, None] = '0009_meeting_series'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('meetings', 'meeting_series')
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True)
+        )
+        op.execute(f'UPDATE {table} SET updated_at = created_at')
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'updated_at',
+                existing_type=sa.DateTime(timezone=True),
+                nullable=False
+            )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('updated_at')
@@ -3,7 +3,24 @@ from .team import Team
 from .task import Task
 from .meeting import Meeting
 from .meeting_participants import MeetingParticipant
+from .meeting_series import (
+    MeetingSeries,
+    MeetingSeriesParticipant,
+    MeetingSeriesException
+)
 from .evaluation import Evaluation
+from .revoked_token import RevokedToken
 
 
-__all__ = ['User', 'Team', 'Task', 'Meeting', 'MeetingParticipant', 'Evaluation']
\ No newline at end of file
+__all__ = [
+    'User',
+    'Team',
+    'Task',
+    'Meeting',
+    'MeetingParticipant',
+    'MeetingSeries',
+    'MeetingSeriesParticipant',
+    'MeetingSeriesException',
+    'Evaluation',
+    'RevokedToken'
+]
\ No newline at end of file
@@ -2,7 +2,7 @@ from datetime import datetime, UTC
 from enum import IntEnum
 
 from sqlalchemy import Integer, Text, ForeignKey, DateTime, Enum as SQLEnum
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column, relationship
 
 from src.app.database import Base
 
@@ -20,6 +20,10 @@ class Evaluation(Base):
     """Модель для оценок задач"""
     __tablename__ = 'evaluations'
 
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict:
+        return {'version_id_col': cls.__table__.c.version}
+
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
 
     grade: Mapped[EvaluationGrade] = mapped_column(
@@ -32,6 +36,11 @@ class Evaluation(Base):
         DateTime(timezone=True),
         default=lambda: datetime.now(UTC)
     )
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default='1'
+    )
 
     manager_id: Mapped[int] = mapped_column(
         Integer,
@@ -47,7 +56,8 @@ class Evaluation(Base):
     user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey('users.id', ondelete='CASCADE'),
-        nullable=False
+        nullable=False,
+        index=True
     )
     user = relationship(
         'User',
@@ -58,7 +68,8 @@ class Evaluation(Base):
     task_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey('tasks.id', ondelete='CASCADE'),
-        nullable=False
+        nullable=False,
+        index=True
     )
     task = relationship('Task', back_populates='evaluations')
 
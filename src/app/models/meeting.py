@@ -1,14 +1,39 @@
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 
-from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column, relationship
+from sqlalchemy import (
+    DDL,
+    Integer,
+    String,
+    Text,
+    DateTime,
+    ForeignKey,
+    Index,
+    event
+)
 
 from src.app.database import Base
 
 
+# Длительность встречи по умолчанию
+DEFAULT_DURATION_MINUTES = 60
+
+
 class Meeting(Base):
     """Модель для организации встреч"""
     __tablename__ = 'meetings'
+    __table_args__ = (
+        Index(
+            'ix_meetings_team_id_scheduled_at_id',
+            'team_id',
+            'scheduled_at',
+            'id'
+        ),
+    )
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict:
+        return {'version_id_col': cls.__table__.c.version}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
@@ -17,10 +42,26 @@ class Meeting(Base):
         DateTime(timezone=True),
         nullable=False
     )
+    duration_minutes: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=DEFAULT_DURATION_MINUTES,
+        server_default=str(DEFAULT_DURATION_MINUTES)
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         default=lambda: datetime.now(UTC)
     )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC)
+    )
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default='1'
+    )
 
     organizer_id: Mapped[int] = mapped_column(
         Integer,
@@ -41,6 +82,10 @@ class Meeting(Base):
         cascade='all, delete-orphan'
     )
 
+    @property
+    def ends_at(self) -> datetime:
+        return self.scheduled_at + timedelta(minutes=self.duration_minutes)
+
     def __repr__(self) -> str:
         return (
             f'<Meeting id={self.id} title={self.title} '
@@ -49,3 +94,44 @@ class Meeting(Base):
 
     def __str__(self) -> str:
         return f'{self.title} | Team {self.team_id}'
+
+
+# Интервал встречи [scheduled_at, ends_at) для поиска пересечений.
+# Postgres: GiST индекс по tstzrange. Сложение timestamptz и interval
+# только STABLE, но для минут не зависит от часового пояса, поэтому
+# выражение обернуто в IMMUTABLE функцию.
+# SQLite: отсортированные интервалы в памяти процесса.
+# Объекты создаются DDL и не входят в метаданные моделей
+PERIOD_FUNCTION = 'meeting_period'
+PERIOD_INDEX = 'ix_meetings_period'
+
+POSTGRES_PERIOD_DDL = (
+    f"""
+    CREATE OR REPLACE FUNCTION {PERIOD_FUNCTION}(
+        scheduled_at timestamptz,
+        duration_minutes integer
+    ) RETURNS tstzrange
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT tstzrange(
+            scheduled_at,
+            scheduled_at + make_interval(mins => duration_minutes)
+        )
+    $$
+    """,
+    f"""
+    CREATE INDEX IF NOT EXISTS {PERIOD_INDEX} ON meetings
+    USING gist ({PERIOD_FUNCTION}(scheduled_at, duration_minutes))
+    """,
+)
+
+for statement in POSTGRES_PERIOD_DDL:
+    event.listen(
+        Meeting.__table__,
+        'after_create',
+        DDL(statement).execute_if(dialect='postgresql')
+    )
+
+
+def is_period_object(name: str | None) -> bool:
+    """Объект поиска пересечений встреч (для autogenerate)"""
+    return name == PERIOD_INDEX
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import Integer, ForeignKey, UniqueConstraint
+from sqlalchemy import Integer, ForeignKey, Index, UniqueConstraint
 
 from src.app.database import Base
 
@@ -21,10 +21,17 @@ class MeetingParticipant(Base):
         nullable=False
     )
 
-    __table_args__ = (UniqueConstraint(
-        'meeting_id',
-        'user_id',
-        name='uq_meeting_user'),
+    __table_args__ = (
+        UniqueConstraint(
+            'meeting_id',
+            'user_id',
+            name='uq_meeting_user'
+        ),
+        Index(
+            'ix_meeting_participants_user_id_meeting_id',
+            'user_id',
+            'meeting_id'
+        ),
     )
 
     user = relationship('User', back_populates='meetings')
@@ -0,0 +1,161 @@
+from datetime import datetime, UTC
+from enum import Enum
+
+from sqlalchemy import (
+    DateTime,
+    Enum as SQLEnum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint
+)
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from src.app.database import Base
+from src.app.models.meeting import DEFAULT_DURATION_MINUTES
+
+
+class MeetingFrequency(str, Enum):
+    """Периодичность повторяющейся встречи"""
+    daily = 'daily'
+    weekly = 'weekly'
+    monthly = 'monthly'
+
+
+class MeetingSeries(Base):
+    """
+    Повторяющаяся встреча: правило повторения хранится один раз,
+    отдельные встречи разворачиваются при чтении
+    """
+    __tablename__ = 'meeting_series'
+    __table_args__ = (
+        Index('ix_meeting_series_team_id_starts_at', 'team_id', 'starts_at'),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    title: Mapped[str] = mapped_column(String, nullable=False)
+    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    starts_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False
+    )
+    duration_minutes: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=DEFAULT_DURATION_MINUTES
+    )
+    frequency: Mapped[MeetingFrequency] = mapped_column(
+        SQLEnum(MeetingFrequency),
+        nullable=False
+    )
+    interval: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    until: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC)
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC)
+    )
+
+    organizer_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    organizer = relationship('User')
+
+    team_id: Mapped[int] = mapped_column(
+        ForeignKey('teams.id', ondelete='CASCADE'),
+        nullable=False
+    )
+
+    participants = relationship(
+        'MeetingSeriesParticipant',
+        back_populates='series',
+        cascade='all, delete-orphan'
+    )
+    exceptions = relationship(
+        'MeetingSeriesException',
+        back_populates='series',
+        cascade='all, delete-orphan'
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f'<MeetingSeries id={self.id} title={self.title} '
+            f'frequency={self.frequency}>'
+        )
+
+    def __str__(self) -> str:
+        return f'{self.title} | Team {self.team_id}'
+
+
+class MeetingSeriesParticipant(Base):
+    """Участник всех встреч серии"""
+    __tablename__ = 'meeting_series_participants'
+    __table_args__ = (
+        UniqueConstraint(
+            'series_id',
+            'user_id',
+            name='uq_meeting_series_user'
+        ),
+        Index(
+            'ix_meeting_series_participants_user_id_series_id',
+            'user_id',
+            'series_id'
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    series_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('meeting_series.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False
+    )
+
+    series = relationship('MeetingSeries', back_populates='participants')
+    user = relationship('User')
+
+    def __str__(self) -> str:
+        return f'Series {self.series_id} | User {self.user_id}'
+
+
+class MeetingSeriesException(Base):
+    """Отмененная встреча серии (время по правилу повторения)"""
+    __tablename__ = 'meeting_series_exceptions'
+    __table_args__ = (
+        UniqueConstraint(
+            'series_id',
+            'occurs_at',
+            name='uq_meeting_series_occurrence'
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    series_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('meeting_series.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    occurs_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False
+    )
+
+    series = relationship('MeetingSeries', back_populates='exceptions')
+
+    def __str__(self) -> str:
+        return f'Series {self.series_id} | {self.occurs_at}'
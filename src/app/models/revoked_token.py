@@ -0,0 +1,46 @@
+from datetime import datetime, UTC
+
+from sqlalchemy import Integer, String, DateTime, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.app.database import Base
+
+
+class RevokedToken(Base):
+    """
+    Модель отозванных токенов.
+    Запись без jti отзывает все токены пользователя,
+    выпущенные до момента revoked_at
+    """
+    __tablename__ = 'revoked_tokens'
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    jti: Mapped[str | None] = mapped_column(
+        String,
+        unique=True,
+        nullable=True
+    )
+    user_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    revoked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(UTC),
+        nullable=False,
+        index=True
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f'<RevokedToken id={self.id} jti={self.jti} '
+            f'user_id={self.user_id}>'
+        )
+
+    def __str__(self) -> str:
+        return f'Token {self.jti or "*"} | User {self.user_id}'
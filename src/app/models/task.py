@@ -2,14 +2,17 @@ from enum import Enum
 from datetime import datetime, UTC
 
 from sqlalchemy import (
+    DDL,
+    event,
     Integer,
     String,
     Text,
     ForeignKey,
     DateTime,
+    Index,
     Enum as SQLEnum
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, declared_attr, mapped_column, relationship
 
 from src.app.database import Base
 
@@ -24,6 +27,16 @@ class TaskStatus(str, Enum):
 class Task(Base):
     """Модель для создания задач"""
     __tablename__ = 'tasks'
+    __table_args__ = (
+        Index('ix_tasks_team_id_status_id', 'team_id', 'status', 'id'),
+        Index('ix_tasks_team_id_id', 'team_id', 'id'),
+        Index('ix_tasks_team_id_deadline_date', 'team_id', 'deadline_date'),
+        Index('ix_tasks_performer_id_status', 'performer_id', 'status'),
+    )
+
+    @declared_attr.directive
+    def __mapper_args__(cls) -> dict:
+        return {'version_id_col': cls.__table__.c.version}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
@@ -42,6 +55,11 @@ class Task(Base):
         default=lambda: datetime.now(UTC),
         onupdate=lambda: datetime.now(UTC)
     )
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default='1'
+    )
     deadline_date: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
         nullable=True
@@ -87,3 +105,93 @@ class Task(Base):
 
     def __str__(self) -> str:
         return f'{self.title} | Team {self.team_id}'
+
+
+# Полнотекстовый поиск по title и description.
+# Postgres: GIN индекс по выражению tsvector (столбец не хранится,
+# поэтому индекс строится CONCURRENTLY без перезаписи таблицы),
+# SQLite: FTS5 таблица с внешним содержимым, синхронизируемая триггерами.
+# Объекты создаются DDL и не входят в метаданные моделей
+SEARCH_CONFIG = 'russian'
+SEARCH_VECTOR_INDEX = 'ix_tasks_search_vector'
+SEARCH_FTS_TABLE = 'tasks_fts'
+# Запросы используют то же выражение, что и индекс
+SEARCH_VECTOR = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', "
+    f"coalesce(tasks.title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', "
+    f"coalesce(tasks.description, '')), 'B')"
+)
+
+POSTGRES_SEARCH_DDL = (
+    f"""
+    CREATE INDEX IF NOT EXISTS {SEARCH_VECTOR_INDEX}
+    ON tasks USING gin (({SEARCH_VECTOR}))
+    """,
+)
+
+SQLITE_SEARCH_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_FTS_TABLE} USING fts5(
+        title,
+        description,
+        content='tasks',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_FTS_TABLE}_ai
+    AFTER INSERT ON tasks BEGIN
+        INSERT INTO {SEARCH_FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_FTS_TABLE}_ad
+    AFTER DELETE ON tasks BEGIN
+        INSERT INTO {SEARCH_FTS_TABLE}(
+            {SEARCH_FTS_TABLE}, rowid, title, description
+        )
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_FTS_TABLE}_au
+    AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO {SEARCH_FTS_TABLE}(
+            {SEARCH_FTS_TABLE}, rowid, title, description
+        )
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {SEARCH_FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+)
+
+for statement in POSTGRES_SEARCH_DDL:
+    event.listen(
+        Task.__table__,
+        'after_create',
+        DDL(statement).execute_if(dialect='postgresql')
+    )
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(
+        Task.__table__,
+        'after_create',
+        DDL(statement).execute_if(dialect='sqlite')
+    )
+event.listen(
+    Task.__table__,
+    'after_drop',
+    DDL(f'DROP TABLE IF EXISTS {SEARCH_FTS_TABLE}').execute_if(
+        dialect='sqlite'
+    )
+)
+
+
+def is_search_object(name: str | None) -> bool:
+    """Объект схемы полнотекстового поиска (для autogenerate)"""
+    return name is not None and (
+        name == SEARCH_VECTOR_INDEX or name.startswith(SEARCH_FTS_TABLE)
+    )
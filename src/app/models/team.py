@@ -5,6 +5,7 @@ from sqlalchemy import Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.app.database import Base
+from src.app.models.trigram import trigram_index
 
 
 def generate_team_code(length: int = 8) -> str:
@@ -34,3 +35,8 @@ class Team(Base):
 
     def __str__(self) -> str:
         return self.name
+
+
+# Поиск подстроки и нечеткий поиск по названию и коду в админке
+trigram_index(Team.__table__.c.name)
+trigram_index(Team.__table__.c.code)
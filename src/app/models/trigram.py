@@ -0,0 +1,36 @@
+from sqlalchemy import DDL, Column, event
+
+# Триграммные GIN индексы (pg_trgm) для поиска подстроки и нечеткого поиска.
+# В SQLite их заменяет индекс в памяти процесса (services/text_search.py).
+# Индексы создаются DDL и не входят в метаданные моделей
+TRIGRAM_EXTENSION_DDL = 'CREATE EXTENSION IF NOT EXISTS pg_trgm'
+
+# Имя индекса по (таблица, столбец)
+TRIGRAM_INDEXES: dict[tuple[str, str], str] = {}
+
+
+def trigram_index_name(table: str, column: str) -> str:
+    return f'ix_{table}_{column}_trgm'
+
+
+def trigram_index(column: Column) -> str:
+    """Регистрация триграммного индекса столбца, создаваемого с таблицей"""
+    table = column.table.name
+    name = trigram_index_name(table, column.name)
+    TRIGRAM_INDEXES[(table, column.name)] = name
+    for statement in (
+        TRIGRAM_EXTENSION_DDL,
+        f'CREATE INDEX IF NOT EXISTS {name} '
+        f'ON {table} USING gin ({column.name} gin_trgm_ops)'
+    ):
+        event.listen(
+            column.table,
+            'after_create',
+            DDL(statement).execute_if(dialect='postgresql')
+        )
+    return name
+
+
+def is_trigram_index(name: str | None) -> bool:
+    """Триграммный индекс (для autogenerate)"""
+    return name in TRIGRAM_INDEXES.values()
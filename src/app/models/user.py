@@ -4,6 +4,7 @@ from sqlalchemy import String, Boolean, Integer, ForeignKey, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.app.database import Base
+from src.app.models.trigram import trigram_index
 
 
 class UserRole(str, Enum):
@@ -39,7 +40,8 @@ class User(Base):
     team_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey('teams.id', ondelete='SET NULL'),
-        nullable=True
+        nullable=True,
+        index=True
     )
     team = relationship('Team', back_populates='members')
 
@@ -72,3 +74,7 @@ class User(Base):
 
     def __str__(self) -> str:
         return self.email
+
+
+# Поиск подстроки и нечеткий поиск по email в админке
+trigram_index(User.__table__.c.email)
@@ -3,15 +3,40 @@ from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import RedirectResponse
 from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.app.database import get_db
 from src.app.auth.user_manager import get_user_manager, UserManager
 from src.app.schemas.user import UserCreate
 from src.app.auth.auth import access_backend, refresh_backend
+from src.app.auth.revocation import revocation_store
+from src.app.auth.rate_limit import (
+    login_ip_limiter,
+    login_email_limiter,
+    register_ip_limiter
+)
 
 router = APIRouter(prefix='/auth', tags=['auth'])
 templates = Jinja2Templates(directory='src/app/templates')
 
 
+def client_ip(request: Request) -> str:
+    """IP адрес клиента для ограничения частоты запросов"""
+    return request.client.host if request.client else 'unknown'
+
+
+def throttled_response(request: Request, template: str, retry_after: int):
+    """Ответ на превышение частоты запросов"""
+    error = f'Слишком много попыток, повторите через {retry_after} сек.'
+    return templates.TemplateResponse(
+        request,
+        template,
+        {'error': error},
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        headers={'Retry-After': str(retry_after)}
+    )
+
+
 @router.get('/login')
 async def login_page(request: Request):
     """Страница для входа в аккаунт"""
@@ -36,6 +61,13 @@ async def login_submit(
     user_manager: UserManager = Depends(get_user_manager)
 ):
     """Аутентификация пользователя"""
+    retry_after = (
+        await login_ip_limiter.hit(client_ip(request))
+        or await login_email_limiter.hit(username.strip().lower())
+    )
+    if retry_after:
+        return throttled_response(request, 'auth/login.html', retry_after)
+
     user = await user_manager.authenticate(OAuth2PasswordRequestForm(
         username=username,
         password=password,
@@ -98,8 +130,22 @@ async def refresh_token(
 
 
 @router.post('/logout')
-async def logout():
-    """Выход из аккаунта"""
+async def logout(request: Request, db: AsyncSession = Depends(get_db)):
+    """Выход из аккаунта с отзывом access и refresh токенов"""
+    for backend, cookie_name in (
+        (access_backend, 'access_token'),
+        (refresh_backend, 'refresh_token')
+    ):
+        token = request.cookies.get(cookie_name)
+        if not token:
+            continue
+        payload = backend.get_strategy().decode_token(
+            token.removeprefix('Bearer ').strip()
+        )
+        if payload is not None:
+            await revocation_store.revoke_token(db, payload)
+    await db.commit()
+
     response = RedirectResponse(url='/', status_code=status.HTTP_303_SEE_OTHER)
 
     response.delete_cookie('access_token')
@@ -147,6 +193,10 @@ async def resgister_submit(
     user_manager=Depends(get_user_manager)
 ):
     """Регистрация пользователя"""
+    retry_after = await register_ip_limiter.hit(client_ip(request))
+    if retry_after:
+        return throttled_response(request, 'auth/register.html', retry_after)
+
     if password != password_confirm:
         return templates.TemplateResponse(
             request,
@@ -1,5 +1,4 @@
 from typing import Optional
-from datetime import datetime
 
 from fastapi import (
     APIRouter,
@@ -8,11 +7,12 @@ from fastapi import (
     status,
     Query,
     Request,
+    Response,
     Form
 )
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import RedirectResponse
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
@@ -21,12 +21,20 @@ from src.app.schemas.evaluation import (
     EvaluationCreate,
     EvaluationUpdate
 )
-from src.app.database import get_db
+from src.app.database import get_db, get_session_factory
 from src.app.auth.dependencies import get_current_user, require_role
 from src.app.models.user import User
 from src.app.models.task import Task
 from src.app.models.evaluation import Evaluation, EvaluationGrade
 from src.app.services import evaluation_crud, evaluation_service
+from src.app.services.pagination import paginate, set_cursor_headers
+from src.app.services.filters import EvaluationFilters
+from src.app.services.export import ExportFormat, export_response
+from src.app.services.versioning import (
+    if_match_versions,
+    raise_update_failed,
+    set_etag
+)
 
 router = APIRouter(prefix='/evaluations', tags=['evaluations'])
 templates = Jinja2Templates(directory='src/app/templates')
@@ -249,7 +257,11 @@ async def edit_evaluation_submit(
         comment=comment
     )
 
-    await evaluation_crud.update_evaluation(db, evaluation, evaluation_data)
+    await evaluation_crud.update_evaluation(
+        db,
+        evaluation.id,
+        evaluation_data
+    )
 
     return RedirectResponse(
         url=f'/evaluations/task/{evaluation.task_id}',
@@ -328,64 +340,63 @@ async def create_evaluation(
     return evaluation
 
 
+@router.get('/admin/export')
+async def export_evaluations(
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+    _: User = Depends(require_role('admin')),
+    filters: EvaluationFilters = Depends(),
+    export_format: ExportFormat = Query(
+        ExportFormat.ndjson,
+        alias='format',
+        description='Формат выгрузки'
+    ),
+):
+    """
+    Потоковая выгрузка всех оценок с фильтрами списка
+    (доступно только админам)
+    """
+    stmt = filters.apply(select(Evaluation)).order_by(Evaluation.id)
+    return export_response(
+        session_factory,
+        stmt,
+        EvaluationRead,
+        export_format,
+        'evaluations'
+    )
+
+
 @router.get('/admin/all', response_model=list[EvaluationRead])
 async def get_all_evaluations(
+    response: Response,
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_role('admin')),
-    task_id: Optional[int] = Query(
-        None,
-        description='Фильтрация по задаче'
-    ),
-    user_id: Optional[int] = Query(
-        None,
-        description='Фильтрация по пользователю'
-    ),
-    manager_id: Optional[int] = Query(
-        None,
-        description='Фильтрация по менеджеру'
-    ),
-    grade: Optional[EvaluationGrade] = Query(
-        None,
-        description='Фильтрация по оценке'
-    ),
-    created_before: Optional[datetime] = Query(
-        None,
-        description='Оценки до даты'
-    ),
-    created_after: Optional[datetime] = Query(
-        None,
-        description='Оценки после даты'
-    ),
+    filters: EvaluationFilters = Depends(),
     limit: int = Query(10, ge=1, le=100, description='Количество записей'),
     offset: int = Query(0, ge=0, description='Смещение'),
+    cursor: Optional[str] = Query(None, description='Курсор страницы'),
 ):
     """
     Получение всех оценок
     (доступно только админам)
     """
-    stmt = select(Evaluation)
-
-    if task_id:
-        stmt = stmt.where(Evaluation.task_id == task_id)
-    if user_id:
-        stmt = stmt.where(Evaluation.user_id == user_id)
-    if manager_id:
-        stmt = stmt.where(Evaluation.manager_id == manager_id)
-    if grade:
-        stmt = stmt.where(Evaluation.grade == grade)
-    if created_before:
-        stmt = stmt.where(Evaluation.created_at <= created_before)
-    if created_after:
-        stmt = stmt.where(Evaluation.created_at >= created_after)
-
-    stmt = stmt.limit(limit).offset(offset)
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    stmt = filters.apply(select(Evaluation))
+
+    page = await paginate(
+        db,
+        stmt,
+        [Evaluation.id],
+        limit,
+        cursor=cursor,
+        offset=offset
+    )
+    set_cursor_headers(response, page)
+    return page.items
 
 
 @router.get('/admin/{evaluation_id}', response_model=EvaluationRead)
 async def get_evaluation_by_id(
     evaluation_id: int,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(require_role('admin'))
 ):
@@ -395,6 +406,7 @@ async def get_evaluation_by_id(
     """
     evaluation = await check_evaluation(db, evaluation_id, user)
 
+    set_etag(response, evaluation)
     return evaluation
 
 
@@ -422,19 +434,33 @@ async def get_evaluations_by_task(
 async def update_evaluation(
     evaluation_id: int,
     evaluation_data: EvaluationUpdate,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role('admin'))
+    _: User = Depends(require_role('admin')),
+    versions: Optional[list[int]] = Depends(if_match_versions),
 ):
     """
-    Изменение оценки
+    Изменение оценки.
+    С заголовком If-Match изменение применяется, только если оценка
+    не менялась с момента чтения, иначе 412
     (доступно только админам)
     """
-    evaluation = await check_evaluation(db, evaluation_id, user)
-    return await evaluation_crud.update_evaluation(
+    evaluation = await evaluation_crud.update_evaluation(
         db,
-        evaluation,
-        evaluation_data
+        evaluation_id,
+        evaluation_data,
+        versions
     )
+    if evaluation is None:
+        await raise_update_failed(
+            db,
+            Evaluation,
+            evaluation_id,
+            'Оценка не найдена'
+        )
+
+    set_etag(response, evaluation)
+    return evaluation
 
 
 @router.delete('/admin/{evaluation_id}')
@@ -1,9 +1,9 @@
 from typing import Optional
-from datetime import datetime, UTC
+import heapq
+from datetime import datetime, timedelta, UTC
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import RedirectResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
@@ -14,6 +14,8 @@ from src.app.models.task import Task
 from src.app.models.meeting import Meeting
 from src.app.models.meeting_participants import MeetingParticipant
 from src.app.database import get_db
+from src.app.config import settings
+from src.app.services import meeting_series
 
 router = APIRouter(tags=['index'])
 templates = Jinja2Templates(directory='src/app/templates')
@@ -47,18 +49,30 @@ async def index(
         tasks = tasks_result.scalars().all()
 
         current_date = datetime.now(UTC)
+        horizon = current_date + timedelta(
+            days=settings.UPCOMING_MEETINGS_DAYS
+        )
         meetings_result = await db.execute(
             select(Meeting)
             .join(MeetingParticipant)
             .where(
                 MeetingParticipant.user_id == user.id,
-                Meeting.scheduled_at >= current_date
+                Meeting.scheduled_at >= current_date,
+                Meeting.scheduled_at < horizon
             )
+            .order_by(Meeting.scheduled_at, Meeting.id)
         )
-        meetings = meetings_result.scalars().all()
-
-    if user is None and request.cookies.get("refresh_token"):
-        return RedirectResponse(url="/auth/refresh?next=/")
+        series = await meeting_series.get_series_list(
+            db,
+            user_id=user.id,
+            after=current_date,
+            before=horizon
+        )
+        meetings = list(heapq.merge(
+            meetings_result.scalars().all(),
+            meeting_series.expand(series, current_date, horizon),
+            key=lambda meeting: (meeting.scheduled_at, meeting.id)
+        ))
 
     return templates.TemplateResponse(
         request,
@@ -68,6 +82,7 @@ async def index(
             'team': team,
             'tasks': tasks,
             'meetings': meetings,
+            'upcoming_days': settings.UPCOMING_MEETINGS_DAYS,
             'message': message
         }
     )
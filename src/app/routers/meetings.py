@@ -1,5 +1,6 @@
+from itertools import islice
 from typing import Optional
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 
 from fastapi import (
     APIRouter,
@@ -8,24 +9,67 @@ from fastapi import (
     status,
     Query,
     Request,
+    Response,
     Form
 )
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import RedirectResponse
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from pydantic import ValidationError
 
-from src.app.schemas.meeting import MeetingRead, MeetingCreate, MeetingUpdate
-from src.app.database import get_db
-from src.app.services import meeting_crud
+from src.app.schemas.meeting import (
+    MAX_DURATION_MINUTES,
+    MIN_DURATION_MINUTES,
+    FreeSlot,
+    MeetingRead,
+    MeetingCreate,
+    MeetingUpdate,
+    MeetingOccurrenceRead,
+    MeetingSeriesCreate,
+    MeetingSeriesExceptionCreate,
+    MeetingSeriesRead
+)
+from src.app.database import get_db, get_session_factory
+from src.app.services import meeting_crud, meeting_series
+from src.app.services.calendar_feed import feed_response, get_feed_user
+from src.app.config import settings
+from src.app.services.pagination import (
+    CountMode,
+    Total,
+    paginate,
+    paginate_merged,
+    count_rows,
+    cursor_url,
+    set_cursor_headers
+)
+from src.app.services.filters import MeetingFilters
+from src.app.services.export import ExportFormat, export_response
+from src.app.services.meeting_schedule import (
+    MeetingConflict,
+    find_conflicts,
+    find_free_slots,
+    find_series_conflicts
+)
+from src.app.services.versioning import (
+    if_match_versions,
+    raise_update_failed,
+    set_etag
+)
 from src.app.auth.dependencies import get_current_user, require_role
 from src.app.models.user import User
-from src.app.models.meeting import Meeting
+from src.app.models.meeting import Meeting, DEFAULT_DURATION_MINUTES
 from src.app.models.meeting_participants import MeetingParticipant
+from src.app.models.meeting_series import MeetingFrequency, MeetingSeries
 
 router = APIRouter(prefix='/meetings', tags=['meetings'])
+# Наибольший период поиска свободных интервалов
+MAX_SLOT_SEARCH_DAYS = 31
+# Наибольшее число встреч серии в одном ответе
+MAX_OCCURRENCES = 500
+# Период, в котором встречи новой серии проверяются на занятость
+SERIES_CHECK_DAYS = 90
 templates = Jinja2Templates(directory='src/app/templates')
 
 
@@ -51,6 +95,35 @@ async def check_meeting(
     return meeting
 
 
+async def check_series(
+        db: AsyncSession,
+        series_id: int,
+        user: User
+) -> MeetingSeries:
+    """Общая функция для проверки серии встреч"""
+    series = await meeting_series.get_series(db, series_id)
+    if not series:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='Серия встреч не найдена'
+        )
+
+    if user.team_id != series.team_id and user.role != 'admin':
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='Недостаточно прав'
+        )
+
+    return series
+
+
+def overlap_error(conflicts: list[MeetingConflict]) -> str:
+    return (
+        'Участники заняты в это время: '
+        + '; '.join(str(conflict) for conflict in conflicts)
+    )
+
+
 # Маршруты для пользователей
 @router.get('/')
 async def meetings_page(
@@ -59,9 +132,15 @@ async def meetings_page(
     user: User = Depends(get_current_user),
     status: Optional[str] = Query(None, pattern='^(past|upcoming)?$'),
     my_meetings: bool = Query(False),
-    page: int = Query(1, ge=1)
+    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None),
+    count: Optional[CountMode] = Query(None)
 ):
-    """Страница со встречами команды"""
+    """
+    Страница со встречами команды.
+    Встречи серий разворачиваются из правил повторения в окне
+    статуса и объединяются с обычными встречами
+    """
     limit = 10
     offset = (page - 1) * limit
 
@@ -72,45 +151,70 @@ async def meetings_page(
             .selectinload(MeetingParticipant.user)
         )
     )
-    count_query = select(func.count(Meeting.id))
-
     query = query.where(Meeting.team_id == user.team_id)
-    count_query = count_query.where(Meeting.team_id == user.team_id)
 
     now = datetime.now(UTC)
+    after = before = None
 
     if status == 'past':
         query = query.where(Meeting.scheduled_at < now)
-        count_query = count_query.where(Meeting.scheduled_at < now)
+        before = now
     elif status == 'upcoming':
         query = query.where(Meeting.scheduled_at >= now)
-        count_query = count_query.where(Meeting.scheduled_at >= now)
+        after = now
 
     if my_meetings:
         query = (
             query.join(MeetingParticipant)
             .where(MeetingParticipant.user_id == user.id)
         )
-        count_query = (
-            count_query.join(MeetingParticipant)
-            .where(MeetingParticipant.user_id == user.id)
-        )
 
-    total_meetings = await db.scalar(count_query)
-    total_pages = max((total_meetings + limit - 1) // limit, 1)
+    series = await meeting_series.get_series_list(
+        db,
+        team_id=user.team_id,
+        user_id=user.id if my_meetings else None,
+        after=after,
+        before=before
+    )
+
+    total_meetings = await count_rows(
+        db,
+        query,
+        count or settings.MEETINGS_PAGE_COUNT,
+        cache_key=(
+            'meetings',
+            user.team_id,
+            status,
+            user.id if my_meetings else None
+        )
+    )
+    if total_meetings and series:
+        occurrences = meeting_series.count_occurrences(series, after, before)
+        total_meetings = None if occurrences is None else Total(
+            total_meetings.value + occurrences,
+            total_meetings.estimated
+        )
 
-    meetings_result = await db.execute(query.offset(offset).limit(limit))
-    meetings = meetings_result.scalars().all()
+    meetings_result = await paginate_merged(
+        db,
+        query,
+        [Meeting.scheduled_at, Meeting.id],
+        limit,
+        meeting_series.occurrence_stream(series, after, before),
+        cursor=cursor,
+        offset=offset
+    )
 
     return templates.TemplateResponse(
         request,
         'meeting/meetings.html',
         {
-            'meetings': meetings,
+            'meetings': meetings_result.items,
+            'total_meetings': total_meetings,
+            'next_url': cursor_url(request, meetings_result.next_cursor),
+            'prev_url': cursor_url(request, meetings_result.prev_cursor),
             'status': status or '',
             'my_meetings': my_meetings,
-            'page': page,
-            'total_pages': total_pages,
             'user': user
         }
     )
@@ -170,35 +274,35 @@ async def create_meeting_submit(
         False,
         description='Добавить всю команду'
     ),
+    duration_minutes: int = Form(
+        DEFAULT_DURATION_MINUTES,
+        ge=MIN_DURATION_MINUTES,
+        le=MAX_DURATION_MINUTES,
+        description='Длительность встречи в минутах'
+    ),
+    allow_overlap: bool = Form(
+        False,
+        description='Создать, даже если участники заняты'
+    ),
+    frequency: str = Form(
+        '',
+        pattern='^(daily|weekly|monthly)?$',
+        description='Повторять встречу'
+    ),
+    repeat_until: str = Form(
+        '',
+        description='Повторять до даты'
+    ),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(require_role('manager', 'admin'))
 ):
-    """Создать встречу"""
-    try:
-        scheduled_dt = datetime.fromisoformat(scheduled_at)
-    except ValueError:
-        result = await db.execute(
-            select(User).where(User.team_id == user.team_id)
-        )
-        team_members = result.scalars().all()
-        return templates.TemplateResponse(
-            'meeting/create_meeting.html',
-            {
-                'request': request,
-                'error': 'Неверный формат даты/времени',
-                'user': user,
-                'team_members': team_members
-            }
-        )
-
-    conflict_query = await db.execute(
-        select(Meeting)
-        .where(Meeting.team_id == team_id)
-        .where(Meeting.scheduled_at == scheduled_dt)
-    )
-    conflict_meeting = conflict_query.scalars().first()
-
-    if conflict_meeting:
+    """
+    Создать встречу или серию повторяющихся встреч.
+    Занятость участников проверяется только после проверки прав
+    на команду и состава участников, чтобы ошибка не раскрывала
+    расписание чужой команды
+    """
+    async def form_error(error: str):
         result = await db.execute(
             select(User).where(User.team_id == user.team_id)
         )
@@ -207,54 +311,99 @@ async def create_meeting_submit(
             request,
             'meeting/create_meeting.html',
             {
-                'error': 'На это время уже назначена встреча',
+                'error': error,
                 'user': user,
                 'team_members': team_members
             }
         )
 
     try:
-        meeting_data = MeetingCreate(
-            title=title,
-            description=description,
-            scheduled_at=scheduled_dt,
-            team_id=team_id,
-            participants_id=participant_ids,
-            add_team_members=add_all_team
+        scheduled_dt = datetime.fromisoformat(scheduled_at)
+        until_dt = (
+            datetime.fromisoformat(repeat_until) if repeat_until else None
         )
+    except ValueError:
+        return await form_error('Неверный формат даты/времени')
+
+    try:
+        if frequency:
+            meeting_data = MeetingSeriesCreate(
+                title=title,
+                description=description,
+                starts_at=scheduled_dt,
+                duration_minutes=duration_minutes,
+                frequency=MeetingFrequency(frequency),
+                until=until_dt,
+                team_id=team_id,
+                participants_id=participant_ids,
+                add_team_members=add_all_team
+            )
+        else:
+            meeting_data = MeetingCreate(
+                title=title,
+                description=description,
+                scheduled_at=scheduled_dt,
+                duration_minutes=duration_minutes,
+                team_id=team_id,
+                participants_id=participant_ids,
+                add_team_members=add_all_team
+            )
     except ValidationError as e:
-        result = await db.execute(
-            select(User).where(User.team_id == user.team_id)
-        )
-        team_members = result.scalars().all()
-        error_msg = '; '.join(err['msg'] for err in e.errors())
-        return templates.TemplateResponse(
-            request,
-            'meeting/create_meeting.html',
-            {
-                'error': error_msg,
-                'user': user,
-                'team_members': team_members
-            }
-        )
+        return await form_error('; '.join(err['msg'] for err in e.errors()))
 
     if (
         meeting_data.team_id and
         user.team_id != meeting_data.team_id and
         user.role != 'admin'
     ):
-        result = await db.execute(
-            select(User).where(User.team_id == user.team_id)
+        return await form_error('Недостаточно прав для создания встречи')
+
+    meeting_team_id = meeting_data.team_id or user.team_id
+    participants = set(participant_ids)
+    try:
+        await meeting_crud.validate_participants(
+            db,
+            participants,
+            meeting_team_id
         )
-        team_members = result.scalars().all()
-        return templates.TemplateResponse(
-            request,
-            'meeting/create_meeting.html',
-            {
-                'error': 'Недостаточно прав для создания встречи',
-                'user': user,
-                'team_members': team_members
-            }
+    except HTTPException as e:
+        return await form_error(e.detail)
+
+    if add_all_team:
+        team_user_ids = await db.scalars(
+            select(User.id).where(User.team_id == meeting_team_id)
+        )
+        participants.update(team_user_ids.all())
+
+    if frequency:
+        conflicts = await find_series_conflicts(
+            db,
+            participants,
+            MeetingSeries(
+                starts_at=scheduled_dt,
+                duration_minutes=duration_minutes,
+                frequency=MeetingFrequency(frequency),
+                interval=1,
+                until=until_dt,
+                exceptions=[]
+            ),
+            scheduled_dt + timedelta(days=SERIES_CHECK_DAYS)
+        )
+    else:
+        conflicts = await find_conflicts(
+            db,
+            participants,
+            scheduled_dt,
+            scheduled_dt + timedelta(minutes=duration_minutes)
+        )
+    if conflicts and not allow_overlap:
+        return await form_error(overlap_error(conflicts))
+
+    if frequency:
+        await meeting_series.create_series(db, meeting_data, user)
+        return RedirectResponse(
+            url='/meetings?status=upcoming',
+            status_code=status.HTTP_303_SEE_OTHER
         )
 
     meeting = await meeting_crud.create_meeting(db, meeting_data, user)
@@ -265,6 +414,175 @@ async def create_meeting_submit(
     )
 
 
+@router.get('/free-slots', response_model=list[FreeSlot])
+async def free_slots(
+    user_ids: list[int] = Query(..., description='Участники встречи'),
+    start: datetime = Query(..., description='Начало периода поиска'),
+    end: datetime = Query(..., description='Конец периода поиска'),
+    duration_minutes: int = Query(
+        DEFAULT_DURATION_MINUTES,
+        ge=MIN_DURATION_MINUTES,
+        le=MAX_DURATION_MINUTES,
+        description='Длительность встречи в минутах'
+    ),
+    limit: int = Query(10, ge=1, le=100, description='Количество слотов'),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(require_role('manager', 'admin'))
+):
+    """
+    Свободные для всех участников интервалы в периоде
+    (участники должны состоять в команде, кроме запросов админов)
+    """
+    if end <= start or end - start > timedelta(days=MAX_SLOT_SEARCH_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                'Период поиска должен быть непустым '
+                f'и не длиннее {MAX_SLOT_SEARCH_DAYS} дней'
+            )
+        )
+    if (start.tzinfo is None) != (end.tzinfo is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Начало и конец периода должны быть в одном формате'
+        )
+
+    if user.role != 'admin':
+        await meeting_crud.validate_participants(
+            db,
+            set(user_ids),
+            user.team_id
+        )
+
+    return await find_free_slots(
+        db,
+        set(user_ids),
+        start,
+        end,
+        timedelta(minutes=duration_minutes),
+        limit
+    )
+
+
+@router.get('/feed/{token}.ics', response_class=Response)
+async def calendar_feed(
+    token: str,
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Календарь iCalendar со встречами и дедлайнами задач пользователя.
+    Доступ по подписанной ссылке из профиля, без входа в аккаунт.
+    Поддерживает If-None-Match и If-Modified-Since (ответ 304)
+    """
+    user = await get_feed_user(db, token)
+    return await feed_response(request, db, user)
+
+
+@router.post('/series', response_model=MeetingSeriesRead)
+async def create_series(
+    series_data: MeetingSeriesCreate,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(require_role('manager', 'admin'))
+):
+    """
+    Создать повторяющуюся встречу.
+    Правило и участники хранятся один раз, встречи серии
+    разворачиваются при чтении
+    """
+    if (
+        series_data.team_id and
+        user.team_id != series_data.team_id and
+        user.role != 'admin'
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail='Недостаточно прав для создания встречи'
+        )
+    return await meeting_series.create_series(db, series_data, user)
+
+
+@router.get('/series/{series_id}', response_model=MeetingSeriesRead)
+async def get_series(
+    series_id: int,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    """Получить серию встреч по id"""
+    return await check_series(db, series_id, user)
+
+
+@router.get(
+    '/series/{series_id}/occurrences',
+    response_model=list[MeetingOccurrenceRead]
+)
+async def get_series_occurrences(
+    series_id: int,
+    start: Optional[datetime] = Query(
+        None,
+        description='Встречи начиная с даты'
+    ),
+    end: Optional[datetime] = Query(
+        None,
+        description='Встречи до даты'
+    ),
+    limit: int = Query(
+        50,
+        ge=1,
+        le=MAX_OCCURRENCES,
+        description='Количество встреч'
+    ),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    """Встречи серии в [start, end) по возрастанию времени"""
+    series = await check_series(db, series_id, user)
+    occurrences = meeting_series.occurrence_times(series, start, end)
+    return [
+        MeetingOccurrenceRead(
+            series_id=series.id,
+            title=series.title,
+            scheduled_at=scheduled_at,
+            ends_at=scheduled_at + timedelta(
+                minutes=series.duration_minutes
+            )
+        )
+        for scheduled_at in islice(occurrences, limit)
+    ]
+
+
+@router.post(
+    '/series/{series_id}/exceptions',
+    response_model=MeetingSeriesRead
+)
+async def cancel_series_occurrence(
+    series_id: int,
+    exception_data: MeetingSeriesExceptionCreate,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(require_role('manager', 'admin'))
+):
+    """Отменить одну встречу серии, остальные остаются в расписании"""
+    series = await check_series(db, series_id, user)
+    return await meeting_series.cancel_occurrence(
+        db,
+        series,
+        exception_data.occurs_at
+    )
+
+
+@router.delete('/series/{series_id}')
+async def delete_series(
+    series_id: int,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(require_role('manager', 'admin'))
+):
+    """Удалить серию вместе со всеми ее встречами"""
+    series = await check_series(db, series_id, user)
+
+    await meeting_series.delete_series(db, series)
+    return {'detail': f'Серия встреч {series_id} удалена'}
+
+
 @router.get('/{meeting_id}')
 async def meeting_detail_page(
     meeting_id: int,
@@ -355,6 +673,16 @@ async def edit_meeting_submit(
         ...,
         description=f'Введите дату, пример: {datetime.now()}'
     ),
+    duration_minutes: int = Form(
+        DEFAULT_DURATION_MINUTES,
+        ge=MIN_DURATION_MINUTES,
+        le=MAX_DURATION_MINUTES,
+        description='Длительность встречи в минутах'
+    ),
+    allow_overlap: bool = Form(
+        False,
+        description='Сохранить, даже если участники заняты'
+    ),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(require_role('manager', 'admin'))
 ):
@@ -374,19 +702,23 @@ async def edit_meeting_submit(
             }
         )
 
-    conflict_query = await db.execute(
-        select(Meeting)
-        .where(Meeting.team_id == user.team_id)
-        .where(Meeting.scheduled_at == scheduled_dt)
+    participants = await db.scalars(
+        select(MeetingParticipant.user_id)
+        .where(MeetingParticipant.meeting_id == meeting.id)
     )
-    conflict_meeting = conflict_query.scalars().first()
-
-    if conflict_meeting:
+    conflicts = await find_conflicts(
+        db,
+        set(participants.all()),
+        scheduled_dt,
+        scheduled_dt + timedelta(minutes=duration_minutes),
+        exclude_meeting_id=meeting.id
+    )
+    if conflicts and not allow_overlap:
         return templates.TemplateResponse(
             request,
             'meeting/edit_meeting.html',
             {
-                'error': 'На это время уже назначена встреча',
+                'error': overlap_error(conflicts),
                 'user': user,
                 'meeting': meeting
             }
@@ -396,7 +728,8 @@ async def edit_meeting_submit(
         meeting_data = MeetingUpdate(
             title=title,
             description=description,
-            scheduled_at=scheduled_dt
+            scheduled_at=scheduled_dt,
+            duration_minutes=duration_minutes
         )
     except ValidationError as e:
         error_msg = '; '.join(err['msg'] for err in e.errors())
@@ -410,7 +743,7 @@ async def edit_meeting_submit(
             }
         )
 
-    await meeting_crud.update_meeting(db, meeting, meeting_data)
+    await meeting_crud.update_meeting(db, meeting.id, meeting_data)
     return RedirectResponse(
         url=f'/meetings/{meeting_id}',
         status_code=status.HTTP_303_SEE_OTHER
@@ -448,61 +781,80 @@ async def create_meeting(
     return await meeting_crud.create_meeting(db, meeting_data, user)
 
 
+@router.get('/admin/export')
+async def export_meetings(
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+    _: User = Depends(require_role('admin')),
+    filters: MeetingFilters = Depends(),
+    export_format: ExportFormat = Query(
+        ExportFormat.ndjson,
+        alias='format',
+        description='Формат выгрузки'
+    ),
+):
+    """
+    Потоковая выгрузка всех встреч с участниками и фильтрами списка
+    (доступно только админам)
+    """
+    stmt = filters.apply(select(Meeting)).order_by(Meeting.id)
+    return export_response(
+        session_factory,
+        stmt,
+        MeetingRead,
+        export_format,
+        'meetings',
+        options=[selectinload(Meeting.participants)]
+    )
+
+
 @router.get('/admin/all', response_model=list[MeetingRead])
 async def get_all_meetings(
+    response: Response,
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_role('admin')),
-    team_id: Optional[int] = Query(None, description='Фильтрация по команде'),
-    organizer_id: Optional[int] = Query(
-        None,
-        description='Фильтрация по организатору'
-    ),
-    scheduled_before: Optional[datetime] = Query(
-        None,
-        description='Встречи до даты'
-    ),
-    scheduled_after: Optional[datetime] = Query(
-        None,
-        description='Встречи после даты'
-    ),
+    filters: MeetingFilters = Depends(),
     limit: int = Query(10, ge=1, le=100, description='Количество записей'),
     offset: int = Query(0, ge=0, description='Смещение'),
+    cursor: Optional[str] = Query(None, description='Курсор страницы'),
 ):
     """
     Получить список всех встреч
     (доступно только админам)
     """
-    stmt = select(Meeting).options(selectinload(Meeting.participants))
-
-    if team_id:
-        stmt = stmt.where(Meeting.team_id == team_id)
-    if organizer_id:
-        stmt = stmt.where(Meeting.organizer_id == organizer_id)
-    if scheduled_before:
-        stmt = stmt.where(Meeting.scheduled_at <= scheduled_before)
-    if scheduled_after:
-        stmt = stmt.where(Meeting.scheduled_at >= scheduled_after)
+    stmt = filters.apply(
+        select(Meeting).options(selectinload(Meeting.participants))
+    )
 
-    stmt = stmt.limit(limit).offset(offset)
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    page = await paginate(
+        db,
+        stmt,
+        [Meeting.id],
+        limit,
+        cursor=cursor,
+        offset=offset
+    )
+    set_cursor_headers(response, page)
+    return page.items
 
 
 @router.get('/admin/{meeting_id}', response_model=MeetingRead)
 async def get_meeting_by_id(
     meeting_id: int,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(require_role('admin'))
 ):
     """Получить встречу по id"""
     meeting = await check_meeting(db, meeting_id, user)
 
+    set_etag(response, meeting)
     return meeting
 
 
-@router.get('/admin/{team_id}', response_model=list[MeetingRead])
+@router.get('/admin/team/{team_id}', response_model=list[MeetingRead])
 async def get_meetings_by_team(
     team_id: int,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_role('admin')),
     organizer_id: Optional[int] = Query(
@@ -519,6 +871,7 @@ async def get_meetings_by_team(
     ),
     limit: int = Query(10, ge=1, le=100, description='Количество записей'),
     offset: int = Query(0, ge=0, description='Смещение'),
+    cursor: Optional[str] = Query(None, description='Курсор страницы'),
 ):
     """Получить встречи для команды"""
     stmt = (
@@ -534,25 +887,49 @@ async def get_meetings_by_team(
     if scheduled_after:
         stmt = stmt.where(Meeting.scheduled_at >= scheduled_after)
 
-    stmt = stmt.limit(limit).offset(offset)
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    page = await paginate(
+        db,
+        stmt,
+        [Meeting.id],
+        limit,
+        cursor=cursor,
+        offset=offset
+    )
+    set_cursor_headers(response, page)
+    return page.items
 
 
 @router.put('/admin/{meeting_id}', response_model=MeetingRead)
 async def update_meeting(
     meeting_id: int,
     meeting_data: MeetingUpdate,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role('admin')),
+    _: User = Depends(require_role('admin')),
+    versions: Optional[list[int]] = Depends(if_match_versions),
 ):
     """
-    Изменить встречу по id
+    Изменить встречу по id.
+    С заголовком If-Match изменение применяется, только если встреча
+    не менялась с момента чтения, иначе 412
     (доступно толькои админам)
     """
-    meeting = await check_meeting(db, meeting_id, user)
+    meeting = await meeting_crud.update_meeting(
+        db,
+        meeting_id,
+        meeting_data,
+        versions
+    )
+    if meeting is None:
+        await raise_update_failed(
+            db,
+            Meeting,
+            meeting_id,
+            'Встреча не найдена'
+        )
 
-    return await meeting_crud.update_meeting(db, meeting, meeting_data)
+    set_etag(response, meeting)
+    return meeting
 
 
 @router.delete('/admin/{meeting_id}')
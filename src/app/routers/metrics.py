@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends
+
+from src.app.database import (
+    engine,
+    pool_metrics,
+    replica_engine,
+    replica_pool_metrics
+)
+from src.app.auth.dependencies import require_role
+from src.app.auth.password_pool import password_pool
+from src.app.auth.rate_limit import rate_limit_stats
+from src.app.models.user import User
+
+router = APIRouter(prefix='/metrics', tags=['metrics'])
+
+
+@router.get('/pool')
+async def pool_stats(_: User = Depends(require_role('admin'))):
+    """Состояние и счетчики пула соединений с БД"""
+    data = pool_metrics.snapshot(engine.sync_engine.pool)
+    if replica_pool_metrics is not None:
+        data['replica'] = replica_pool_metrics.snapshot(
+            replica_engine.sync_engine.pool
+        )
+    return data
+
+
+@router.get('/auth')
+async def auth_stats(_: User = Depends(require_role('admin'))):
+    """Счетчики пула хеширования паролей и ограничителей входа"""
+    return {
+        'password_pool': password_pool.stats(),
+        'rate_limits': rate_limit_stats(),
+    }
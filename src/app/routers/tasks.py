@@ -1,3 +1,5 @@
+import csv
+import io
 from typing import Optional
 from datetime import datetime
 
@@ -8,21 +10,52 @@ from fastapi import (
     status,
     Query,
     Request,
-    Form
+    Response,
+    Form,
+    File,
+    UploadFile
 )
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import RedirectResponse
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 from pydantic import ValidationError
 
-from src.app.schemas.task import TaskRead, TaskCreate, TaskUpdate
-from src.app.database import get_db
+from src.app.schemas.task import (
+    TaskRead,
+    TaskCreate,
+    TaskUpdate,
+    TaskImportReport,
+    TaskSearchRead,
+    TaskStatusBatch,
+    TaskStatusBatchResult
+)
+from src.app.database import get_db, get_session_factory
 from src.app.auth.dependencies import get_current_user, require_role
 from src.app.models.user import User
 from src.app.models.task import TaskStatus, Task
-from src.app.services import task_crud
+from src.app.services import (
+    task_crud,
+    task_import,
+    task_search,
+    task_service
+)
+from src.app.config import settings
+from src.app.services.pagination import (
+    CountMode,
+    paginate,
+    count_rows,
+    cursor_url,
+    set_cursor_headers
+)
+from src.app.services.filters import TaskFilters
+from src.app.services.export import ExportFormat, export_response
+from src.app.services.versioning import (
+    if_match_versions,
+    raise_update_failed,
+    set_etag
+)
 
 router = APIRouter(prefix='/tasks', tags=['tasks'])
 templates = Jinja2Templates(directory='src/app/templates')
@@ -57,8 +90,11 @@ async def tasks_page(
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
     page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
-    my_tasks: bool = Query(False)
+    my_tasks: bool = Query(False),
+    count: Optional[CountMode] = Query(None),
+    q: Optional[str] = Query(None)
 ):
     """Страница со списком задач"""
     limit = 10
@@ -68,10 +104,6 @@ async def tasks_page(
         .where(Task.team_id == user.team_id)
         .options(selectinload(Task.performer))
     )
-    count_query = (
-        select(func.count(Task.id))
-        .where(Task.team_id == user.team_id)
-    )
     status_enum = None
     if status:
         try:
@@ -81,25 +113,60 @@ async def tasks_page(
 
     if status_enum:
         query = query.where(Task.status == status_enum)
-        count_query = count_query.where(Task.status == status_enum)
 
     if my_tasks:
         query = query.where(Task.performer_id == user.id)
-        count_query = count_query.where(Task.performer_id == user.id)
 
-    total_tasks = await db.scalar(count_query)
-    total_pages = max((total_tasks + limit - 1) // limit, 1)
-
-    query = query.offset(offset).limit(limit)
-    tasks = (await db.execute(query)).scalars().all()
+    terms = task_search.search_terms(q)
+    snippets = {}
+    if terms:
+        total_tasks = await count_rows(
+            db,
+            task_search.matching_tasks(db, query, terms),
+            count or settings.TASKS_PAGE_COUNT
+        )
+        tasks_result = await task_search.search_tasks(
+            db,
+            query,
+            terms,
+            limit,
+            cursor=cursor,
+            offset=offset
+        )
+        tasks = [hit.task for hit in tasks_result.items]
+        snippets = {hit.task.id: hit.snippet for hit in tasks_result.items}
+    else:
+        total_tasks = await count_rows(
+            db,
+            query,
+            count or settings.TASKS_PAGE_COUNT,
+            cache_key=(
+                'tasks',
+                user.team_id,
+                status_enum,
+                user.id if my_tasks else None
+            )
+        )
+        tasks_result = await paginate(
+            db,
+            query,
+            [Task.id],
+            limit,
+            cursor=cursor,
+            offset=offset
+        )
+        tasks = tasks_result.items
 
     return templates.TemplateResponse(
         request,
         'task/tasks.html',
         {
             'tasks': tasks,
-            'page': page,
-            'total_pages': total_pages,
+            'snippets': snippets,
+            'q': q or '',
+            'total_tasks': total_tasks,
+            'next_url': cursor_url(request, tasks_result.next_cursor),
+            'prev_url': cursor_url(request, tasks_result.prev_cursor),
             'status': status or '',
             'my_tasks': my_tasks,
             'user': user
@@ -314,6 +381,29 @@ async def update_task_status(
     )
 
 
+@router.post('/status/batch', response_model=TaskStatusBatchResult)
+async def update_tasks_status(
+    data: TaskStatusBatch,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user)
+):
+    """
+    Изменение статуса нескольких задач.
+    Возвращает id измененных задач и причины пропуска остальных
+    """
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail='Unauthorized'
+        )
+    return await task_service.change_tasks_status(
+        db,
+        data.task_ids,
+        data.status,
+        user
+    )
+
+
 @router.get('/{task_id}/edit')
 async def edit_task_page(
     task_id: int,
@@ -423,7 +513,7 @@ async def edit_task_submit(
             }
         )
 
-    await task_crud.update_task(db, task, task_data)
+    await task_crud.update_task(db, task.id, task_data)
 
     return RedirectResponse(
         url=f'/tasks/{task_id}',
@@ -468,52 +558,137 @@ async def create_task(
     return await task_crud.create_task(db, task_data)
 
 
-@router.get('/admin/{team_id}', response_model=list[TaskRead])
-async def get_tasks_by_team(
-    team_id: int,
-    db: AsyncSession = Depends(get_db),
-    _: User = Depends(require_role('admin')),
-    task_status: Optional[TaskStatus] = Query(
-        None,
-        description='Фильтраци по статусу задачи'
-    ),
-    performer_id: Optional[int] = Query(
+@router.post('/admin/import', response_model=TaskImportReport)
+async def import_tasks(
+    file: UploadFile = File(..., description='CSV или JSON lines файл'),
+    import_format: Optional[ExportFormat] = Query(
         None,
-        description='Фильтрация по пользователю'
-    ),
-    deadline_before: Optional[datetime] = Query(
-        None,
-        description='Дедлайн до даты'
+        alias='format',
+        description='Формат файла (по умолчанию по расширению)'
     ),
-    deadline_after: Optional[datetime] = Query(
-        None,
-        description='Дедлайн после даты'
+    db: AsyncSession = Depends(get_db),
+    _: User = Depends(require_role('admin')),
+):
+    """
+    Массовый импорт задач из CSV или JSON lines.
+    Корректные строки вставляются одной транзакцией,
+    для остальных возвращается отчет об ошибках
+    (доступно только админам)
+    """
+    if import_format is None:
+        import_format = (
+            ExportFormat.csv
+            if (file.filename or '').lower().endswith('.csv')
+            else ExportFormat.ndjson
+        )
+
+    lines = io.TextIOWrapper(file.file, encoding='utf-8-sig', newline='')
+    try:
+        return await task_import.import_tasks(db, lines, import_format)
+    except (UnicodeDecodeError, csv.Error):
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Не удалось прочитать файл'
+        )
+    finally:
+        lines.detach()
+
+
+@router.get('/admin/export')
+async def export_tasks(
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+    _: User = Depends(require_role('admin')),
+    filters: TaskFilters = Depends(),
+    export_format: ExportFormat = Query(
+        ExportFormat.ndjson,
+        alias='format',
+        description='Формат выгрузки'
     ),
-    limit: int = Query(10, ge=1, le=100, description='Количество записей'),
-    offset: int = Query(0, ge=0, description='Смещение'),
 ):
     """
-    Получить задачи для команды
+    Потоковая выгрузка всех задач с фильтрами списка
     (доступно только админам)
     """
-    stmt = select(Task).where(Task.team_id == team_id)
+    stmt = filters.apply(select(Task)).order_by(Task.id)
+    return export_response(
+        session_factory,
+        stmt,
+        TaskRead,
+        export_format,
+        'tasks'
+    )
 
-    if task_status:
-        stmt = stmt.where(Task.status == task_status)
-    if performer_id:
-        stmt = stmt.where(Task.performer_id == performer_id)
-    if deadline_before:
-        stmt = stmt.where(Task.deadline_date <= deadline_before)
-    if deadline_after:
-        stmt = stmt.where(Task.deadline_date >= deadline_after)
 
-    stmt = stmt.limit(limit).offset(offset)
-    result = await db.execute(stmt)
-    return result.scalars().all()
+@router.get('/admin/search', response_model=list[TaskSearchRead])
+async def search_tasks(
+    response: Response,
+    q: str = Query(..., min_length=1, description='Поисковый запрос'),
+    db: AsyncSession = Depends(get_db),
+    _: User = Depends(require_role('admin')),
+    filters: TaskFilters = Depends(),
+    limit: int = Query(10, ge=1, le=100, description='Количество записей'),
+    cursor: Optional[str] = Query(None, description='Курсор страницы'),
+):
+    """
+    Полнотекстовый поиск задач по названию и описанию
+    с сортировкой по релевантности
+    (доступно только админам)
+    """
+    terms = task_search.search_terms(q)
+    if not terms:
+        return []
+
+    page = await task_search.search_tasks(
+        db,
+        filters.apply(select(Task)),
+        terms,
+        limit,
+        cursor=cursor
+    )
+    set_cursor_headers(response, page)
+    return [
+        TaskSearchRead(
+            **TaskRead.model_validate(hit.task).model_dump(),
+            rank=hit.rank,
+            snippet=hit.snippet
+        )
+        for hit in page.items
+    ]
 
 
 @router.get('/admin/all', response_model=list[TaskRead])
 async def get_all_tasks(
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    _: User = Depends(require_role('admin')),
+    filters: TaskFilters = Depends(),
+    limit: int = Query(10, ge=1, le=100, description='Количество записей'),
+    offset: int = Query(0, ge=0, description='Смещение'),
+    cursor: Optional[str] = Query(None, description='Курсор страницы'),
+):
+    """
+    Получить список всех задач
+    (доступно только админам)
+    """
+    stmt = filters.apply(select(Task))
+
+    page = await paginate(
+        db,
+        stmt,
+        [Task.id],
+        limit,
+        cursor=cursor,
+        offset=offset
+    )
+    set_cursor_headers(response, page)
+    return page.items
+
+
+@router.get('/admin/team/{team_id}', response_model=list[TaskRead])
+async def get_tasks_by_team(
+    team_id: int,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_role('admin')),
     task_status: Optional[TaskStatus] = Query(
@@ -524,7 +699,6 @@ async def get_all_tasks(
         None,
         description='Фильтрация по пользователю'
     ),
-    team_id: Optional[int] = Query(None, description='Фильрация по команде'),
     deadline_before: Optional[datetime] = Query(
         None,
         description='Дедлайн до даты'
@@ -535,32 +709,39 @@ async def get_all_tasks(
     ),
     limit: int = Query(10, ge=1, le=100, description='Количество записей'),
     offset: int = Query(0, ge=0, description='Смещение'),
+    cursor: Optional[str] = Query(None, description='Курсор страницы'),
 ):
     """
-    Получить список всех задач
+    Получить задачи для команды
     (доступно только админам)
     """
-    stmt = select(Task)
+    stmt = select(Task).where(Task.team_id == team_id)
 
     if task_status:
         stmt = stmt.where(Task.status == task_status)
     if performer_id:
         stmt = stmt.where(Task.performer_id == performer_id)
-    if team_id:
-        stmt = stmt.where(Task.team_id == team_id)
     if deadline_before:
         stmt = stmt.where(Task.deadline_date <= deadline_before)
     if deadline_after:
         stmt = stmt.where(Task.deadline_date >= deadline_after)
 
-    stmt = stmt.limit(limit).offset(offset)
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    page = await paginate(
+        db,
+        stmt,
+        [Task.id],
+        limit,
+        cursor=cursor,
+        offset=offset
+    )
+    set_cursor_headers(response, page)
+    return page.items
 
 
 @router.get('/admin/{task_id}', response_model=TaskRead)
 async def get_task(
     task_id: int,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(require_role('admin')),
 ):
@@ -570,6 +751,7 @@ async def get_task(
     """
     task = await check_task(db, task_id, user)
 
+    set_etag(response, task)
     return task
 
 
@@ -577,16 +759,23 @@ async def get_task(
 async def update_task(
     task_id: int,
     task_data: TaskUpdate,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(require_role('admin')),
+    _: User = Depends(require_role('admin')),
+    versions: Optional[list[int]] = Depends(if_match_versions),
 ):
     """
-    Изменить задачу по id
+    Изменить задачу по id.
+    С заголовком If-Match изменение применяется, только если задача
+    не менялась с момента чтения, иначе 412
     (доступно только админам)
     """
-    task = await check_task(db, task_id, user)
+    task = await task_crud.update_task(db, task_id, task_data, versions)
+    if task is None:
+        await raise_update_failed(db, Task, task_id, 'Задача не найдена')
 
-    return await task_crud.update_task(db, task=task, task_data=task_data)
+    set_etag(response, task)
+    return task
 
 
 @router.delete('/admin/{task_id}')
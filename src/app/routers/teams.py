@@ -7,6 +7,7 @@ from fastapi import (
     status,
     Query,
     Request,
+    Response,
     Form
 )
 from fastapi.templating import Jinja2Templates
@@ -21,6 +22,8 @@ from src.app.models.user import User
 from src.app.models.team import Team, generate_team_code
 from src.app.auth.dependencies import get_current_user, require_role
 from src.app.services import team_crud, evaluation_service
+from src.app.services.filters import TeamFilters
+from src.app.services.pagination import paginate, set_cursor_headers
 
 
 router = APIRouter(prefix='/teams', tags=['teams'])
@@ -91,7 +94,6 @@ async def create_team_submit(
         user.role = 'manager'
 
     new_team = await team_crud.create_team(db, TeamCreate(name=name))
-    user = await db.merge(user)
     user.team_id = new_team.id
 
     await db.commit()
@@ -116,7 +118,7 @@ async def leave_team(
             detail='Вы не состоите в команде'
         )
 
-    user = await db.merge(current_user)
+    user = current_user
     team = await check_team(db, user.team_id, user)
 
     user.team_id = None
@@ -184,7 +186,7 @@ async def join_team(
             {'error': error}
         )
 
-    user = await db.merge(current_user)
+    user = current_user
     user.team_id = team.id
     db.add(user)
     await db.commit()
@@ -469,31 +471,30 @@ async def downgrade_manager_to_user(
 # Маршруты для администраторов
 @router.get('/admin/all', response_model=list[TeamRead])
 async def get_all_teams(
+    response: Response,
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_role('admin')),
-    name: Optional[str] = Query(
-        None,
-        description='Фильтрация по названию команды'
-    ),
-    code: Optional[str] = Query(None, description='Филтрация по коду команды'),
+    filters: TeamFilters = Depends(),
     limit: int = Query(10, ge=1, le=100, description='Количество записей'),
-    offset: int = Query(0, ge=0, description='Смещение')
+    offset: int = Query(0, ge=0, description='Смещение'),
+    cursor: Optional[str] = Query(None, description='Курсор страницы')
 ):
     """
     Получение списка всех команд
     (доступно только админам)
     """
-    stmt = select(Team)
-
-    if name:
-        stmt = stmt.where(Team.name.ilike(f'%{name}'))
-    if code:
-        stmt = stmt.where(Team.code.ilike(f'%{code}'))
-
-    stmt = stmt.limit(limit).offset(offset)
-
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    stmt = filters.apply(select(Team))
+
+    page = await paginate(
+        db,
+        stmt,
+        [Team.id],
+        limit,
+        cursor=cursor,
+        offset=offset
+    )
+    set_cursor_headers(response, page)
+    return page.items
 
 
 @router.get('/admin/{team_id}', response_model=TeamRead)
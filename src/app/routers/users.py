@@ -8,21 +8,32 @@ from fastapi import (
     status,
     Query,
     Request,
+    Response,
     Form
 )
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.templating import Jinja2Templates
 from fastapi.responses import RedirectResponse
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy import select
 
-from src.app.database import get_db
+from src.app.database import get_db, get_session_factory
 from src.app.config import settings
 from src.app.models.user import User, UserRole
 from src.app.schemas.user import UserRead, UserUpdate
 from src.app.auth.dependencies import get_current_user, require_role
 from src.app.auth.user_manager import get_user_manager, UserManager
+from src.app.auth.auth import (
+    access_backend,
+    refresh_backend,
+    REFRESH_TOKEN_LIFETIME
+)
+from src.app.auth.revocation import revocation_store
 from src.app.services import evaluation_service
+from src.app.services.calendar_feed import feed_token
+from src.app.services.pagination import paginate, set_cursor_headers
+from src.app.services.filters import UserFilters
+from src.app.services.export import ExportFormat, export_response
 
 router = APIRouter(prefix='/users', tags=['users'])
 templates = Jinja2Templates(directory='src/app/templates')
@@ -56,7 +67,15 @@ async def profile_page(
     return templates.TemplateResponse(
         request,
         'profile/profile.html',
-        {'user': user, 'message': message, 'avg_grade': avg_grade}
+        {
+            'user': user,
+            'message': message,
+            'avg_grade': avg_grade,
+            'calendar_url': request.url_for(
+                'calendar_feed',
+                token=feed_token(user)
+            )
+        }
     )
 
 
@@ -212,16 +231,31 @@ async def change_password(
             {'error': error, 'message': None}
         )
 
-    user = await db.merge(user)
-    user.hashed_password = user_manager.password_helper.hash(new_password)
+    user.hashed_password = await user_manager.hash_password(new_password)
     db.add(user)
+    await revocation_store.revoke_user(db, user.id, REFRESH_TOKEN_LIFETIME)
     await db.commit()
     await db.refresh(user)
 
-    return RedirectResponse(
+    # Ранее выпущенные токены отозваны, текущая сессия получает новые
+    access_token = await access_backend.get_strategy().write_token(user)
+    refresh_token = await refresh_backend.get_strategy().write_token(user)
+
+    response = RedirectResponse(
         url='/users/profile?message=Пароль успешно изменен',
         status_code=status.HTTP_303_SEE_OTHER
     )
+    response.set_cookie(
+        key='access_token',
+        value=f'Bearer {access_token}',
+        httponly=True
+    )
+    response.set_cookie(
+        key='refresh_token',
+        value=f'Bearer {refresh_token}',
+        httponly=True
+    )
+    return response
 
 
 @router.get('/admin')
@@ -272,7 +306,6 @@ async def submit_secret_key(
             status_code=status.HTTP_303_SEE_OTHER
         )
 
-    user = await db.merge(user)
     user.role = 'admin'
     db.add(user)
     await db.commit()
@@ -285,38 +318,56 @@ async def submit_secret_key(
 
 
 # Маршруты для администраторов
+@router.get('/admin/export')
+async def export_users(
+    session_factory: async_sessionmaker = Depends(get_session_factory),
+    _: User = Depends(require_role('admin')),
+    filters: UserFilters = Depends(),
+    export_format: ExportFormat = Query(
+        ExportFormat.ndjson,
+        alias='format',
+        description='Формат выгрузки'
+    ),
+):
+    """
+    Потоковая выгрузка всех пользователей с фильтрами списка
+    (доступно только админам)
+    """
+    stmt = filters.apply(select(User)).order_by(User.id)
+    return export_response(
+        session_factory,
+        stmt,
+        UserRead,
+        export_format,
+        'users'
+    )
+
+
 @router.get('/admin/all', response_model=list[UserRead])
 async def get_all_users(
+    response: Response,
     db: AsyncSession = Depends(get_db),
     _: User = Depends(require_role('admin')),
-    email: Optional[str] = Query(None, description="Фильтрация по email"),
-    role: Optional[UserRole] = Query(None, description='Филтрация по роли'),
-    team_id: Optional[int] = Query(None, description='Фильтрация по команде'),
-    is_active: Optional[bool] = Query(
-        None,
-        description='Фильтрация по статусу'
-    ),
+    filters: UserFilters = Depends(),
     limit: int = Query(10, ge=1, le=100, description='Количество записей'),
-    offset: int = Query(0, ge=0, description='Смещение')
+    offset: int = Query(0, ge=0, description='Смещение'),
+    cursor: Optional[str] = Query(None, description='Курсор страницы')
 ):
     """
     Получить всех пользователей
     """
-    stmt = select(User)
-
-    if email:
-        stmt = stmt.where(User.email.ilike(f'%{email}'))
-    if role:
-        stmt = stmt.where(User.role == role)
-    if team_id is not None:
-        stmt = stmt.where(User.team_id == team_id)
-    if is_active is not None:
-        stmt = stmt.where(User.is_active == is_active)
-
-    stmt = stmt.limit(limit).offset(offset)
-
-    result = await db.execute(stmt)
-    return result.scalars().all()
+    stmt = filters.apply(select(User))
+
+    page = await paginate(
+        db,
+        stmt,
+        [User.id],
+        limit,
+        cursor=cursor,
+        offset=offset
+    )
+    set_cursor_headers(response, page)
+    return page.items
 
 
 @router.get('/admin/{user_id}', response_model=UserRead)
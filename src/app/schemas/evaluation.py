@@ -24,6 +24,7 @@ class EvaluationRead(EvaluationBase):
     """Схема для получения данных оценки"""
     id: int
     created_at: datetime
+    version: int
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -1,10 +1,24 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator
+)
 from pydantic_core import PydanticCustomError
 
+from src.app.models.meeting import DEFAULT_DURATION_MINUTES
+from src.app.models.meeting_series import MeetingFrequency
+
 MSK = timezone(timedelta(hours=3))
+# Допустимая длительность встречи в минутах
+MIN_DURATION_MINUTES = 5
+MAX_DURATION_MINUTES = 24 * 60
+# Наибольший шаг повторения серии (в днях, неделях или месяцах)
+MAX_SERIES_INTERVAL = 52
 
 
 class MeetingParticipantBase(BaseModel):
@@ -29,6 +43,11 @@ class MeetingBase(BaseModel):
     title: str
     description: Optional[str] = None
     scheduled_at: datetime
+    duration_minutes: int = Field(
+        DEFAULT_DURATION_MINUTES,
+        ge=MIN_DURATION_MINUTES,
+        le=MAX_DURATION_MINUTES
+    )
     organizer_id: Optional[int] = None
     team_id: Optional[int] = None
     participants: Optional[List[MeetingParticipantRead]] = []
@@ -52,7 +71,10 @@ class MeetingCreate(MeetingBase):
 class MeetingRead(MeetingBase):
     """Схема для получения данных встречи"""
     id: int
+    ends_at: datetime
     created_at: datetime
+    updated_at: datetime
+    version: int
     participants: list[MeetingParticipantRead] = []
 
     model_config = ConfigDict(from_attributes=True)
@@ -63,6 +85,11 @@ class MeetingUpdate(MeetingBase):
     title: Optional[str] = None
     description: Optional[str] = None
     scheduled_at: Optional[datetime] = None
+    duration_minutes: Optional[int] = Field(
+        None,
+        ge=MIN_DURATION_MINUTES,
+        le=MAX_DURATION_MINUTES
+    )
     participants: Optional[List[MeetingParticipantCreate]] = None
 
     @field_validator('scheduled_at')
@@ -73,3 +100,85 @@ class MeetingUpdate(MeetingBase):
                 'Дата встречи не может быть в прошлом'
             )
         return value
+
+
+class FreeSlot(BaseModel):
+    """Свободный для всех участников интервал"""
+    start: datetime
+    end: datetime
+
+
+class MeetingSeriesCreate(BaseModel):
+    """Схема для создания повторяющейся встречи"""
+    title: str
+    description: Optional[str] = None
+    starts_at: datetime
+    duration_minutes: int = Field(
+        DEFAULT_DURATION_MINUTES,
+        ge=MIN_DURATION_MINUTES,
+        le=MAX_DURATION_MINUTES
+    )
+    frequency: MeetingFrequency
+    interval: int = Field(1, ge=1, le=MAX_SERIES_INTERVAL)
+    until: Optional[datetime] = None
+    team_id: Optional[int] = None
+    participants_id: Optional[List[int]] = []
+    add_team_members: bool = False
+
+    @field_validator('starts_at')
+    def validate_starts_at(cls, value: datetime) -> datetime:
+        if value < datetime.now(MSK).replace(tzinfo=None):
+            raise PydanticCustomError(
+                'incorrect_date',
+                'Дата встречи не может быть в прошлом'
+            )
+        return value
+
+    @model_validator(mode='after')
+    def validate_until(self) -> 'MeetingSeriesCreate':
+        if self.until is not None and self.until < self.starts_at:
+            raise PydanticCustomError(
+                'incorrect_date',
+                'Окончание серии раньше первой встречи'
+            )
+        return self
+
+
+class MeetingSeriesExceptionRead(BaseModel):
+    """Схема отмененной встречи серии"""
+    occurs_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MeetingSeriesExceptionCreate(MeetingSeriesExceptionRead):
+    """Схема для отмены одной встречи серии"""
+    pass
+
+
+class MeetingSeriesRead(BaseModel):
+    """Схема для получения данных повторяющейся встречи"""
+    id: int
+    title: str
+    description: Optional[str] = None
+    starts_at: datetime
+    duration_minutes: int
+    frequency: MeetingFrequency
+    interval: int
+    until: Optional[datetime] = None
+    organizer_id: int
+    team_id: int
+    created_at: datetime
+    updated_at: datetime
+    participants: list[MeetingParticipantRead] = []
+    exceptions: list[MeetingSeriesExceptionRead] = []
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MeetingOccurrenceRead(BaseModel):
+    """Схема встречи серии"""
+    series_id: int
+    title: str
+    scheduled_at: datetime
+    ends_at: datetime
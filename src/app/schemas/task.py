@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from pydantic_core import PydanticCustomError
 
 from src.app.models.task import TaskStatus
@@ -42,10 +42,17 @@ class TaskRead(TaskBase):
     id: int
     created_at: datetime
     updated_at: datetime
+    version: int
 
     model_config = ConfigDict(from_attributes=True)
 
 
+class TaskSearchRead(TaskRead):
+    """Схема найденной задачи с рангом и сниппетом (совпадения в <mark>)"""
+    rank: float
+    snippet: str
+
+
 class TaskUpdate(BaseModel):
     """Схема для обновления данных задачи"""
     title: Optional[str] = None
@@ -66,3 +73,34 @@ class TaskUpdate(BaseModel):
                 'Дата дедлайна не может быть в прошлом'
             )
         return value
+
+
+class TaskImportError(BaseModel):
+    """Ошибки строки файла импорта задач"""
+    line: int
+    errors: list[str]
+
+
+class TaskImportReport(BaseModel):
+    """Результат импорта задач"""
+    total: int
+    imported: int
+    errors: list[TaskImportError] = []
+
+
+class TaskStatusBatch(BaseModel):
+    """Схема для изменения статуса нескольких задач"""
+    task_ids: list[int] = Field(min_length=1, max_length=1000)
+    status: TaskStatus
+
+
+class TaskStatusSkip(BaseModel):
+    """Задача, статус которой не изменен, и причина"""
+    id: int
+    reason: str
+
+
+class TaskStatusBatchResult(BaseModel):
+    """Результат изменения статуса нескольких задач"""
+    updated: list[int]
+    skipped: list[TaskStatusSkip] = []
@@ -0,0 +1,409 @@
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, UTC
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable
+
+import jwt
+from fastapi import HTTPException, Request, Response, status
+from fastapi_users.jwt import decode_jwt, generate_jwt
+from sqlalchemy import func, literal, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.app.config import settings
+from src.app.models.meeting import Meeting
+from src.app.models.meeting_participants import MeetingParticipant
+from src.app.models.meeting_series import (
+    MeetingSeries,
+    MeetingSeriesParticipant
+)
+from src.app.models.task import Task, TaskStatus
+from src.app.models.user import User
+
+FEED_AUDIENCE = 'management:calendar-feed'
+MEDIA_TYPE = 'text/calendar; charset=utf-8'
+# Меняется вместе с форматом ленты, чтобы сбросить ETag клиентов
+FEED_FORMAT_VERSION = 1
+# Длина строки iCalendar в октетах без CRLF (RFC 5545, 3.1)
+LINE_LIMIT = 75
+_UID_DOMAIN = 'management-platform'
+
+
+def _password_fingerprint(user: User) -> str:
+    """Смена пароля делает старые ссылки на ленту недействительными"""
+    return hashlib.sha256(user.hashed_password.encode()).hexdigest()[:16]
+
+
+def feed_token(user: User) -> str:
+    """Бессрочный подписанный токен ссылки на календарь пользователя"""
+    return generate_jwt(
+        {
+            'sub': str(user.id),
+            'aud': FEED_AUDIENCE,
+            'pwd': _password_fingerprint(user)
+        },
+        settings.SECRET,
+        None
+    )
+
+
+async def get_feed_user(db: AsyncSession, token: str) -> User:
+    """Пользователь по токену ленты, 404 для неверного токена"""
+    not_found = HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail='Календарь не найден'
+    )
+    try:
+        data = decode_jwt(token, settings.SECRET, [FEED_AUDIENCE])
+        user_id = int(data['sub'])
+    except (jwt.PyJWTError, KeyError, ValueError):
+        raise not_found
+
+    user = await db.get(User, user_id)
+    if (
+        user is None
+        or not user.is_active
+        or data.get('pwd') != _password_fingerprint(user)
+    ):
+        raise not_found
+    return user
+
+
+def _escape(value: str) -> str:
+    return (
+        value.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def _fold(line: str) -> str:
+    """Перенос длинной строки без разрыва многобайтовых символов"""
+    if len(line.encode()) <= LINE_LIMIT:
+        return line
+    parts, chunk, size, limit = [], '', 0, LINE_LIMIT
+    for char in line:
+        width = len(char.encode())
+        if size + width > limit:
+            parts.append(chunk)
+            # строка продолжения начинается с пробела
+            chunk, size, limit = '', 0, LINE_LIMIT - 1
+        chunk += char
+        size += width
+    parts.append(chunk)
+    return '\r\n '.join(parts)
+
+
+def _utc(value: datetime) -> datetime:
+    """Время без пояса хранится в UTC (SQLite)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _time(value: datetime) -> str:
+    """Время с поясом - в UTC, без пояса - плавающее местное время"""
+    if value.tzinfo is None:
+        return value.strftime('%Y%m%dT%H%M%S')
+    return value.astimezone(UTC).strftime('%Y%m%dT%H%M%SZ')
+
+
+def _event(uid: str, stamp: datetime, lines: list[str]) -> str:
+    stamp = _utc(stamp).strftime('%Y%m%dT%H%M%SZ')
+    return '\r\n'.join(_fold(line) for line in (
+        'BEGIN:VEVENT',
+        f'UID:{uid}@{_UID_DOMAIN}',
+        f'DTSTAMP:{stamp}',
+        f'LAST-MODIFIED:{stamp}',
+        *lines,
+        'END:VEVENT',
+    ))
+
+
+def _description(value: str | None) -> list[str]:
+    return [f'DESCRIPTION:{_escape(value)}'] if value else []
+
+
+def render_meeting(meeting: Meeting) -> str:
+    return _event(f'meeting-{meeting.id}', meeting.updated_at, [
+        f'DTSTART:{_time(meeting.scheduled_at)}',
+        f'DTEND:{_time(meeting.ends_at)}',
+        f'SUMMARY:{_escape(meeting.title)}',
+        *_description(meeting.description),
+        f'SEQUENCE:{meeting.version - 1}',
+    ])
+
+
+def render_series(series: MeetingSeries) -> str:
+    """Серия - одно событие с RRULE, клиент разворачивает его сам"""
+    rule = f'RRULE:FREQ={series.frequency.value.upper()}'
+    rule += f';INTERVAL={series.interval}'
+    if series.until is not None:
+        rule += f';UNTIL={_utc(series.until):%Y%m%dT%H%M%SZ}'
+    ends_at = series.starts_at + timedelta(minutes=series.duration_minutes)
+    exceptions = sorted(e.occurs_at for e in series.exceptions)
+    return _event(f'series-{series.id}', series.updated_at, [
+        f'DTSTART:{_time(series.starts_at)}',
+        f'DTEND:{_time(ends_at)}',
+        rule,
+        *(
+            [f'EXDATE:{",".join(_time(e) for e in exceptions)}']
+            if exceptions else []
+        ),
+        f'SUMMARY:{_escape(series.title)}',
+        *_description(series.description),
+    ])
+
+
+def render_task(task: Task) -> str:
+    return _event(f'task-{task.id}', task.updated_at, [
+        f'DTSTART:{_time(task.deadline_date)}',
+        f'SUMMARY:{_escape("Дедлайн: " + task.title)}',
+        *_description(task.description),
+    ])
+
+
+@dataclass(frozen=True)
+class _Source:
+    """Таблица событий ленты пользователя"""
+    kind: str
+    model: type
+    condition: Callable[[int], ColumnElement]
+    render: Callable[[Any], str]
+    options: tuple = ()
+
+
+SOURCES = (
+    _Source(
+        'meeting',
+        Meeting,
+        lambda user_id: or_(
+            Meeting.organizer_id == user_id,
+            Meeting.id.in_(
+                select(MeetingParticipant.meeting_id)
+                .where(MeetingParticipant.user_id == user_id)
+            )
+        ),
+        render_meeting
+    ),
+    _Source(
+        'series',
+        MeetingSeries,
+        lambda user_id: or_(
+            MeetingSeries.organizer_id == user_id,
+            MeetingSeries.id.in_(
+                select(MeetingSeriesParticipant.series_id)
+                .where(MeetingSeriesParticipant.user_id == user_id)
+            )
+        ),
+        render_series,
+        (selectinload(MeetingSeries.exceptions),)
+    ),
+    _Source(
+        'task',
+        Task,
+        lambda user_id: (
+            (Task.performer_id == user_id)
+            & Task.deadline_date.is_not(None)
+            & (Task.status != TaskStatus.done)
+        ),
+        render_task
+    ),
+)
+
+
+@dataclass
+class FeedState:
+    """Валидаторы ленты: строгий ETag и время последнего изменения"""
+    etag: str
+    last_modified: datetime | None
+
+
+async def get_feed_state(db: AsyncSession, user_id: int) -> FeedState:
+    """
+    Число событий и последнее изменение каждой таблицы одним запросом.
+    Новые и измененные строки меняют max(updated_at), удаленные - число
+    """
+    stmt = union_all(*(
+        select(
+            literal(source.kind),
+            func.count(),
+            func.max(source.model.updated_at)
+        ).where(source.condition(user_id))
+        for source in SOURCES
+    ))
+    rows = sorted(tuple(row) for row in await db.execute(stmt))
+
+    digest = hashlib.sha256(
+        repr((FEED_FORMAT_VERSION, user_id, rows)).encode()
+    ).hexdigest()
+    stamps = [_utc(stamp) for _, _, stamp in rows if stamp is not None]
+    return FeedState(
+        etag=f'"{digest[:32]}"',
+        last_modified=max(stamps, default=None)
+    )
+
+
+@dataclass
+class FeedEntry:
+    """Собранная лента и отрисованные события с временем их изменения"""
+    etag: str
+    body: bytes
+    events: dict[tuple[str, int], tuple[datetime, str]] = field(
+        default_factory=dict
+    )
+
+
+class FeedCache:
+    """Последние собранные ленты пользователей"""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[int, FeedEntry] = OrderedDict()
+
+    def get(self, user_id: int) -> FeedEntry | None:
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            self._entries.move_to_end(user_id)
+        return entry
+
+    def set(self, user_id: int, entry: FeedEntry) -> None:
+        if self.max_size <= 0:
+            return
+        self._entries[user_id] = entry
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+feed_cache = FeedCache(max_size=settings.CALENDAR_FEED_CACHE_MAX_SIZE)
+
+
+async def build_feed(
+        db: AsyncSession,
+        user: User,
+        etag: str,
+        previous: FeedEntry | None = None
+) -> FeedEntry:
+    """
+    Сборка ленты по изменениям: сначала читаются только id и updated_at,
+    полные строки - только для событий, которых нет в прошлой ленте
+    или которые изменились с ее сборки
+    """
+    cached = previous.events if previous is not None else {}
+    events: dict[tuple[str, int], tuple[datetime, str]] = {}
+
+    for source in SOURCES:
+        model = source.model
+        condition = source.condition(user.id)
+        stamps = (await db.execute(
+            select(model.id, model.updated_at).where(condition)
+        )).all()
+        changed = []
+        for row_id, stamp in stamps:
+            event = cached.get((source.kind, row_id))
+            if event is not None and event[0] == stamp:
+                events[source.kind, row_id] = event
+            else:
+                changed.append(row_id)
+        if not changed:
+            continue
+
+        stmt = select(model).options(*source.options)
+        if len(changed) == len(stamps):
+            stmt = stmt.where(condition)
+        else:
+            stmt = stmt.where(model.id.in_(changed))
+        for obj in await db.scalars(stmt):
+            events[source.kind, obj.id] = (obj.updated_at, source.render(obj))
+
+    order = {source.kind: index for index, source in enumerate(SOURCES)}
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:-//{_UID_DOMAIN}//Meetings//RU',
+        'CALSCALE:GREGORIAN',
+        _fold(f'X-WR-CALNAME:{_escape(f"{settings.PROJECT_NAME}: {user}")}'),
+        *(
+            events[key][1]
+            for key in sorted(events, key=lambda key: (order[key[0]], key[1]))
+        ),
+        'END:VCALENDAR',
+    ]
+    return FeedEntry(etag, ('\r\n'.join(lines) + '\r\n').encode(), events)
+
+
+def _not_modified(request: Request, state: FeedState) -> bool:
+    """
+    Условный GET: If-None-Match проверяется первым,
+    If-Modified-Since - только без него (RFC 9110, 13.2.2)
+    """
+    if_none_match = request.headers.get('if-none-match')
+    if if_none_match is not None:
+        tags = {
+            tag.strip().removeprefix('W/')
+            for tag in if_none_match.split(',')
+        }
+        return '*' in tags or state.etag in tags
+
+    if_modified_since = request.headers.get('if-modified-since')
+    if if_modified_since is None or state.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return state.last_modified.replace(microsecond=0) <= since
+
+
+def _validator_headers(state: FeedState) -> dict[str, str]:
+    headers = {
+        'ETag': state.etag,
+        'Cache-Control': 'private, no-cache'
+    }
+    if state.last_modified is not None:
+        headers['Last-Modified'] = format_datetime(
+            state.last_modified,
+            usegmt=True
+        )
+    return headers
+
+
+async def feed_response(
+        request: Request,
+        db: AsyncSession,
+        user: User
+) -> Response:
+    """
+    Лента пользователя с условным GET: совпавший валидатор дает 304
+    после одного агрегатного запроса, неизменная лента отдается
+    из кэша, измененная пересобирается только по измененным событиям
+    """
+    state = await get_feed_state(db, user.id)
+    headers = _validator_headers(state)
+    if _not_modified(request, state):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=headers
+        )
+
+    entry = feed_cache.get(user.id)
+    if entry is None or entry.etag != state.etag:
+        entry = await build_feed(db, user, state.etag, entry)
+        feed_cache.set(user.id, entry)
+
+    return Response(
+        content=entry.body,
+        media_type=MEDIA_TYPE,
+        headers=headers
+    )
@@ -3,6 +3,7 @@ from sqlalchemy import select
 
 from src.app.models.evaluation import Evaluation
 from src.app.schemas.evaluation import EvaluationCreate, EvaluationUpdate
+from src.app.services.versioning import update_versioned
 
 
 async def create_evaluation(
@@ -30,14 +31,23 @@ async def get_evaluation(
 
 async def update_evaluation(
         db: AsyncSession,
-        evaluation: Evaluation,
-        evaluation_data: EvaluationUpdate
-) -> Evaluation:
-    """Изменить оценку"""
-    for field, value in evaluation_data.model_dump(exclude_unset=True).items():
-        setattr(evaluation, field, value)
-    await db.commit()
-    await db.refresh(evaluation)
+        evaluation_id: int,
+        evaluation_data: EvaluationUpdate,
+        versions: list[int] | None = None
+) -> Evaluation | None:
+    """
+    Изменить оценку, если ее версия входит в versions.
+    None - оценки нет или она уже изменена
+    """
+    evaluation = await update_versioned(
+        db,
+        Evaluation,
+        evaluation_id,
+        evaluation_data.model_dump(exclude_unset=True),
+        versions
+    )
+    if evaluation is not None:
+        await db.commit()
     return evaluation
 
 
@@ -0,0 +1,124 @@
+import csv
+import io
+import json
+from enum import Enum
+from typing import Any, AsyncIterator, Sequence
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import Select, inspect, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from src.app.config import settings
+
+
+class ExportFormat(str, Enum):
+    """Формат выгрузки"""
+    ndjson = 'ndjson'
+    csv = 'csv'
+
+
+MEDIA_TYPES = {
+    ExportFormat.ndjson: 'application/x-ndjson',
+    ExportFormat.csv: 'text/csv; charset=utf-8',
+}
+
+
+async def stream_batches(
+        session_factory: async_sessionmaker,
+        stmt: Select,
+        schema: type[BaseModel],
+        batch_size: int,
+        options: Sequence[LoaderOption] = ()
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """
+    Строки запроса пачками по batch_size через серверный курсор.
+    Сессия открывается внутри генератора, после каждой пачки
+    объекты удаляются из сессии, поэтому память не растет с объемом данных.
+    options (например, selectinload) применяются отдельным запросом
+    к каждой пачке: вместе с yield_per загрузчики связей не работают
+    """
+    entity = stmt.column_descriptions[0]['entity']
+    primary_key = inspect(entity).primary_key[0]
+
+    async with session_factory() as session:
+        result = await session.stream_scalars(
+            stmt.execution_options(yield_per=batch_size)
+        )
+        async for partition in result.partitions():
+            if options:
+                await session.execute(
+                    select(entity)
+                    .where(primary_key.in_(
+                        [getattr(obj, primary_key.key) for obj in partition]
+                    ))
+                    .options(*options)
+                )
+            yield [
+                schema.model_validate(obj).model_dump(mode='json')
+                for obj in partition
+            ]
+            for obj in partition:
+                session.expunge(obj)
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+async def _ndjson(batches: AsyncIterator[list[dict]]) -> AsyncIterator[str]:
+    async for batch in batches:
+        yield ''.join(
+            json.dumps(row, ensure_ascii=False) + '\n' for row in batch
+        )
+
+
+async def _csv(
+        batches: AsyncIterator[list[dict]],
+        columns: list[str]
+) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield buffer.getvalue()
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            [_csv_value(row[column]) for column in columns] for row in batch
+        )
+        yield buffer.getvalue()
+
+
+def export_response(
+        session_factory: async_sessionmaker,
+        stmt: Select,
+        schema: type[BaseModel],
+        export_format: ExportFormat,
+        filename: str,
+        options: Sequence[LoaderOption] = ()
+) -> StreamingResponse:
+    """Потоковая выгрузка результатов запроса в NDJSON или CSV"""
+    batches = stream_batches(
+        session_factory,
+        stmt,
+        schema,
+        settings.EXPORT_BATCH_SIZE,
+        options
+    )
+    if export_format == ExportFormat.csv:
+        body = _csv(batches, list(schema.model_fields))
+    else:
+        body = _ndjson(batches)
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[export_format],
+        headers={
+            'Content-Disposition': (
+                f'attachment; filename="{filename}.{export_format.value}"'
+            )
+        }
+    )
@@ -0,0 +1,236 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Depends, Query
+from sqlalchemy import Select
+
+from src.app.models.user import User, UserRole
+from src.app.models.task import Task, TaskStatus
+from src.app.models.evaluation import Evaluation, EvaluationGrade
+from src.app.models.meeting import Meeting
+from src.app.models.team import Team
+from src.app.services.text_search import TextMatch, TextSearch, text_search
+
+
+class TaskFilters:
+    """Фильтры админского списка и выгрузки задач"""
+
+    def __init__(
+            self,
+            task_status: Optional[TaskStatus] = Query(
+                None,
+                description='Фильтраци по статусу задачи'
+            ),
+            performer_id: Optional[int] = Query(
+                None,
+                description='Фильтрация по пользователю'
+            ),
+            team_id: Optional[int] = Query(
+                None,
+                description='Фильрация по команде'
+            ),
+            deadline_before: Optional[datetime] = Query(
+                None,
+                description='Дедлайн до даты'
+            ),
+            deadline_after: Optional[datetime] = Query(
+                None,
+                description='Дедлайн после даты'
+            ),
+    ):
+        self.task_status = task_status
+        self.performer_id = performer_id
+        self.team_id = team_id
+        self.deadline_before = deadline_before
+        self.deadline_after = deadline_after
+
+    def apply(self, stmt: Select) -> Select:
+        if self.task_status:
+            stmt = stmt.where(Task.status == self.task_status)
+        if self.performer_id:
+            stmt = stmt.where(Task.performer_id == self.performer_id)
+        if self.team_id:
+            stmt = stmt.where(Task.team_id == self.team_id)
+        if self.deadline_before:
+            stmt = stmt.where(Task.deadline_date <= self.deadline_before)
+        if self.deadline_after:
+            stmt = stmt.where(Task.deadline_date >= self.deadline_after)
+        return stmt
+
+
+class EvaluationFilters:
+    """Фильтры админского списка и выгрузки оценок"""
+
+    def __init__(
+            self,
+            task_id: Optional[int] = Query(
+                None,
+                description='Фильтрация по задаче'
+            ),
+            user_id: Optional[int] = Query(
+                None,
+                description='Фильтрация по пользователю'
+            ),
+            manager_id: Optional[int] = Query(
+                None,
+                description='Фильтрация по менеджеру'
+            ),
+            grade: Optional[EvaluationGrade] = Query(
+                None,
+                description='Фильтрация по оценке'
+            ),
+            created_before: Optional[datetime] = Query(
+                None,
+                description='Оценки до даты'
+            ),
+            created_after: Optional[datetime] = Query(
+                None,
+                description='Оценки после даты'
+            ),
+    ):
+        self.task_id = task_id
+        self.user_id = user_id
+        self.manager_id = manager_id
+        self.grade = grade
+        self.created_before = created_before
+        self.created_after = created_after
+
+    def apply(self, stmt: Select) -> Select:
+        if self.task_id:
+            stmt = stmt.where(Evaluation.task_id == self.task_id)
+        if self.user_id:
+            stmt = stmt.where(Evaluation.user_id == self.user_id)
+        if self.manager_id:
+            stmt = stmt.where(Evaluation.manager_id == self.manager_id)
+        if self.grade:
+            stmt = stmt.where(Evaluation.grade == self.grade)
+        if self.created_before:
+            stmt = stmt.where(Evaluation.created_at <= self.created_before)
+        if self.created_after:
+            stmt = stmt.where(Evaluation.created_at >= self.created_after)
+        return stmt
+
+
+class MeetingFilters:
+    """Фильтры админского списка и выгрузки встреч"""
+
+    def __init__(
+            self,
+            team_id: Optional[int] = Query(
+                None,
+                description='Фильтрация по команде'
+            ),
+            organizer_id: Optional[int] = Query(
+                None,
+                description='Фильтрация по организатору'
+            ),
+            scheduled_before: Optional[datetime] = Query(
+                None,
+                description='Встречи до даты'
+            ),
+            scheduled_after: Optional[datetime] = Query(
+                None,
+                description='Встречи после даты'
+            ),
+    ):
+        self.team_id = team_id
+        self.organizer_id = organizer_id
+        self.scheduled_before = scheduled_before
+        self.scheduled_after = scheduled_after
+
+    def apply(self, stmt: Select) -> Select:
+        if self.team_id:
+            stmt = stmt.where(Meeting.team_id == self.team_id)
+        if self.organizer_id:
+            stmt = stmt.where(Meeting.organizer_id == self.organizer_id)
+        if self.scheduled_before:
+            stmt = stmt.where(Meeting.scheduled_at <= self.scheduled_before)
+        if self.scheduled_after:
+            stmt = stmt.where(Meeting.scheduled_at >= self.scheduled_after)
+        return stmt
+
+
+class UserFilters:
+    """Фильтры админского списка и выгрузки пользователей"""
+
+    def __init__(
+            self,
+            email: Optional[str] = Query(
+                None,
+                description='Поиск по части email'
+            ),
+            match: TextMatch = Query(
+                TextMatch.substring,
+                description='Поиск подстроки или нечеткий поиск'
+            ),
+            role: Optional[UserRole] = Query(
+                None,
+                description='Филтрация по роли'
+            ),
+            team_id: Optional[int] = Query(
+                None,
+                description='Фильтрация по команде'
+            ),
+            is_active: Optional[bool] = Query(
+                None,
+                description='Фильтрация по статусу'
+            ),
+            search: TextSearch = Depends(text_search(email=User.email)),
+    ):
+        self.email = email
+        self.match = match
+        self.search = search
+        self.role = role
+        self.team_id = team_id
+        self.is_active = is_active
+
+    def apply(self, stmt: Select) -> Select:
+        if self.email:
+            stmt = stmt.where(
+                self.search.match(User.email, self.email, self.match)
+            )
+        if self.role:
+            stmt = stmt.where(User.role == self.role)
+        if self.team_id is not None:
+            stmt = stmt.where(User.team_id == self.team_id)
+        if self.is_active is not None:
+            stmt = stmt.where(User.is_active == self.is_active)
+        return stmt
+
+
+class TeamFilters:
+    """Фильтры админского списка команд"""
+
+    def __init__(
+            self,
+            name: Optional[str] = Query(
+                None,
+                description='Поиск по части названия команды'
+            ),
+            code: Optional[str] = Query(
+                None,
+                description='Поиск по части кода команды'
+            ),
+            match: TextMatch = Query(
+                TextMatch.substring,
+                description='Поиск подстроки или нечеткий поиск'
+            ),
+            search: TextSearch = Depends(
+                text_search(name=Team.name, code=Team.code)
+            ),
+    ):
+        self.name = name
+        self.code = code
+        self.match = match
+        self.search = search
+
+    def apply(self, stmt: Select) -> Select:
+        if self.name:
+            stmt = stmt.where(
+                self.search.match(Team.name, self.name, self.match)
+            )
+        if self.code:
+            stmt = stmt.where(
+                self.search.match(Team.code, self.code, self.match)
+            )
+        return stmt
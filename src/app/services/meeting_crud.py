@@ -1,20 +1,100 @@
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
-
-from src.app.schemas.meeting import MeetingCreate, MeetingUpdate
+from sqlalchemy import delete, insert, literal, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from src.app.schemas.meeting import (
+    MeetingCreate,
+    MeetingParticipantRead,
+    MeetingRead,
+    MeetingUpdate
+)
 from src.app.models.meeting import Meeting
 from src.app.models.meeting_participants import MeetingParticipant
 from src.app.models.user import User
+from src.app.services.memory_index import TRACKED_ROWS, track_rows
+from src.app.services.versioning import update_versioned
+
+
+def not_in_team(user_ids: set[int], team_id: int | None) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f'Пользователи {user_ids} не состоят в команде {team_id}'
+    )
+
+
+async def validate_participants(
+        db: AsyncSession,
+        user_ids: set[int],
+        team_id: int | None
+) -> None:
+    """Проверка одним запросом, что все участники состоят в команде"""
+    if not user_ids:
+        return
+    valid_ids = await db.scalars(
+        select(User.id)
+        .where(
+            User.id.in_(user_ids),
+            User.team_id == team_id
+        )
+    )
+    invalid_ids = user_ids - set(valid_ids.all())
+    if invalid_ids:
+        raise not_in_team(invalid_ids, team_id)
+
+
+async def replace_participants(
+        db: AsyncSession,
+        meeting_id: int,
+        user_ids: set[int]
+) -> None:
+    """
+    Замена участников встречи по разнице множеств:
+    один DELETE ушедших и один INSERT ... ON CONFLICT DO NOTHING новых
+    """
+    current_ids = set((await db.scalars(
+        select(MeetingParticipant.user_id)
+        .where(MeetingParticipant.meeting_id == meeting_id)
+    )).all())
+
+    removed_ids = current_ids - user_ids
+    if removed_ids:
+        await db.execute(
+            delete(MeetingParticipant)
+            .where(
+                MeetingParticipant.meeting_id == meeting_id,
+                MeetingParticipant.user_id.in_(removed_ids)
+            )
+        )
+
+    added_ids = user_ids - current_ids
+    if added_ids:
+        dialect = postgresql if (
+            db.get_bind().dialect.name == 'postgresql'
+        ) else sqlite
+        await db.execute(
+            dialect.insert(MeetingParticipant)
+            .on_conflict_do_nothing(
+                index_elements=['meeting_id', 'user_id']
+            ),
+            [
+                {'meeting_id': meeting_id, 'user_id': user_id}
+                for user_id in sorted(added_ids)
+            ]
+        )
 
 
 async def create_meeting(
         db: AsyncSession,
         meeting_data: MeetingCreate,
         user: User
-) -> Meeting:
-    """Создать встречу"""
+) -> MeetingRead:
+    """
+    Создать встречу: INSERT ... RETURNING встречи и один
+    INSERT ... SELECT участников из команды с RETURNING,
+    который заодно проверяет переданных участников.
+    Ответ собирается из возвращенных строк без повторного чтения
+    """
     participants_id = set(meeting_data.participants_id or [])
 
     if not meeting_data.organizer_id:
@@ -23,58 +103,53 @@ async def create_meeting(
     if not meeting_data.team_id:
         meeting_data.team_id = user.team_id
 
-    if participants_id:
-        valid_ids = await db.scalars(
-            select(User.id)
-            .where(
-                User.id.in_(participants_id),
-                User.team_id == meeting_data.team_id
-            )
-        )
-        valid_ids = set(valid_ids.all())
-        invalid_ids = participants_id - valid_ids
-        if invalid_ids:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=(
-                    f'Пользователи {invalid_ids} '
-                    f'не состоят в команде {meeting_data.team_id}'
-                )
-            )
-
-    if meeting_data.add_team_members:
-        team_users = await db.execute(
-            select(User.id).where(User.team_id == meeting_data.team_id)
-        )
-        team_user_ids = {user_id for (user_id,) in team_users.all()}
-        participants_id.update(team_user_ids)
-
     meeting_dict = meeting_data.model_dump(
         exclude={
+            'participants',
             'participants_id',
             'add_team_members'
         }
     )
-    meeting = Meeting(**meeting_dict)
-    db.add(meeting)
-    await db.flush()
-
-    participant_objs = [
-        MeetingParticipant(meeting_id=meeting.id, user_id=pid)
-        for pid in participants_id
-    ]
-    db.add_all(participant_objs)
-
-    await db.commit()
-    await db.refresh(meeting)
+    meeting = (await db.execute(
+        insert(Meeting)
+        .values(**meeting_dict)
+        .returning(Meeting)
+        .execution_options(**{TRACKED_ROWS: True})
+    )).scalar_one()
+    track_rows(db, Meeting.__tablename__, [meeting.id])
+
+    participants = []
+    if participants_id or meeting_data.add_team_members:
+        members = select(literal(meeting.id), User.id).where(
+            User.team_id == meeting.team_id
+        )
+        if not meeting_data.add_team_members:
+            members = members.where(User.id.in_(participants_id))
+        result = await db.execute(
+            insert(MeetingParticipant)
+            .from_select(['meeting_id', 'user_id'], members)
+            .returning(MeetingParticipant.id, MeetingParticipant.user_id)
+        )
+        participants = sorted(result.all(), key=lambda row: row.id)
 
-    result = await db.execute(
-        select(Meeting)
-        .options(selectinload(Meeting.participants))
-        .where(Meeting.id == meeting.id)
+        invalid_ids = participants_id - {row.user_id for row in participants}
+        if invalid_ids:
+            await db.rollback()
+            raise not_in_team(invalid_ids, meeting_data.team_id)
+
+    response = MeetingRead(
+        **{
+            field: getattr(meeting, field)
+            for field in MeetingRead.model_fields
+            if field != 'participants'
+        },
+        participants=[
+            MeetingParticipantRead.model_validate(row)
+            for row in participants
+        ]
     )
-
-    return result.scalar_one()
+    await db.commit()
+    return response
 
 
 async def get_meeting(db: AsyncSession, meeting_id: int) -> Meeting | None:
@@ -85,37 +160,34 @@ async def get_meeting(db: AsyncSession, meeting_id: int) -> Meeting | None:
 
 async def update_meeting(
         db: AsyncSession,
-        meeting: Meeting,
-        meeting_data: MeetingUpdate
-) -> Meeting:
-    """Изменение встречи"""
+        meeting_id: int,
+        meeting_data: MeetingUpdate,
+        versions: list[int] | None = None
+) -> Meeting | None:
+    """
+    Изменение встречи, если ее версия входит в versions.
+    Изменение участников тоже увеличивает версию, участники
+    проверяются и заменяются по разнице в той же транзакции.
+    None - встречи нет или она уже изменена
+    """
     data = meeting_data.model_dump(exclude_unset=True)
+    participants_data = data.pop('participants', None)
 
-    if 'participants' in data:
-        participants_data = data.pop('participants')
-        await db.execute(
-            select(MeetingParticipant)
-            .where(MeetingParticipant.meeting_id == meeting.id)
-        )
-
-        await db.execute(
-            MeetingParticipant.__table__.delete().
-            where(MeetingParticipant.meeting_id == meeting.id)
-        )
-
-        if participants_data:
-            for p in participants_data:
-                participant_obj = MeetingParticipant(
-                    meeting_id=meeting.id,
-                    user_id=p.user_id
-                )
-                db.add(participant_obj)
+    meeting = await update_versioned(db, Meeting, meeting_id, data, versions)
+    if meeting is None:
+        return None
 
-    for field, value in data.items():
-        setattr(meeting, field, value)
+    if 'participants' in meeting_data.model_fields_set:
+        user_ids = {p['user_id'] for p in participants_data or []}
+        try:
+            await validate_participants(db, user_ids, meeting.team_id)
+        except HTTPException:
+            await db.rollback()
+            raise
+        await replace_participants(db, meeting.id, user_ids)
 
     await db.commit()
-    await db.refresh(meeting)
+    await db.refresh(meeting, ['participants'])
     return meeting
 
 
@@ -0,0 +1,297 @@
+import bisect
+import heapq
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from sqlalchemy import DateTime, func, literal, select
+from sqlalchemy.dialects.postgresql import TSTZRANGE
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.app.models.meeting import Meeting, PERIOD_FUNCTION
+from src.app.models.meeting_participants import MeetingParticipant
+from src.app.models.meeting_series import MeetingSeries
+from src.app.models.user import User
+from src.app.schemas.meeting import FreeSlot, MAX_DURATION_MINUTES
+from src.app.services.meeting_series import (
+    MeetingOccurrence,
+    align,
+    expand,
+    get_series_list,
+    occurrence_times
+)
+from src.app.services.memory_index import MemoryIndex, register
+
+
+def _naive(value: datetime) -> datetime:
+    """SQLite хранит время без часового пояса"""
+    return value.replace(tzinfo=None)
+
+
+class IntervalIndex(MemoryIndex):
+    """
+    Интервалы встреч в памяти процесса для SQLite.
+    Начала отсортированы, пересечения ищутся бинарным поиском
+    в окне длиной с самую длинную встречу
+    """
+
+    def __init__(self):
+        super().__init__(
+            Meeting,
+            Meeting.scheduled_at,
+            Meeting.duration_minutes
+        )
+        self._starts: list[tuple[datetime, int]] = []
+        self._periods: dict[int, tuple[datetime, datetime]] = {}
+        self._longest = timedelta(0)
+
+    def add(
+            self,
+            row_id: int,
+            scheduled_at: datetime,
+            duration_minutes: int
+    ) -> None:
+        self.remove(row_id)
+        start = _naive(scheduled_at)
+        length = timedelta(minutes=duration_minutes)
+        bisect.insort(self._starts, (start, row_id))
+        self._periods[row_id] = (start, start + length)
+        # окно поиска не сужается при удалении, это только граница
+        self._longest = max(self._longest, length)
+
+    def remove(self, row_id: int) -> None:
+        period = self._periods.pop(row_id, None)
+        if period is not None:
+            position = bisect.bisect_left(self._starts, (period[0], row_id))
+            del self._starts[position]
+
+    def reset(self) -> None:
+        self._starts.clear()
+        self._periods.clear()
+        self._longest = timedelta(0)
+
+    def overlapping(self, start: datetime, end: datetime) -> list[int]:
+        """id встреч, пересекающих [start, end)"""
+        start, end = _naive(start), _naive(end)
+        low = bisect.bisect_left(self._starts, (start - self._longest,))
+        high = bisect.bisect_left(self._starts, (end,))
+        return [
+            row_id for _, row_id in self._starts[low:high]
+            if self._periods[row_id][1] > start
+        ]
+
+
+interval_index = register(IntervalIndex())
+
+
+@dataclass
+class MeetingConflict:
+    """
+    Встреча участника, пересекающаяся с проверяемым интервалом
+    (отрицательный meeting_id - встреча серии, как в MeetingOccurrence)
+    """
+    user_id: int
+    email: str
+    meeting_id: int
+    title: str
+    scheduled_at: datetime
+    ends_at: datetime
+
+    def __str__(self) -> str:
+        return (
+            f'{self.email}: «{self.title}» '
+            f'{self.scheduled_at:%Y-%m-%d %H:%M}–{self.ends_at:%H:%M}'
+        )
+
+
+async def overlap_condition(
+        db: AsyncSession,
+        start: datetime,
+        end: datetime
+) -> ColumnElement:
+    """
+    Условие пересечения встречи с [start, end).
+    Postgres: && по GiST индексу tstzrange,
+    SQLite: id из интервального индекса в памяти
+    """
+    if db.get_bind().dialect.name == 'postgresql':
+        period = getattr(func, PERIOD_FUNCTION)(
+            Meeting.scheduled_at,
+            Meeting.duration_minutes,
+            type_=TSTZRANGE
+        )
+        return period.op('&&')(func.tstzrange(
+            literal(start, DateTime(timezone=True)),
+            literal(end, DateTime(timezone=True))
+        ))
+
+    await interval_index.refresh(db)
+    return Meeting.id.in_(interval_index.overlapping(start, end))
+
+
+async def series_occurrences(
+        db: AsyncSession,
+        user_ids: set[int],
+        start: datetime,
+        end: datetime
+) -> list[MeetingOccurrence]:
+    """
+    Встречи серий с участниками user_ids, пересекающие [start, end).
+    Повторение, начавшееся до start, может длиться до самой длинной
+    встречи, поэтому окно развертывания начинается раньше
+    """
+    after = start - timedelta(minutes=MAX_DURATION_MINUTES)
+    series_list = await get_series_list(
+        db,
+        after=after,
+        before=end,
+        user_ids=user_ids
+    )
+    return [
+        occurrence
+        for occurrence in expand(series_list, after, end)
+        if occurrence.ends_at > align(start, occurrence.scheduled_at)
+    ]
+
+
+async def find_conflicts(
+        db: AsyncSession,
+        user_ids: set[int],
+        start: datetime,
+        end: datetime,
+        exclude_meeting_id: int | None = None
+) -> list[MeetingConflict]:
+    """
+    Встречи участников user_ids, включая встречи серий,
+    пересекающие [start, end)
+    """
+    if not user_ids:
+        return []
+
+    stmt = (
+        select(User.id, User.email, Meeting)
+        .join(MeetingParticipant, MeetingParticipant.user_id == User.id)
+        .join(Meeting, Meeting.id == MeetingParticipant.meeting_id)
+        .where(
+            User.id.in_(user_ids),
+            await overlap_condition(db, start, end)
+        )
+        .order_by(Meeting.scheduled_at, User.id)
+    )
+    if exclude_meeting_id is not None:
+        stmt = stmt.where(Meeting.id != exclude_meeting_id)
+
+    conflicts = [
+        MeetingConflict(
+            user_id,
+            email,
+            meeting.id,
+            meeting.title,
+            meeting.scheduled_at,
+            meeting.ends_at
+        )
+        for user_id, email, meeting in await db.execute(stmt)
+    ]
+    for occurrence in await series_occurrences(db, user_ids, start, end):
+        conflicts.extend(
+            MeetingConflict(
+                participant.user_id,
+                participant.user.email,
+                occurrence.id,
+                occurrence.title,
+                occurrence.scheduled_at,
+                occurrence.ends_at
+            )
+            for participant in occurrence.participants
+            if participant.user_id in user_ids
+        )
+    conflicts.sort(
+        key=lambda conflict: (
+            align(conflict.scheduled_at, start),
+            conflict.user_id
+        )
+    )
+    return conflicts
+
+
+async def find_series_conflicts(
+        db: AsyncSession,
+        user_ids: set[int],
+        series: MeetingSeries,
+        before: datetime
+) -> list[MeetingConflict]:
+    """
+    Встречи участников, пересекающие повторения новой серии до before.
+    Занятость за весь период загружается одним запросом, затем каждая
+    встреча сравнивается с ближайшим начавшимся до ее конца повторением
+    """
+    moments = list(occurrence_times(series, before=before))
+    if not moments:
+        return []
+
+    length = timedelta(minutes=series.duration_minutes)
+    conflicts = []
+    for conflict in await find_conflicts(
+        db,
+        user_ids,
+        moments[0],
+        moments[-1] + length
+    ):
+        ends_at = align(conflict.ends_at, series.starts_at)
+        position = bisect.bisect_left(moments, ends_at)
+        if (
+            position
+            and moments[position - 1] + length
+            > align(conflict.scheduled_at, series.starts_at)
+        ):
+            conflicts.append(conflict)
+    return conflicts
+
+
+async def find_free_slots(
+        db: AsyncSession,
+        user_ids: set[int],
+        start: datetime,
+        end: datetime,
+        duration: timedelta,
+        limit: int
+) -> list[FreeSlot]:
+    """
+    Свободные для всех участников интервалы в [start, end)
+    длиной не меньше duration, по возрастанию времени
+    """
+    stmt = (
+        select(Meeting.scheduled_at, Meeting.duration_minutes)
+        .join(MeetingParticipant)
+        .where(
+            MeetingParticipant.user_id.in_(user_ids),
+            await overlap_condition(db, start, end)
+        )
+        .distinct()
+        .order_by(Meeting.scheduled_at)
+    )
+
+    meetings = [
+        (align(scheduled_at, start), timedelta(minutes=duration_minutes))
+        for scheduled_at, duration_minutes in await db.execute(stmt)
+    ]
+    occurrences = [
+        (
+            align(occurrence.scheduled_at, start),
+            timedelta(minutes=occurrence.duration_minutes)
+        )
+        for occurrence in await series_occurrences(db, user_ids, start, end)
+    ]
+
+    slots = []
+    cursor = start
+    for busy_start, length in heapq.merge(meetings, occurrences):
+        if busy_start - cursor >= duration:
+            slots.append(FreeSlot(start=cursor, end=busy_start))
+            if len(slots) == limit:
+                return slots
+        cursor = max(cursor, busy_start + length)
+
+    if end - cursor >= duration:
+        slots.append(FreeSlot(start=cursor, end=end))
+    return slots
@@ -0,0 +1,360 @@
+import heapq
+from calendar import monthrange
+from dataclasses import dataclass
+from datetime import datetime, timedelta, UTC
+from itertools import count, dropwhile
+from typing import Any, Callable, Iterable, Iterator
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.app.models.meeting_series import (
+    MeetingFrequency,
+    MeetingSeries,
+    MeetingSeriesException,
+    MeetingSeriesParticipant
+)
+from src.app.models.user import User
+from src.app.schemas.meeting import MeetingSeriesCreate
+from src.app.services.meeting_crud import validate_participants
+
+# Точность времени: граница окна, включающая время курсора
+RESOLUTION = timedelta(microseconds=1)
+_PERIODS = {
+    MeetingFrequency.daily: timedelta(days=1),
+    MeetingFrequency.weekly: timedelta(weeks=1),
+}
+
+
+@dataclass(frozen=True)
+class MeetingOccurrence:
+    """Встреча серии, развернутая из правила повторения"""
+    series: MeetingSeries
+    scheduled_at: datetime
+
+    @property
+    def id(self) -> int:
+        # Отрицательный id отделяет повторения от встреч в ключе курсора
+        return -self.series.id
+
+    @property
+    def title(self) -> str:
+        return self.series.title
+
+    @property
+    def duration_minutes(self) -> int:
+        return self.series.duration_minutes
+
+    @property
+    def ends_at(self) -> datetime:
+        return self.scheduled_at + timedelta(minutes=self.duration_minutes)
+
+    @property
+    def organizer(self) -> User:
+        return self.series.organizer
+
+    @property
+    def participants(self) -> list[MeetingSeriesParticipant]:
+        return self.series.participants
+
+
+def align(value: datetime, reference: datetime) -> datetime:
+    """Время value в той же форме (с поясом или без), что reference"""
+    if reference.tzinfo is None:
+        if value.tzinfo is None:
+            return value
+        return value.astimezone(UTC).replace(tzinfo=None)
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _shift(series: MeetingSeries, step: int) -> datetime | None:
+    """Время повторения с номером step, None - такого дня нет в месяце"""
+    start = series.starts_at
+    steps = step * series.interval
+    if series.frequency in _PERIODS:
+        return start + _PERIODS[series.frequency] * steps
+
+    month = start.month - 1 + steps
+    year, month = start.year + month // 12, month % 12 + 1
+    if start.day > monthrange(year, month)[1]:
+        return None
+    return start.replace(year=year, month=month)
+
+
+def _first_step(series: MeetingSeries, moment: datetime) -> int:
+    """Номер повторения, с которого начинается поиск времени moment"""
+    start = series.starts_at
+    if moment <= start:
+        return 0
+    if series.frequency in _PERIODS:
+        period = _PERIODS[series.frequency] * series.interval
+        return -((start - moment) // period)
+    months = (moment.year - start.year) * 12 + moment.month - start.month
+    return months // series.interval
+
+
+def occurrence_times(
+        series: MeetingSeries,
+        after: datetime | None = None,
+        before: datetime | None = None,
+        reverse: bool = False
+) -> Iterator[datetime]:
+    """
+    Время встреч серии в [after, before) без отмененных.
+    Генератор сразу переходит к первому повторению окна и разворачивает
+    правило по мере чтения, поэтому серия без конца не ограничивает
+    окно. reverse - по убыванию, тогда нужна граница before или until
+    """
+    start = series.starts_at
+    after = start if after is None else max(align(after, start), start)
+    before = None if before is None else align(before, start)
+    until = None if series.until is None else align(series.until, start)
+    skipped = {
+        align(exception.occurs_at, start)
+        for exception in series.exceptions
+    }
+
+    if reverse:
+        last = min(
+            (bound for bound in (before, until) if bound is not None),
+            default=None
+        )
+        if last is None:
+            raise ValueError('Обратный обход серии без верхней границы')
+        steps = range(_first_step(series, last), -1, -1)
+    else:
+        steps = count(_first_step(series, after))
+
+    for step in steps:
+        moment = _shift(series, step)
+        if moment is None:
+            continue
+        if moment < after:
+            if reverse:
+                return
+            continue
+        if (
+            (before is not None and moment >= before)
+            or (until is not None and moment > until)
+        ):
+            if reverse:
+                continue
+            return
+        if moment not in skipped:
+            yield moment
+
+
+def _occurrences(
+        series: MeetingSeries,
+        after: datetime | None,
+        before: datetime | None,
+        reverse: bool
+) -> Iterator[MeetingOccurrence]:
+    for moment in occurrence_times(series, after, before, reverse):
+        yield MeetingOccurrence(series, moment)
+
+
+def occurrence_key(occurrence: MeetingOccurrence) -> tuple[datetime, int]:
+    return occurrence.scheduled_at, occurrence.id
+
+
+def expand(
+        series_list: Iterable[MeetingSeries],
+        after: datetime | None = None,
+        before: datetime | None = None,
+        reverse: bool = False
+) -> Iterator[MeetingOccurrence]:
+    """Повторения нескольких серий одним потоком по (scheduled_at, id)"""
+    return heapq.merge(
+        *(
+            _occurrences(series, after, before, reverse)
+            for series in series_list
+        ),
+        key=occurrence_key,
+        reverse=reverse
+    )
+
+
+def occurrence_stream(
+        series_list: list[MeetingSeries],
+        after: datetime | None = None,
+        before: datetime | None = None
+) -> Callable[[list[Any] | None, bool], Iterator[MeetingOccurrence]]:
+    """
+    Источник повторений в окне [after, before) для paginate_merged
+    со встречами, отсортированными по (scheduled_at, id)
+    """
+    def stream(
+            values: list[Any] | None,
+            reverse: bool
+    ) -> Iterator[MeetingOccurrence]:
+        if values is None:
+            return expand(series_list, after, before)
+
+        key = tuple(values)
+        moment = values[0]
+        if reverse:
+            high = moment + RESOLUTION
+            if before is not None:
+                high = min(high, align(before, moment))
+            occurrences = expand(series_list, after, high, reverse=True)
+            return dropwhile(
+                lambda item: occurrence_key(item) >= key,
+                occurrences
+            )
+
+        low = moment if after is None else max(moment, align(after, moment))
+        return dropwhile(
+            lambda item: occurrence_key(item) <= key,
+            expand(series_list, low, before)
+        )
+
+    return stream
+
+
+def count_occurrences(
+        series_list: list[MeetingSeries],
+        after: datetime | None = None,
+        before: datetime | None = None
+) -> int | None:
+    """Число повторений в окне, None - окно не ограничено сверху"""
+    if before is None and any(
+        series.until is None for series in series_list
+    ):
+        return None
+    return sum(
+        1
+        for series in series_list
+        for _ in occurrence_times(series, after, before)
+    )
+
+
+def series_query(
+        team_id: int | None = None,
+        user_id: int | None = None,
+        after: datetime | None = None,
+        before: datetime | None = None,
+        user_ids: Iterable[int] | None = None
+) -> Select:
+    """
+    Серии команды (или участника, любого из участников user_ids),
+    у которых могут быть встречи в [after, before), вместе
+    с участниками и исключениями
+    """
+    stmt = select(MeetingSeries).options(
+        selectinload(MeetingSeries.participants)
+        .selectinload(MeetingSeriesParticipant.user),
+        selectinload(MeetingSeries.exceptions),
+        selectinload(MeetingSeries.organizer)
+    )
+    if team_id is not None:
+        stmt = stmt.where(MeetingSeries.team_id == team_id)
+    if user_id is not None:
+        stmt = stmt.where(MeetingSeries.participants.any(
+            MeetingSeriesParticipant.user_id == user_id
+        ))
+    if user_ids is not None:
+        stmt = stmt.where(MeetingSeries.participants.any(
+            MeetingSeriesParticipant.user_id.in_(user_ids)
+        ))
+    if after is not None:
+        stmt = stmt.where(or_(
+            MeetingSeries.until.is_(None),
+            MeetingSeries.until >= after
+        ))
+    if before is not None:
+        stmt = stmt.where(MeetingSeries.starts_at < before)
+    return stmt.order_by(MeetingSeries.id)
+
+
+async def get_series_list(
+        db: AsyncSession,
+        team_id: int | None = None,
+        user_id: int | None = None,
+        after: datetime | None = None,
+        before: datetime | None = None,
+        user_ids: Iterable[int] | None = None
+) -> list[MeetingSeries]:
+    """Серии для развертывания повторений в окне"""
+    result = await db.scalars(
+        series_query(team_id, user_id, after, before, user_ids)
+    )
+    return list(result.all())
+
+
+async def get_series(
+        db: AsyncSession,
+        series_id: int
+) -> MeetingSeries | None:
+    """Получить серию по id"""
+    result = await db.scalars(
+        series_query()
+        .where(MeetingSeries.id == series_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.first()
+
+
+async def create_series(
+        db: AsyncSession,
+        series_data: MeetingSeriesCreate,
+        user: User
+) -> MeetingSeries:
+    """
+    Создать серию: правило и участники записываются один раз,
+    сколько бы встреч ни было в серии
+    """
+    team_id = series_data.team_id or user.team_id
+    user_ids = set(series_data.participants_id or [])
+    await validate_participants(db, user_ids, team_id)
+    if series_data.add_team_members:
+        team_user_ids = await db.scalars(
+            select(User.id).where(User.team_id == team_id)
+        )
+        user_ids.update(team_user_ids.all())
+
+    series = MeetingSeries(
+        **series_data.model_dump(
+            exclude={'team_id', 'participants_id', 'add_team_members'}
+        ),
+        team_id=team_id,
+        organizer_id=user.id,
+        participants=[
+            MeetingSeriesParticipant(user_id=user_id)
+            for user_id in sorted(user_ids)
+        ]
+    )
+    db.add(series)
+    await db.commit()
+    return await get_series(db, series.id)
+
+
+async def cancel_occurrence(
+        db: AsyncSession,
+        series: MeetingSeries,
+        occurs_at: datetime
+) -> MeetingSeries:
+    """Отменить одну встречу серии"""
+    moment = next(
+        occurrence_times(series, occurs_at, occurs_at + RESOLUTION),
+        None
+    )
+    if moment is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail='В серии нет встречи в это время'
+        )
+
+    db.add(MeetingSeriesException(series_id=series.id, occurs_at=moment))
+    # исключение меняет расписание серии (Last-Modified ленты)
+    series.updated_at = datetime.now(UTC)
+    await db.commit()
+    return await get_series(db, series.id)
+
+
+async def delete_series(db: AsyncSession, series: MeetingSeries) -> None:
+    """Удалить серию вместе со всеми ее встречами"""
+    await db.delete(series)
+    await db.commit()
@@ -0,0 +1,145 @@
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Any, Iterable
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+# Опция выполнения для массовых запросов, строки которых
+# переданы в track_rows (индекс не перестраивается целиком)
+TRACKED_ROWS = 'tracked_rows'
+# Изменения индексируемых строк в транзакции сессии
+_CHANGES = 'memory_index_changes'
+
+_indexes: list['MemoryIndex'] = []
+
+
+class MemoryIndex(ABC):
+    """
+    Индекс строк таблицы в памяти процесса, заменяющий индексы Postgres
+    в SQLite. Загружается целиком при первом обращении, затем
+    перечитывает только строки, измененные закоммиченными транзакциями
+    """
+
+    def __init__(self, model: type, *columns: InstrumentedAttribute):
+        self.model = model
+        self.table = model.__tablename__
+        self.columns = columns
+        self._loaded = False
+        self._stale: set[int] = set()
+        self._lock = asyncio.Lock()
+
+    @abstractmethod
+    def add(self, row_id: int, *values: Any) -> None:
+        """Добавление строки со значениями индексируемых колонок"""
+
+    @abstractmethod
+    def remove(self, row_id: int) -> None:
+        """Удаление строки из индекса, если она там есть"""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Очистка содержимого индекса"""
+
+    def mark_stale(self, row_id: int | None) -> None:
+        """Перечитать строку при следующем обращении (None - весь индекс)"""
+        if row_id is None:
+            self._loaded = False
+        else:
+            self._stale.add(row_id)
+
+    def clear(self) -> None:
+        self.reset()
+        self._stale.clear()
+        self._loaded = False
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """Загрузка индекса или перечитывание измененных строк"""
+        async with self._lock:
+            stmt = select(self.model.id, *self.columns)
+            if self._loaded:
+                if not self._stale:
+                    return
+                stale, self._stale = self._stale, set()
+                for row_id in stale:
+                    self.remove(row_id)
+                stmt = stmt.where(self.model.id.in_(stale))
+            else:
+                self.reset()
+                self._stale = set()
+                self._loaded = True
+
+            for row_id, *values in await db.execute(stmt):
+                self.add(row_id, *values)
+
+
+def register(index: MemoryIndex) -> MemoryIndex:
+    """Подключение индекса к отслеживанию изменений сессий"""
+    _indexes.append(index)
+    return index
+
+
+def clear_indexes() -> None:
+    for index in _indexes:
+        index.clear()
+
+
+def _table_indexes(table: str | None) -> list[MemoryIndex]:
+    return [index for index in _indexes if index.table == table]
+
+
+def _record(session: Session, index: MemoryIndex, row_id: int | None):
+    session.info.setdefault(_CHANGES, set()).add((index, row_id))
+
+
+def track_rows(
+        db: AsyncSession | Session,
+        table: str,
+        row_ids: Iterable[int]
+) -> None:
+    """
+    Отметить строки, измененные массовым запросом с опцией TRACKED_ROWS,
+    чтобы после коммита перечитать только их
+    """
+    session = getattr(db, 'sync_session', db)
+    for index in _table_indexes(table):
+        for row_id in row_ids:
+            _record(session, index, row_id)
+
+
+@event.listens_for(Session, 'after_flush')
+def _collect_changes(session: Session, flush_context) -> None:
+    """Запоминание измененных строк индексируемых таблиц до коммита"""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        for index in _table_indexes(getattr(obj, '__tablename__', None)):
+            _record(session, index, obj.id)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _collect_bulk_changes(orm_execute_state) -> None:
+    """Массовые изменения без TRACKED_ROWS перестраивают индекс целиком"""
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    if orm_execute_state.execution_options.get(TRACKED_ROWS):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None:
+        return
+    for index in _table_indexes(mapper.local_table.name):
+        _record(orm_execute_state.session, index, None)
+
+
+@event.listens_for(Session, 'after_commit')
+def _apply_changes(session: Session) -> None:
+    for index, row_id in session.info.pop(_CHANGES, ()):
+        index.mark_stale(row_id)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_changes(session: Session) -> None:
+    session.info.pop(_CHANGES, None)
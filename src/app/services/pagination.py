@@ -0,0 +1,445 @@
+import base64
+import binascii
+import heapq
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from itertools import islice
+from typing import Any, Callable, Iterator, Sequence
+
+from fastapi import HTTPException, Request, Response, status
+from sqlalchemy import (
+    Select,
+    and_,
+    event,
+    func,
+    inspect,
+    or_,
+    select,
+    tuple_
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.elements import (
+    ClauseElement,
+    ColumnElement,
+    Executable,
+    UnaryExpression
+)
+
+from src.app.config import settings
+
+NEXT = 'next'
+PREV = 'prev'
+
+
+class CountMode(str, Enum):
+    """Способ подсчета общего числа записей для списка"""
+    exact = 'exact'
+    estimate = 'estimate'
+    none = 'none'
+
+
+@dataclass
+class Page:
+    """Страница результатов с курсорами соседних страниц"""
+    items: list[Any]
+    next_cursor: str | None = None
+    prev_cursor: str | None = None
+
+
+@dataclass
+class _OrderColumn:
+    column: ColumnElement
+    descending: bool
+
+    @classmethod
+    def parse(cls, order: Any) -> '_OrderColumn':
+        if (
+            isinstance(order, UnaryExpression)
+            and order.modifier in (operators.desc_op, operators.asc_op)
+        ):
+            return cls(order.element, order.modifier is operators.desc_op)
+        return cls(order, False)
+
+    @property
+    def key(self) -> str:
+        return self.column.key
+
+    def ordering(self, reverse: bool):
+        descending = self.descending != reverse
+        return self.column.desc() if descending else self.column.asc()
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _deserialize(column: _OrderColumn, value: Any) -> Any:
+    python_type = column.column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if issubclass(python_type, Enum):
+        return python_type(value)
+    if not isinstance(value, python_type):
+        raise ValueError(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any], direction: str) -> str:
+    """Непрозрачный курсор из значений ключа сортировки"""
+    payload = json.dumps(
+        {'v': [_serialize(value) for value in values], 'd': direction},
+        separators=(',', ':')
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(
+        cursor: str,
+        columns: Sequence[_OrderColumn]
+) -> tuple[list[Any], str]:
+    """Значения ключа сортировки и направление из курсора"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        values = payload['v']
+        direction = payload['d']
+        if direction not in (NEXT, PREV) or len(values) != len(columns):
+            raise ValueError(cursor)
+        return [
+            _deserialize(column, value)
+            for column, value in zip(columns, values)
+        ], direction
+    except (
+        binascii.Error,
+        UnicodeDecodeError,
+        TypeError,
+        KeyError,
+        ValueError
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail='Некорректный курсор'
+        )
+
+
+def _after(columns: Sequence[_OrderColumn], values: Sequence[Any], reverse):
+    """Условие для строк, идущих после values в порядке сортировки"""
+    descending = {column.descending != reverse for column in columns}
+    if len(descending) == 1:
+        row = tuple_(*(column.column for column in columns))
+        if descending.pop():
+            return row < tuple_(*values)
+        return row > tuple_(*values)
+
+    conditions = []
+    for index, column in enumerate(columns):
+        equal = [
+            previous.column == value
+            for previous, value in zip(columns[:index], values)
+        ]
+        if column.descending != reverse:
+            conditions.append(and_(*equal, column.column < values[index]))
+        else:
+            conditions.append(and_(*equal, column.column > values[index]))
+    return or_(*conditions)
+
+
+async def paginate(
+        db: AsyncSession,
+        stmt: Select,
+        order_by: Sequence[Any],
+        limit: int,
+        cursor: str | None = None,
+        offset: int = 0,
+        cursor_values: Callable[[Any], Sequence[Any]] | None = None
+) -> Page:
+    """
+    Keyset пагинация запроса.
+    order_by должен однозначно задавать порядок (последний столбец - id).
+    Без курсора используется offset для совместимости со ссылками page=.
+    Для запросов из нескольких столбцов items - строки результата,
+    значения ключа сортировки для курсора возвращает cursor_values
+    """
+    columns = [_OrderColumn.parse(order) for order in order_by]
+    direction = NEXT
+    if cursor:
+        values, direction = decode_cursor(cursor, columns)
+        reverse = direction == PREV
+        stmt = stmt.where(_after(columns, values, reverse))
+        offset = 0
+    else:
+        reverse = False
+
+    stmt = (
+        stmt.order_by(*(column.ordering(reverse) for column in columns))
+        .offset(offset)
+        .limit(limit + 1)
+    )
+    result = await db.execute(stmt)
+    if len(stmt.column_descriptions) == 1:
+        items = list(result.scalars().all())
+    else:
+        items = list(result.all())
+
+    return _page(
+        items,
+        columns,
+        limit,
+        direction,
+        bool(cursor) or offset > 0,
+        cursor_values
+    )
+
+
+def _page(
+        items: list[Any],
+        columns: Sequence[_OrderColumn],
+        limit: int,
+        direction: str,
+        has_before: bool,
+        cursor_values: Callable[[Any], Sequence[Any]] | None = None
+) -> Page:
+    """
+    Страница из limit + 1 прочитанных элементов.
+    has_before - есть элементы перед первой страницей выборки
+    """
+    has_more = len(items) > limit
+    items = items[:limit]
+    if direction == PREV:
+        items.reverse()
+
+    if direction == NEXT:
+        has_next, has_prev = has_more, has_before
+    else:
+        has_next, has_prev = True, has_more
+
+    if cursor_values is None:
+        def cursor_values(item):
+            return [getattr(item, column.key) for column in columns]
+
+    page = Page(items)
+    if items and has_next:
+        page.next_cursor = encode_cursor(cursor_values(items[-1]), NEXT)
+    if items and has_prev:
+        page.prev_cursor = encode_cursor(cursor_values(items[0]), PREV)
+    return page
+
+
+async def paginate_merged(
+        db: AsyncSession,
+        stmt: Select,
+        order_by: Sequence[Any],
+        limit: int,
+        extra: Callable[[list[Any] | None, bool], Iterator[Any]],
+        cursor: str | None = None,
+        offset: int = 0
+) -> Page:
+    """
+    Keyset пагинация запроса вместе с элементами, которых нет в таблице.
+    extra(values, reverse) возвращает такие элементы строго после ключа
+    values (None - с начала) в порядке сортировки и может быть
+    бесконечным: читается не больше offset + limit + 1 элементов.
+    Все столбцы order_by сортируются в одном направлении
+    """
+    columns = [_OrderColumn.parse(order) for order in order_by]
+    values, direction = None, NEXT
+    if cursor:
+        values, direction = decode_cursor(cursor, columns)
+        stmt = stmt.where(_after(columns, values, direction == PREV))
+        offset = 0
+    reverse = direction == PREV
+
+    size = offset + limit + 1
+    stmt = (
+        stmt.order_by(*(column.ordering(reverse) for column in columns))
+        .limit(size)
+    )
+    rows = (await db.execute(stmt)).scalars().all()
+
+    def key(item):
+        return tuple(getattr(item, column.key) for column in columns)
+
+    merged = heapq.merge(
+        rows,
+        extra(values, reverse),
+        key=key,
+        reverse=columns[0].descending != reverse
+    )
+    return _page(
+        list(islice(merged, offset, size)),
+        columns,
+        limit,
+        direction,
+        bool(cursor) or offset > 0
+    )
+
+
+def cursor_url(request: Request, cursor: str | None) -> str | None:
+    """Ссылка на страницу по курсору с сохранением фильтров"""
+    if cursor is None:
+        return None
+    url = (
+        request.url
+        .remove_query_params(['page', 'cursor'])
+        .include_query_params(cursor=cursor)
+    )
+    return f'{url.path}?{url.query}'
+
+
+def set_cursor_headers(response: Response, page: Page) -> None:
+    """Курсоры соседних страниц в заголовках JSON ответа"""
+    if page.next_cursor:
+        response.headers['X-Next-Cursor'] = page.next_cursor
+    if page.prev_cursor:
+        response.headers['X-Prev-Cursor'] = page.prev_cursor
+
+
+@dataclass
+class Total:
+    """Общее число записей, estimated - приблизительное значение"""
+    value: int
+    estimated: bool = False
+
+
+class CountCache:
+    """
+    Кэш результатов подсчета с ограничением времени жизни.
+    Ключ начинается с имени таблицы и id команды, по ним записи
+    сбрасываются при изменении строк команды
+    """
+
+    def __init__(self, ttl: int, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple, tuple[float, int]] = OrderedDict()
+
+    def get(self, key: tuple) -> int | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: tuple, value: int) -> None:
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, table: str, team_id: int | None = None) -> None:
+        """Сбросить записи таблицы (или только одной команды)"""
+        for key in list(self._entries):
+            if key[0] == table and (team_id is None or key[1] == team_id):
+                del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+count_cache = CountCache(
+    ttl=settings.COUNT_CACHE_TTL,
+    max_size=settings.COUNT_CACHE_MAX_SIZE
+)
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) для оценки числа строк планировщиком"""
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, 'postgresql')
+def _compile_explain(element, compiler, **kw):
+    return 'EXPLAIN (FORMAT JSON) ' + compiler.process(element.statement, **kw)
+
+
+async def _planner_estimate(db: AsyncSession, stmt: Select) -> int:
+    plan = (await db.execute(_Explain(stmt))).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+async def count_rows(
+        db: AsyncSession,
+        stmt: Select,
+        mode: CountMode | str,
+        cache_key: tuple | None = None
+) -> Total | None:
+    """
+    Общее число строк запроса.
+    exact - COUNT(*), estimate - значение из кэша, оценка планировщика
+    Postgres или COUNT(*) с сохранением в кэш, none - без подсчета
+    """
+    if mode == CountMode.none:
+        return None
+
+    stmt = stmt.order_by(None)
+    if mode == CountMode.estimate:
+        if cache_key is not None:
+            cached = count_cache.get(cache_key)
+            if cached is not None:
+                return Total(cached, estimated=True)
+
+        if db.get_bind().dialect.name == 'postgresql':
+            value = await _planner_estimate(db, stmt)
+        else:
+            value = await db.scalar(
+                select(func.count()).select_from(stmt.subquery())
+            )
+        if cache_key is not None:
+            count_cache.set(cache_key, value)
+        return Total(value, estimated=True)
+
+    value = await db.scalar(select(func.count()).select_from(stmt.subquery()))
+    return Total(value)
+
+
+# Таблицы, изменение которых влияет на подсчеты других таблиц
+_DEPENDENT_TABLES = {'meeting_participants': 'meetings'}
+
+
+@event.listens_for(Session, 'after_flush')
+def _invalidate_counts(session: Session, flush_context) -> None:
+    """Сброс кэша подсчетов при изменении строк команды"""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(obj, '__tablename__', None)
+        if table in _DEPENDENT_TABLES:
+            count_cache.invalidate(_DEPENDENT_TABLES[table])
+        elif hasattr(obj, 'team_id'):
+            history = inspect(obj).attrs.team_id.history
+            for team_id in {obj.team_id, *history.deleted}:
+                count_cache.invalidate(table, team_id)
+
+
+@event.listens_for(Session, 'do_orm_execute')
+def _invalidate_bulk_counts(orm_execute_state) -> None:
+    """Сброс кэша подсчетов при массовых вставках и изменениях"""
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None:
+        table = mapper.local_table.name
+        count_cache.invalidate(_DEPENDENT_TABLES.get(table, table))
@@ -3,6 +3,7 @@ from sqlalchemy import select
 
 from src.app.models.task import Task
 from src.app.schemas.task import TaskCreate, TaskUpdate
+from src.app.services.versioning import update_versioned
 
 
 async def create_task(db: AsyncSession, task_data: TaskCreate) -> Task:
@@ -22,14 +23,23 @@ async def get_task(db: AsyncSession, task_id: int) -> Task | None:
 
 async def update_task(
         db: AsyncSession,
-        task: Task,
-        task_data: TaskUpdate
-) -> Task:
-    """Изменить задачу"""
-    for field, value in task_data.model_dump(exclude_unset=True).items():
-        setattr(task, field, value)
-    await db.commit()
-    await db.refresh(task)
+        task_id: int,
+        task_data: TaskUpdate,
+        versions: list[int] | None = None
+) -> Task | None:
+    """
+    Изменить задачу, если ее версия входит в versions.
+    None - задачи нет или она уже изменена
+    """
+    task = await update_versioned(
+        db,
+        Task,
+        task_id,
+        task_data.model_dump(exclude_unset=True),
+        versions
+    )
+    if task is not None:
+        await db.commit()
     return task
 
 
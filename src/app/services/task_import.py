@@ -0,0 +1,288 @@
+import csv
+import json
+from dataclasses import dataclass
+from datetime import datetime, UTC
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.config import settings
+from src.app.models.task import Task
+from src.app.models.team import Team
+from src.app.models.user import User
+from src.app.schemas.task import (
+    TaskCreate,
+    TaskImportError,
+    TaskImportReport
+)
+from src.app.services.export import ExportFormat
+from src.app.services.pagination import count_cache
+
+# Столбцы tasks в порядке записей для COPY
+COPY_COLUMNS = (
+    'title',
+    'description',
+    'status',
+    'deadline_date',
+    'performer_id',
+    'manager_id',
+    'team_id',
+    'created_at',
+    'updated_at'
+)
+# Максимальное число значений в одном IN при поиске ссылок
+LOOKUP_CHUNK_SIZE = 10000
+
+
+@dataclass
+class PendingTask:
+    """Строка, прошедшая проверку схемой, но еще не проверенная по БД"""
+    line: int
+    task: TaskCreate
+    performer_email: str | None = None
+
+
+def _parse_csv(lines: Iterable[str]) -> Iterator[tuple[int, Any]]:
+    reader = csv.DictReader(lines)
+    for row in reader:
+        yield reader.line_num, {
+            key: value
+            for key, value in row.items()
+            if key and value not in ('', None)
+        }
+
+
+def _parse_ndjson(lines: Iterable[str]) -> Iterator[tuple[int, Any]]:
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield number, json.loads(line)
+        except json.JSONDecodeError:
+            yield number, None
+
+
+def _error_messages(exc: ValidationError) -> list[str]:
+    return [
+        ': '.join(filter(None, (
+            '.'.join(str(part) for part in error['loc']),
+            error['msg']
+        )))
+        for error in exc.errors()
+    ]
+
+
+def validate_rows(
+        lines: Iterable[str],
+        file_format: ExportFormat
+) -> Iterator[PendingTask | TaskImportError]:
+    """
+    Построчный разбор и проверка файла схемой TaskCreate.
+    Вместо performer_id строка может содержать performer_email
+    """
+    parse = _parse_csv if file_format == ExportFormat.csv else _parse_ndjson
+
+    for line, row in parse(lines):
+        if not isinstance(row, dict):
+            yield TaskImportError(line=line, errors=['Ожидается JSON объект'])
+            continue
+
+        performer_email = row.pop('performer_email', None)
+        if not isinstance(performer_email, (str, type(None))):
+            yield TaskImportError(
+                line=line,
+                errors=['performer_email: Ожидается строка']
+            )
+            continue
+
+        try:
+            task = TaskCreate.model_validate(row)
+        except ValidationError as exc:
+            yield TaskImportError(line=line, errors=_error_messages(exc))
+            continue
+        except TypeError as exc:
+            yield TaskImportError(
+                line=line,
+                errors=[f'Некорректные данные: {exc}']
+            )
+            continue
+        yield PendingTask(line, task, performer_email)
+
+
+def _chunks(values: list, size: int) -> Iterator[list]:
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+
+async def _existing_ids(db: AsyncSession, column, ids: set[int]) -> set[int]:
+    found = set()
+    for chunk in _chunks(list(ids), LOOKUP_CHUNK_SIZE):
+        result = await db.execute(select(column).where(column.in_(chunk)))
+        found.update(result.scalars())
+    return found
+
+
+async def _user_ids_by_email(
+        db: AsyncSession,
+        emails: set[str]
+) -> dict[str, int]:
+    found = {}
+    for chunk in _chunks(list(emails), LOOKUP_CHUNK_SIZE):
+        result = await db.execute(
+            select(func.lower(User.email), User.id)
+            .where(func.lower(User.email).in_(chunk))
+        )
+        found.update(result.all())
+    return found
+
+
+async def _resolve_references(
+        db: AsyncSession,
+        pending: list[PendingTask]
+) -> tuple[list[dict], list[TaskImportError]]:
+    """
+    Проверка команд, пользователей и email исполнителей:
+    по одному запросу (на LOOKUP_CHUNK_SIZE значений) на пачку строк
+    """
+    emails = {
+        item.performer_email.lower()
+        for item in pending
+        if item.performer_email
+    }
+    user_ids = {
+        user_id
+        for item in pending
+        for user_id in (item.task.performer_id, item.task.manager_id)
+        if user_id is not None
+    }
+    team_ids = {item.task.team_id for item in pending}
+
+    ids_by_email = await _user_ids_by_email(db, emails)
+    existing_users = await _existing_ids(db, User.id, user_ids)
+    existing_teams = await _existing_ids(db, Team.id, team_ids)
+
+    now = datetime.now(UTC)
+    rows = []
+    errors = []
+    for item in pending:
+        task = item.task
+        row_errors = []
+        performer_id = task.performer_id
+
+        if item.performer_email:
+            email_id = ids_by_email.get(item.performer_email.lower())
+            if email_id is None:
+                row_errors.append(
+                    f'Пользователь {item.performer_email} не найден'
+                )
+            elif performer_id is not None and performer_id != email_id:
+                row_errors.append(
+                    'performer_id не совпадает с performer_email'
+                )
+            performer_id = email_id
+        elif performer_id is not None and performer_id not in existing_users:
+            row_errors.append(f'Пользователь {performer_id} не найден')
+
+        if (
+            task.manager_id is not None
+            and task.manager_id not in existing_users
+        ):
+            row_errors.append(f'Пользователь {task.manager_id} не найден')
+        if task.team_id not in existing_teams:
+            row_errors.append(f'Команда {task.team_id} не найдена')
+
+        if row_errors:
+            errors.append(TaskImportError(line=item.line, errors=row_errors))
+            continue
+
+        rows.append({
+            'title': task.title,
+            'description': task.description or '',
+            'status': task.status,
+            'deadline_date': task.deadline_date,
+            'performer_id': performer_id,
+            'manager_id': task.manager_id,
+            'team_id': task.team_id,
+            'created_at': now,
+            'updated_at': now,
+        })
+
+    return rows, errors
+
+
+async def _copy_rows(db: AsyncSession, rows: list[dict]) -> None:
+    """COPY в таблицу задач через соединение asyncpg текущей транзакции"""
+    connection = await db.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        Task.__tablename__,
+        columns=COPY_COLUMNS,
+        records=[
+            tuple(
+                row[column].name if column == 'status' else row[column]
+                for column in COPY_COLUMNS
+            )
+            for row in rows
+        ]
+    )
+
+
+async def _insert_rows(db: AsyncSession, rows: list[dict]) -> None:
+    if db.get_bind().dialect.name == 'postgresql':
+        await _copy_rows(db, rows)
+    else:
+        await db.execute(insert(Task), rows)
+
+
+def _next_batch(
+        results: Iterator[PendingTask | TaskImportError],
+        size: int
+) -> list[PendingTask | TaskImportError]:
+    return list(islice(results, size))
+
+
+async def import_tasks(
+        db: AsyncSession,
+        lines: Iterable[str],
+        file_format: ExportFormat
+) -> TaskImportReport:
+    """
+    Разбор, проверка и вставка файла пачками по TASK_IMPORT_BATCH_SIZE
+    строк в одной транзакции: COPY на Postgres, иначе executemany.
+    В памяти остается только отчет об ошибках, строки пачки
+    освобождаются после вставки
+    """
+    results = validate_rows(lines, file_format)
+    total = 0
+    imported = 0
+    errors = []
+
+    while batch := await run_in_threadpool(
+        _next_batch,
+        results,
+        settings.TASK_IMPORT_BATCH_SIZE
+    ):
+        total += len(batch)
+        pending = [item for item in batch if isinstance(item, PendingTask)]
+        rows, reference_errors = await _resolve_references(db, pending)
+        errors.extend(sorted(
+            [
+                item for item in batch
+                if isinstance(item, TaskImportError)
+            ] + reference_errors,
+            key=lambda error: error.line
+        ))
+        if rows:
+            await _insert_rows(db, rows)
+            imported += len(rows)
+
+    if imported:
+        await db.commit()
+        # COPY в Postgres идет мимо ORM и не сбрасывает кэш подсчетов
+        count_cache.invalidate(Task.__tablename__)
+
+    return TaskImportReport(total=total, imported=imported, errors=errors)
@@ -0,0 +1,143 @@
+import re
+from dataclasses import dataclass
+
+from markupsafe import Markup, escape
+from sqlalchemy import Float, Select, column, func, literal_column, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.models.task import (
+    Task,
+    SEARCH_CONFIG,
+    SEARCH_FTS_TABLE,
+    SEARCH_VECTOR
+)
+from src.app.services.pagination import Page, paginate
+
+# Маркеры совпадения в сниппете, заменяются на <mark> после экранирования
+MATCH_START = '\x02'
+MATCH_END = '\x03'
+# Длина сниппета в словах
+SNIPPET_WORDS = 16
+# Вес совпадений в названии относительно описания (SQLite bm25)
+TITLE_WEIGHT = 10.0
+
+_fts = table(SEARCH_FTS_TABLE, column('rowid'))
+
+
+@dataclass
+class TaskSearchHit:
+    """Найденная задача с рангом и подсвеченным фрагментом текста"""
+    task: Task
+    rank: float
+    snippet: Markup
+
+
+def search_terms(q: str | None) -> list[str]:
+    """Слова поискового запроса"""
+    return re.findall(r'\w+', q or '')
+
+
+def highlight(snippet: str | None) -> Markup:
+    """Экранированный сниппет с совпадениями в <mark>"""
+    return (
+        escape(snippet or '')
+        .replace(MATCH_START, Markup('<mark>'))
+        .replace(MATCH_END, Markup('</mark>'))
+    )
+
+
+def _postgres_search(stmt: Select, terms: list[str]) -> tuple[Select, list]:
+    config = literal_column(f"'{SEARCH_CONFIG}'::regconfig")
+    # выражение совпадает с индексом ix_tasks_search_vector
+    vector = literal_column(f'({SEARCH_VECTOR})')
+    query = func.plainto_tsquery(config, ' '.join(terms))
+    rank = func.ts_rank(vector, query, type_=Float)
+    snippet = func.ts_headline(
+        config,
+        Task.title + ' — ' + func.coalesce(Task.description, ''),
+        query,
+        f'StartSel={MATCH_START}, StopSel={MATCH_END}, '
+        f'MaxWords={SNIPPET_WORDS}, MinWords={SNIPPET_WORDS // 2}'
+    )
+    stmt = stmt.add_columns(
+        rank.label('rank'),
+        snippet.label('snippet')
+    ).where(vector.op('@@')(query))
+    return stmt, [rank.desc(), Task.id]
+
+
+def _sqlite_search(stmt: Select, terms: list[str]) -> tuple[Select, list]:
+    fts = literal_column(SEARCH_FTS_TABLE)
+    query = ' '.join(f'"{term}"' for term in terms)
+    rank = func.bm25(fts, TITLE_WEIGHT, 1.0, type_=Float)
+    snippet = func.snippet(
+        fts,
+        -1,
+        MATCH_START,
+        MATCH_END,
+        '…',
+        SNIPPET_WORDS
+    )
+    stmt = (
+        stmt.add_columns(rank.label('rank'), snippet.label('snippet'))
+        .join(_fts, _fts.c.rowid == Task.id)
+        .where(
+            text(f'{SEARCH_FTS_TABLE} MATCH :search_query')
+            .bindparams(search_query=query)
+        )
+    )
+    # bm25 тем меньше, чем лучше совпадение
+    return stmt, [rank, Task.id]
+
+
+def search_statement(
+        db: AsyncSession,
+        stmt: Select,
+        terms: list[str]
+) -> tuple[Select, list]:
+    """
+    Запрос задач с условием поиска, рангом и сниппетом
+    и порядок сортировки по релевантности для пагинации
+    """
+    if db.get_bind().dialect.name == 'postgresql':
+        return _postgres_search(stmt, terms)
+    return _sqlite_search(stmt, terms)
+
+
+def matching_tasks(
+        db: AsyncSession,
+        stmt: Select,
+        terms: list[str]
+) -> Select:
+    """Запрос id найденных задач без ранга и сниппетов (для подсчета)"""
+    stmt, _ = search_statement(db, stmt, terms)
+    return stmt.with_only_columns(Task.id)
+
+
+async def search_tasks(
+        db: AsyncSession,
+        stmt: Select,
+        terms: list[str],
+        limit: int,
+        cursor: str | None = None,
+        offset: int = 0
+) -> Page:
+    """
+    Полнотекстовый поиск по задачам запроса stmt
+    с keyset пагинацией по рангу и id
+    """
+    stmt, order_by = search_statement(db, stmt, terms)
+    page = await paginate(
+        db,
+        stmt,
+        order_by,
+        limit,
+        cursor=cursor,
+        offset=offset,
+        cursor_values=lambda row: [row.rank, row.Task.id]
+    )
+    page.items = [
+        TaskSearchHit(row.Task, row.rank, highlight(row.snippet))
+        for row in page.items
+    ]
+    return page
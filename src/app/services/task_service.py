@@ -1,8 +1,10 @@
 from fastapi import HTTPException, status
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.models.task import TaskStatus, Task
 from src.app.models.user import User
+from src.app.schemas.task import TaskStatusBatchResult, TaskStatusSkip
 
 STATUS_TRANSITIONS = {
     TaskStatus.open: TaskStatus.in_progress,
@@ -45,3 +47,99 @@ async def change_task_status(
     await db.commit()
     await db.refresh(task)
     return task
+
+
+def previous_status(new_status: TaskStatus) -> TaskStatus | None:
+    """Статус, из которого разрешен переход в new_status"""
+    for current, allowed_next in STATUS_TRANSITIONS.items():
+        if allowed_next == new_status:
+            return current
+    return None
+
+
+def _status_access_conditions(user: User) -> list:
+    """
+    Условия на задачи, статус которых пользователь может менять.
+    Задачи другой команды недоступны для всех ролей,
+    как в /tasks/{task_id}/status
+    """
+    conditions = [
+        Task.performer_id.is_not(None),
+        Task.team_id == user.team_id
+    ]
+    if user.role not in ['manager', 'admin']:
+        conditions.append(Task.performer_id == user.id)
+    return conditions
+
+
+def _skip_reason(task, new_status: TaskStatus, user: User) -> str:
+    if task.team_id != user.team_id:
+        return 'Задача не найдена'
+    if (
+        not task.performer_id or
+        user.id != task.performer_id
+        and user.role not in ['manager', 'admin']
+    ):
+        return 'Только исполнитель может менять статус задачи'
+    if task.status == new_status:
+        return f'Задача уже в статусе {new_status.value}'
+    return (
+        f'Невозможно изменение статуса {task.status.value} '
+        f'на {new_status.value}'
+    )
+
+
+async def change_tasks_status(
+        db: AsyncSession,
+        task_ids: list[int],
+        new_status: TaskStatus,
+        user: User
+) -> TaskStatusBatchResult:
+    """
+    Изменить статус нескольких задач одним
+    UPDATE ... WHERE status = :expected RETURNING id.
+    Для пропущенных задач причина определяется одним SELECT
+    """
+    task_ids = list(dict.fromkeys(task_ids))
+    updated = []
+
+    expected = previous_status(new_status)
+    if expected is not None:
+        result = await db.execute(
+            update(Task)
+            .where(
+                Task.id.in_(task_ids),
+                Task.status == expected,
+                *_status_access_conditions(user)
+            )
+            .values(status=new_status, version=Task.version + 1)
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated = sorted(result.scalars())
+        await db.commit()
+
+    remaining = set(task_ids).difference(updated)
+    skipped = []
+    if remaining:
+        result = await db.execute(
+            select(
+                Task.id,
+                Task.status,
+                Task.team_id,
+                Task.performer_id
+            )
+            .where(Task.id.in_(remaining))
+        )
+        tasks = {task.id: task for task in result}
+        for task_id in task_ids:
+            if task_id not in remaining:
+                continue
+            task = tasks.get(task_id)
+            reason = (
+                _skip_reason(task, new_status, user)
+                if task else 'Задача не найдена'
+            )
+            skipped.append(TaskStatusSkip(id=task_id, reason=reason))
+
+    return TaskStatusBatchResult(updated=updated, skipped=skipped)
@@ -0,0 +1,232 @@
+import re
+from collections import Counter, defaultdict
+from enum import Enum
+from typing import Callable, Iterable
+
+from fastapi import Depends, Request
+from sqlalchemy import String, cast, false
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.app.database import get_db
+from src.app.models.trigram import TRIGRAM_INDEXES
+from src.app.services.memory_index import MemoryIndex, register
+
+# Порог сходства нечеткого поиска (pg_trgm.similarity_threshold по умолчанию)
+SIMILARITY_THRESHOLD = 0.3
+# При большем числе кандидатов SQLite проверяет LIKE по всей таблице
+MAX_CANDIDATES = 10000
+
+
+class TextMatch(str, Enum):
+    """Способ сравнения строки поиска со столбцом"""
+    substring = 'substring'
+    fuzzy = 'fuzzy'
+
+
+def _words(value: str) -> list[str]:
+    return re.findall(r'[^\W_]+', value.lower())
+
+
+def trigrams(value: str) -> set[str]:
+    """
+    Триграммы строки как в pg_trgm: слова в нижнем регистре,
+    дополненные двумя пробелами в начале и одним в конце
+    """
+    result = set()
+    for word in _words(value):
+        padded = f'  {word} '
+        result.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return result
+
+
+def _inner_trigrams(value: str) -> set[str]:
+    """Триграммы, которые есть в любой строке, содержащей value"""
+    result = set()
+    for word in _words(value):
+        result.update(word[i:i + 3] for i in range(len(word) - 2))
+    return result
+
+
+def escape_like(value: str) -> str:
+    return (
+        value.replace('/', '//')
+        .replace('%', '/%')
+        .replace('_', '/_')
+    )
+
+
+def contains_pattern(column: ColumnElement, value: str) -> ColumnElement:
+    """ILIKE '%value%' (в Postgres использует триграммный индекс)"""
+    return column.ilike(f'%{escape_like(value)}%', escape='/')
+
+
+class TrigramIndex(MemoryIndex):
+    """Триграммный индекс столбца в памяти процесса для SQLite"""
+
+    def __init__(self, column: InstrumentedAttribute):
+        super().__init__(column.class_, column)
+        self._postings: defaultdict[str, set[int]] = defaultdict(set)
+        self._trigrams: dict[int, set[str]] = {}
+
+    def add(self, row_id: int, value: str | None) -> None:
+        self.remove(row_id)
+        grams = trigrams(value or '')
+        self._trigrams[row_id] = grams
+        for gram in grams:
+            self._postings[gram].add(row_id)
+
+    def remove(self, row_id: int) -> None:
+        for gram in self._trigrams.pop(row_id, ()):
+            postings = self._postings[gram]
+            postings.discard(row_id)
+            if not postings:
+                del self._postings[gram]
+
+    def reset(self) -> None:
+        self._postings.clear()
+        self._trigrams.clear()
+
+    def candidates(self, value: str) -> set[int] | None:
+        """
+        id строк, которые могут содержать value.
+        None - триграммы не сужают поиск (короткая строка
+        или слишком много кандидатов)
+        """
+        grams = _inner_trigrams(value)
+        if not grams:
+            return None
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in grams),
+            key=len
+        )
+        result = set(postings[0])
+        for ids in postings[1:]:
+            if not result:
+                break
+            result &= ids
+        return result if len(result) <= MAX_CANDIDATES else None
+
+    def similar(
+            self,
+            value: str,
+            threshold: float = SIMILARITY_THRESHOLD
+    ) -> list[int]:
+        """id строк со сходством similarity() не меньше threshold"""
+        grams = trigrams(value)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+        return [
+            row_id for row_id, count in shared.items()
+            if count / (len(grams) + len(self._trigrams[row_id]) - count)
+            >= threshold
+        ]
+
+
+# Индексы SQLite по (таблица, столбец), создаются при первом поиске
+_indexes: dict[tuple[str, str], TrigramIndex] = {}
+
+
+def _key(column: InstrumentedAttribute) -> tuple[str, str]:
+    return column.class_.__tablename__, column.key
+
+
+def trigram_index(column: InstrumentedAttribute) -> TrigramIndex | None:
+    """Индекс в памяти для столбца с триграммным индексом Postgres"""
+    key = _key(column)
+    if key not in TRIGRAM_INDEXES:
+        return None
+    if key not in _indexes:
+        _indexes[key] = register(TrigramIndex(column))
+    return _indexes[key]
+
+
+class TextSearch:
+    """
+    Условия поиска подстроки и нечеткого поиска по текстовым столбцам.
+    Postgres: ILIKE и оператор % с триграммными GIN индексами,
+    SQLite: кандидаты из индекса в памяти с проверкой LIKE
+    """
+
+    def __init__(self, dialect: str):
+        self.dialect = dialect
+
+    def contains(self, column: InstrumentedAttribute, value: str):
+        if not isinstance(column.type, String):
+            return contains_pattern(cast(column, String), value)
+
+        condition = contains_pattern(column, value)
+        index = self.memory_index(column)
+        if index is not None:
+            ids = index.candidates(value)
+            if ids is not None:
+                condition = index.model.id.in_(ids) & condition
+        return condition
+
+    def similar(self, column: InstrumentedAttribute, value: str):
+        if self.dialect == 'postgresql':
+            return column.op('%')(value)
+        index = self.memory_index(column)
+        if index is None:
+            return self.contains(column, value)
+        ids = index.similar(value)
+        return index.model.id.in_(ids) if ids else false()
+
+    def match(
+            self,
+            column: InstrumentedAttribute,
+            value: str,
+            mode: TextMatch = TextMatch.substring
+    ):
+        if mode == TextMatch.fuzzy:
+            return self.similar(column, value)
+        return self.contains(column, value)
+
+    def memory_index(
+            self,
+            column: InstrumentedAttribute
+    ) -> TrigramIndex | None:
+        """Индекс в памяти, если поиск по столбцу идет не в Postgres"""
+        if self.dialect == 'postgresql':
+            return None
+        return trigram_index(column)
+
+    async def refresh(
+            self,
+            db: AsyncSession,
+            columns: Iterable[InstrumentedAttribute]
+    ) -> None:
+        """Актуализация индексов в памяти для столбцов поиска"""
+        for column in columns:
+            index = self.memory_index(column)
+            if index is not None:
+                await index.refresh(db)
+
+
+async def get_text_search(
+        db: AsyncSession,
+        columns: tuple[InstrumentedAttribute, ...] = ()
+) -> TextSearch:
+    """Поиск для диалекта сессии с актуальными индексами в памяти"""
+    search = TextSearch(db.get_bind().dialect.name)
+    await search.refresh(db, columns)
+    return search
+
+
+def text_search(**columns: InstrumentedAttribute) -> Callable:
+    """
+    Зависимость FastAPI, подготавливающая поиск по столбцам,
+    для которых передан query параметр с тем же именем
+    """
+    async def dependency(
+            request: Request,
+            db: AsyncSession = Depends(get_db)
+    ) -> TextSearch:
+        return await get_text_search(db, tuple(
+            column for param, column in columns.items()
+            if request.query_params.get(param)
+        ))
+
+    return dependency
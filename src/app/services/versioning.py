@@ -0,0 +1,85 @@
+from typing import Any, Optional
+
+from fastapi import Header, HTTPException, Response, status
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.services.memory_index import TRACKED_ROWS, track_rows
+
+
+def etag(version: int) -> str:
+    """Значение заголовка ETag для версии строки"""
+    return f'"{version}"'
+
+
+def set_etag(response: Response, obj: Any) -> None:
+    response.headers['ETag'] = etag(obj.version)
+
+
+def if_match_versions(
+        if_match: Optional[str] = Header(
+            None,
+            description='ETag, полученный при чтении записи'
+        )
+) -> list[int] | None:
+    """
+    Версии из заголовка If-Match.
+    None - изменение без проверки версии (заголовка нет или If-Match: *)
+    """
+    if if_match is None or if_match.strip() == '*':
+        return None
+
+    versions = []
+    for tag in if_match.split(','):
+        tag = tag.strip().removeprefix('W/').strip('"')
+        if tag.isdigit():
+            versions.append(int(tag))
+    if not versions:
+        raise precondition_failed()
+    return versions
+
+
+def precondition_failed() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_412_PRECONDITION_FAILED,
+        detail='Запись была изменена, получите актуальную версию'
+    )
+
+
+async def update_versioned(
+        db: AsyncSession,
+        model: type,
+        object_id: int,
+        values: dict[str, Any],
+        versions: list[int] | None = None
+) -> Any | None:
+    """
+    Изменение строки одним запросом
+    UPDATE ... WHERE id = :id AND version IN (:versions) RETURNING *
+    с увеличением версии. None, если строки нет или версия не совпала
+    """
+    stmt = update(model).where(model.id == object_id)
+    if versions is not None:
+        stmt = stmt.where(model.version.in_(versions))
+    stmt = (
+        stmt.values(**values, version=model.version + 1)
+        .returning(model)
+        .execution_options(populate_existing=True, **{TRACKED_ROWS: True})
+    )
+    track_rows(db, model.__tablename__, [object_id])
+    return (await db.execute(stmt)).scalar_one_or_none()
+
+
+async def raise_update_failed(
+        db: AsyncSession,
+        model: type,
+        object_id: int,
+        not_found_detail: str
+) -> None:
+    """404, если строки нет, иначе 412 (версия не совпала)"""
+    if await db.get(model, object_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=not_found_detail
+        )
+    raise precondition_failed()
@@ -4,6 +4,12 @@ from httpx import AsyncClient, ASGITransport
 
 from src.app.database import get_db, Base
 from src.app.main import app
+from src.app.models.user import User
+from src.app.auth.dependencies import get_current_user
+from src.app.auth.rate_limit import rate_limit_storage
+from src.app.services.pagination import count_cache
+from src.app.services.memory_index import clear_indexes
+from src.app.services.calendar_feed import feed_cache
 
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
@@ -25,6 +31,54 @@ async def session(engine):
         await session.rollback()
 
 
+@pytest_asyncio.fixture
+async def current_user(request, session):
+    """
+    Пользователь команды 1, подставленный в get_current_user.
+    Роль задается косвенной параметризацией, по умолчанию 'user':
+    @pytest.mark.parametrize('current_user', ['admin'], indirect=True)
+    """
+    role = getattr(request, 'param', 'user')
+    user = User(
+        first_name='Test',
+        last_name='User',
+        email=f'{role}@test.com',
+        hashed_password='password',
+        role=role,
+        team_id=1
+    )
+    session.add(user)
+    await session.commit()
+    await session.refresh(user)
+    app.dependency_overrides[get_current_user] = lambda: user
+    yield user
+    app.dependency_overrides.pop(get_current_user, None)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def reset_rate_limits():
+    await rate_limit_storage.reset()
+    yield
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_count_cache():
+    count_cache.clear()
+    yield
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_feed_cache():
+    feed_cache.clear()
+    yield
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_memory_indexes():
+    clear_indexes()
+    yield
+
+
 @pytest_asyncio.fixture
 async def client(session):
     async def override_get_db():
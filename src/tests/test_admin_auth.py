@@ -0,0 +1,54 @@
+import pytest
+from starlette.requests import Request
+
+from src.app.admin import admin_config
+from src.app.admin.admin_config import AdminAuth, admin_cache, SECRET_KEY
+from src.app.auth.auth import access_backend
+
+
+def make_request(token: str) -> Request:
+    return Request({
+        'type': 'http',
+        'method': 'GET',
+        'path': '/admin/user/list',
+        'headers': [(b'cookie', f'access_token="Bearer {token}"'.encode())]
+    })
+
+
+@pytest.fixture(autouse=True)
+def clear_admin_cache():
+    admin_cache.clear()
+    yield
+    admin_cache.clear()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('current_user', ['admin'], indirect=True)
+async def test_admin_auth_uses_cache(session, monkeypatch, current_user):
+    """Тест авторизации admin по кэшу без обращения к БД"""
+    token = await access_backend.get_strategy().write_token(current_user)
+
+    monkeypatch.setattr(admin_config, 'async_session', lambda: session)
+    backend = AdminAuth(secret_key=SECRET_KEY)
+
+    assert await backend.authenticate(make_request(token)) is True
+    assert len(admin_cache) == 1
+
+    def fail_session():
+        raise AssertionError('Повторный запрос к БД')
+
+    monkeypatch.setattr(admin_config, 'async_session', fail_session)
+    assert await backend.authenticate(make_request(token)) is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('current_user', ['admin'], indirect=True)
+async def test_admin_cache_invalidated_on_role_change(session, current_user):
+    """Тест сброса кэша admin при изменении роли"""
+    token = await access_backend.get_strategy().write_token(current_user)
+    admin_cache.set(token, current_user)
+
+    current_user.role = 'user'
+    await session.commit()
+
+    assert admin_cache.get(token) is None
@@ -0,0 +1,149 @@
+import pytest
+from datetime import datetime, timedelta
+from fastapi import status
+
+from src.app.main import app
+from src.app.models.user import User
+from src.app.models.task import Task
+from src.app.models.meeting import Meeting
+from src.app.models.meeting_participants import MeetingParticipant
+from src.app.models.meeting_series import (
+    MeetingFrequency,
+    MeetingSeries,
+    MeetingSeriesException,
+    MeetingSeriesParticipant
+)
+from src.app.auth.dependencies import get_current_user
+from src.app.services.calendar_feed import feed_cache, feed_token
+
+BASE = datetime(2031, 3, 3, 7, 0)
+
+
+async def create_calendar(session) -> tuple[User, Task]:
+    """Встреча, серия с отмененной встречей и задача со сроком"""
+    user = User(
+        id=1,
+        first_name='Иван',
+        last_name='Петров',
+        email='user1@test.com',
+        hashed_password='password',
+        team_id=1
+    )
+    meeting = Meeting(
+        title='Ревью; итоги, планы',
+        scheduled_at=BASE,
+        duration_minutes=30,
+        organizer_id=1,
+        team_id=1
+    )
+    series = MeetingSeries(
+        title='Стендап',
+        starts_at=BASE + timedelta(hours=2),
+        frequency=MeetingFrequency.weekly,
+        organizer_id=1,
+        team_id=1,
+        exceptions=[
+            MeetingSeriesException(
+                occurs_at=BASE + timedelta(days=7, hours=2)
+            )
+        ]
+    )
+    task = Task(
+        title='Отчет',
+        description='Квартальный отчет',
+        performer_id=1,
+        deadline_date=BASE + timedelta(days=2),
+        team_id=1
+    )
+    session.add_all([user, meeting, series, task])
+    await session.flush()
+    session.add_all([
+        MeetingParticipant(meeting_id=meeting.id, user_id=1),
+        MeetingSeriesParticipant(series_id=series.id, user_id=1),
+    ])
+    await session.commit()
+    return user, task
+
+
+@pytest.mark.asyncio
+async def test_calendar_feed(client, session):
+    """Тест содержимого календаря пользователя"""
+    user, _ = await create_calendar(session)
+
+    response = await client.get(f'/meetings/feed/{feed_token(user)}.ics')
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'].startswith('text/calendar')
+    assert response.headers['etag'].startswith('"')
+    assert response.headers['last-modified'].endswith('GMT')
+
+    lines = response.text.split('\r\n')
+    assert lines[0] == 'BEGIN:VCALENDAR'
+    assert 'UID:meeting-1@management-platform' in lines
+    assert 'DTSTART:20310303T070000' in lines
+    assert 'DTEND:20310303T073000' in lines
+    assert 'SUMMARY:Ревью\\; итоги\\, планы' in lines
+    assert 'RRULE:FREQ=WEEKLY;INTERVAL=1' in lines
+    assert 'EXDATE:20310310T090000' in lines
+    assert 'DTSTART:20310305T070000' in lines
+    assert 'SUMMARY:Дедлайн: Отчет' in lines
+    assert all(len(line.encode()) <= 75 for line in lines)
+
+    app.dependency_overrides[get_current_user] = lambda: user
+    response = await client.get('/users/profile')
+    assert f'/meetings/feed/{feed_token(user)}.ics' in response.text
+
+
+@pytest.mark.asyncio
+async def test_calendar_feed_conditional_get(client, session):
+    """Тест ответов 304 и пересборки только измененных событий"""
+    user, task = await create_calendar(session)
+    url = f'/meetings/feed/{feed_token(user)}.ics'
+
+    response = await client.get(url)
+    etag = response.headers['etag']
+    last_modified = response.headers['last-modified']
+    meeting_event = feed_cache.get(user.id).events['meeting', 1][1]
+
+    response = await client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b''
+    assert response.headers['etag'] == etag
+
+    response = await client.get(
+        url,
+        headers={'If-Modified-Since': last_modified}
+    )
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    task.title = 'Годовой отчет'
+    await session.commit()
+
+    response = await client.get(url, headers={'If-None-Match': etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['etag'] != etag
+    assert 'SUMMARY:Дедлайн: Годовой отчет' in response.text
+    # неизмененные события берутся из прошлой сборки
+    assert feed_cache.get(user.id).events['meeting', 1][1] is meeting_event
+
+    await session.delete(task)
+    await session.commit()
+    response = await client.get(url)
+    assert 'Дедлайн' not in response.text
+
+
+@pytest.mark.asyncio
+async def test_calendar_feed_token(client, session):
+    """Тест недействительных ссылок на календарь"""
+    user, _ = await create_calendar(session)
+    token = feed_token(user)
+
+    response = await client.get('/meetings/feed/token.ics')
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    user.hashed_password = 'new password'
+    await session.commit()
+    response = await client.get(f'/meetings/feed/{token}.ics')
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await client.get(f'/meetings/feed/{feed_token(user)}.ics')
+    assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,104 @@
+import csv
+import io
+import json
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.app.models.task import Task
+from src.app.models.meeting import Meeting
+from src.app.models.meeting_participants import MeetingParticipant
+from src.app.main import app
+from src.app.config import settings
+from src.app.database import get_session_factory
+
+
+@pytest.fixture
+def export_session(engine, monkeypatch):
+    """Выгрузка открывает собственные сессии тестового движка"""
+    monkeypatch.setattr(settings, 'EXPORT_BATCH_SIZE', 2)
+    app.dependency_overrides[get_session_factory] = lambda: (
+        async_sessionmaker(engine, expire_on_commit=False)
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('current_user', ['admin'], indirect=True)
+async def test_export_tasks_ndjson_with_filters(
+        client,
+        session,
+        export_session,
+        current_user
+):
+    """Тест выгрузки задач в NDJSON с фильтром списка"""
+    session.add_all(
+        Task(
+            title=f'Task {i}',
+            description='',
+            team_id=1 if i % 2 else 2,
+            performer_id=current_user.id
+        )
+        for i in range(7)
+    )
+    await session.commit()
+
+    response = await client.get(
+        '/tasks/admin/export',
+        params={'team_id': 1}
+    )
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'application/x-ndjson'
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row['title'] for row in rows] == ['Task 1', 'Task 3', 'Task 5']
+    assert all(row['team_id'] == 1 for row in rows)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('current_user', ['admin'], indirect=True)
+async def test_export_meetings_csv(
+        client,
+        session,
+        export_session,
+        current_user
+):
+    """Тест выгрузки встреч с участниками в CSV"""
+    for i in range(3):
+        meeting = Meeting(
+            title=f'Meeting {i}',
+            scheduled_at=datetime.now(UTC) + timedelta(days=i + 1),
+            organizer_id=current_user.id,
+            team_id=1
+        )
+        session.add(meeting)
+        await session.flush()
+        session.add(MeetingParticipant(
+            meeting_id=meeting.id,
+            user_id=current_user.id
+        ))
+    await session.commit()
+
+    response = await client.get(
+        '/meetings/admin/export',
+        params={'format': 'csv'}
+    )
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/csv')
+    assert 'meetings.csv' in response.headers['content-disposition']
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row['title'] for row in rows] == [
+        'Meeting 0',
+        'Meeting 1',
+        'Meeting 2'
+    ]
+    participants = json.loads(rows[0]['participants'])
+    assert [p['user_id'] for p in participants] == [current_user.id]
+
+
+@pytest.mark.asyncio
+async def test_export_requires_admin(client, export_session, current_user):
+    """Тест запрета выгрузки для обычного пользователя"""
+
+    response = await client.get('/users/admin/export')
+    assert response.status_code == 403
@@ -63,5 +63,5 @@ async def test_index_anonymous_user(client):
 
     client.cookies.set('refresh_token', 'token')
     response = await client.get('/')
-    assert response.status_code == status.HTTP_307_TEMPORARY_REDIRECT
-    assert response.headers['location'] == '/auth/refresh?next=/'
+    assert response.status_code == status.HTTP_200_OK
+    assert 'refresh_token=""' in response.headers['set-cookie']
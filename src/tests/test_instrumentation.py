@@ -0,0 +1,53 @@
+import pytest
+from sqlalchemy import text
+
+from src.app import instrumentation
+from src.app.main import app
+from src.app.models.user import User
+from src.app.auth.dependencies import get_current_user
+from src.app.instrumentation import (
+    QueryStats,
+    _query_stats,
+    track_queries
+)
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_counts_queries(engine, client):
+    """Тест заголовка Server-Timing с числом SQL запросов"""
+    track_queries(engine)
+    admin = User(id=1, email='admin@test.com', role='admin')
+    app.dependency_overrides[get_current_user] = lambda: admin
+
+    response = await client.get('/teams/admin/all')
+
+    assert response.status_code == 200
+    server_timing = response.headers['server-timing']
+    assert server_timing.startswith('db;dur=')
+    assert 'desc="1 queries"' in server_timing
+    assert 'app;dur=' in server_timing
+
+
+@pytest.mark.asyncio
+async def test_slow_query_log(engine, session, monkeypatch):
+    """Тест журнала медленных запросов и сбора статистики"""
+    track_queries(engine)
+    logged = []
+    monkeypatch.setattr(instrumentation.settings, 'SLOW_QUERY_MS', 0)
+    monkeypatch.setattr(
+        instrumentation.slow_query_logger,
+        'warning',
+        lambda message, *args: logged.append(args)
+    )
+
+    stats = QueryStats()
+    token = _query_stats.set(stats)
+    try:
+        await session.execute(text('SELECT :value'), {'value': 42})
+    finally:
+        _query_stats.reset(token)
+
+    assert stats.count == 1
+    assert stats.slowest_statement == 'SELECT ?'
+    assert logged[0][1] == 'SELECT ?'
+    assert '42' in logged[0][2]
@@ -0,0 +1,222 @@
+import pytest
+from datetime import datetime, timedelta
+from fastapi import status
+
+from src.app.main import app
+from src.app.models.user import User
+from src.app.models.meeting import Meeting
+from src.app.models.meeting_participants import MeetingParticipant
+from src.app.auth.dependencies import get_current_user
+from src.app.services.meeting_schedule import IntervalIndex
+
+BASE = (datetime.now() + timedelta(days=2)).replace(
+    hour=10,
+    minute=0,
+    second=0,
+    microsecond=0
+)
+
+
+async def create_schedule(session) -> list[Meeting]:
+    """Менеджер и участники команды 1, участник команды 2 и две встречи"""
+    users = [
+        User(
+            id=user_id,
+            first_name='User',
+            last_name=str(user_id),
+            email=f'user{user_id}@test.com',
+            hashed_password='password',
+            role='manager' if user_id == 1 else 'user',
+            team_id=2 if user_id == 4 else 1
+        )
+        for user_id in (1, 2, 3, 4)
+    ]
+    meetings = [
+        Meeting(
+            title='Планирование',
+            scheduled_at=BASE,
+            organizer_id=1,
+            team_id=1
+        ),
+        Meeting(
+            title='Ревью',
+            scheduled_at=BASE + timedelta(minutes=90),
+            duration_minutes=30,
+            organizer_id=1,
+            team_id=1
+        ),
+    ]
+    session.add_all([*users, *meetings])
+    await session.flush()
+    session.add_all([
+        MeetingParticipant(meeting_id=meetings[0].id, user_id=2),
+        MeetingParticipant(meeting_id=meetings[1].id, user_id=3),
+    ])
+    await session.commit()
+    app.dependency_overrides[get_current_user] = lambda: users[0]
+    return meetings
+
+
+def test_interval_index_overlapping():
+    """Тест поиска пересекающихся интервалов"""
+    index = IntervalIndex()
+    index.add(1, BASE, 60)
+    index.add(2, BASE + timedelta(minutes=90), 30)
+    index.add(3, BASE - timedelta(hours=5), 600)
+
+    def overlapping(start_minutes: int, end_minutes: int) -> set[int]:
+        return set(index.overlapping(
+            BASE + timedelta(minutes=start_minutes),
+            BASE + timedelta(minutes=end_minutes)
+        ))
+
+    assert overlapping(30, 45) == {1, 3}
+    assert overlapping(60, 90) == {3}
+    assert overlapping(100, 400) == {2, 3}
+    assert overlapping(300, 400) == set()
+
+    index.remove(3)
+    index.add(1, BASE + timedelta(minutes=60), 30)
+    assert overlapping(0, 60) == set()
+    assert overlapping(80, 100) == {1, 2}
+
+
+@pytest.mark.asyncio
+async def test_create_meeting_rejects_participant_overlap(client, session):
+    """Тест отказа в создании встречи с занятыми участниками"""
+    await create_schedule(session)
+
+    form = {
+        'title': 'Синк',
+        'description': '',
+        'scheduled_at': (BASE + timedelta(minutes=30)).isoformat(),
+        'duration_minutes': 30,
+        'team_id': 1,
+        'participant_ids': [2, 3]
+    }
+    response = await client.post('/meetings/create', data=form)
+    assert response.status_code == status.HTTP_200_OK
+    assert 'Участники заняты' in response.text
+    assert 'user2@test.com: «Планирование»' in response.text
+    assert 'Ревью' not in response.text
+
+    response = await client.post(
+        '/meetings/create',
+        data={**form, 'scheduled_at': (BASE + timedelta(hours=1)).isoformat()}
+    )
+    assert response.status_code == status.HTTP_303_SEE_OTHER
+
+    response = await client.post(
+        '/meetings/create',
+        data={**form, 'allow_overlap': True}
+    )
+    assert response.status_code == status.HTTP_303_SEE_OTHER
+
+
+@pytest.mark.asyncio
+async def test_create_meeting_hides_foreign_schedule(client, session):
+    """Тест проверки команды и участников до поиска пересечений"""
+    await create_schedule(session)
+    meeting = Meeting(
+        title='Закрытая встреча',
+        scheduled_at=BASE,
+        organizer_id=4,
+        team_id=2
+    )
+    session.add(meeting)
+    await session.flush()
+    session.add(MeetingParticipant(meeting_id=meeting.id, user_id=4))
+    await session.commit()
+
+    form = {
+        'title': 'Синк',
+        'description': '',
+        'scheduled_at': BASE.isoformat(),
+        'duration_minutes': 30,
+        'team_id': 2,
+        'add_all_team': True
+    }
+    response = await client.post('/meetings/create', data=form)
+    assert response.status_code == status.HTTP_200_OK
+    assert 'Недостаточно прав' in response.text
+    assert 'Закрытая встреча' not in response.text
+
+    response = await client.post(
+        '/meetings/create',
+        data={**form, 'team_id': 1, 'add_all_team': False,
+              'participant_ids': [4]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert 'не состоят в команде' in response.text
+    assert 'Закрытая встреча' not in response.text
+    assert 'user4@test.com' not in response.text
+
+
+@pytest.mark.asyncio
+async def test_edit_meeting_checks_overlap(client, session):
+    """Тест проверки пересечений при изменении встречи"""
+    meetings = await create_schedule(session)
+    session.add(MeetingParticipant(meeting_id=meetings[1].id, user_id=2))
+    await session.commit()
+
+    form = {
+        'title': 'Ревью',
+        'description': '',
+        'scheduled_at': (BASE + timedelta(minutes=45)).isoformat(),
+        'duration_minutes': 30
+    }
+    response = await client.post(f'/meetings/{meetings[1].id}/edit', data=form)
+    assert response.status_code == status.HTTP_200_OK
+    assert 'Планирование' in response.text
+
+    # пересечение встречи с собой не учитывается
+    response = await client.post(
+        f'/meetings/{meetings[1].id}/edit',
+        data={
+            **form,
+            'scheduled_at': (BASE + timedelta(minutes=100)).isoformat()
+        }
+    )
+    assert response.status_code == status.HTTP_303_SEE_OTHER
+
+    await session.refresh(meetings[1])
+    assert meetings[1].ends_at == BASE + timedelta(minutes=130)
+
+
+@pytest.mark.asyncio
+async def test_free_slots(client, session):
+    """Тест поиска общих свободных интервалов"""
+    await create_schedule(session)
+
+    params = {
+        'user_ids': [1, 2, 3],
+        'start': (BASE - timedelta(hours=1)).isoformat(),
+        'end': (BASE + timedelta(hours=3)).isoformat(),
+        'duration_minutes': 30
+    }
+    response = await client.get('/meetings/free-slots', params=params)
+    assert response.status_code == status.HTTP_200_OK
+    slots = [
+        (
+            datetime.fromisoformat(slot['start']) - BASE,
+            datetime.fromisoformat(slot['end']) - BASE
+        )
+        for slot in response.json()
+    ]
+    assert slots == [
+        (timedelta(hours=-1), timedelta(0)),
+        (timedelta(hours=1), timedelta(minutes=90)),
+        (timedelta(hours=2), timedelta(hours=3)),
+    ]
+
+    response = await client.get(
+        '/meetings/free-slots',
+        params={**params, 'duration_minutes': 60, 'limit': 1}
+    )
+    assert len(response.json()) == 1
+
+    response = await client.get(
+        '/meetings/free-slots',
+        params={**params, 'user_ids': [2, 4]}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
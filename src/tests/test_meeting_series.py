@@ -0,0 +1,385 @@
+import pytest
+from datetime import datetime, timedelta
+from fastapi import status
+from sqlalchemy import func, select
+
+from src.app.main import app
+from src.app.models.user import User
+from src.app.models.meeting import Meeting
+from src.app.models.meeting_participants import MeetingParticipant
+from src.app.models.meeting_series import (
+    MeetingFrequency,
+    MeetingSeries,
+    MeetingSeriesException,
+    MeetingSeriesParticipant
+)
+from src.app.auth.dependencies import get_current_user
+from src.app.services.meeting_series import expand, occurrence_times
+
+BASE = (datetime.now() + timedelta(days=1)).replace(
+    hour=10,
+    minute=0,
+    second=0,
+    microsecond=0
+)
+
+
+def make_series(series_id: int = 1, **fields) -> MeetingSeries:
+    return MeetingSeries(
+        id=series_id,
+        title='Стендап',
+        duration_minutes=15,
+        interval=fields.pop('interval', 1),
+        until=fields.pop('until', None),
+        exceptions=[
+            MeetingSeriesException(occurs_at=moment)
+            for moment in fields.pop('exceptions', [])
+        ],
+        **fields
+    )
+
+
+def test_weekly_occurrences():
+    """Тест развертывания еженедельной серии с исключением"""
+    series = make_series(
+        starts_at=BASE,
+        frequency=MeetingFrequency.weekly,
+        exceptions=[BASE + timedelta(weeks=2)]
+    )
+
+    times = occurrence_times(
+        series,
+        BASE + timedelta(days=1),
+        BASE + timedelta(weeks=5)
+    )
+    assert list(times) == [
+        BASE + timedelta(weeks=week) for week in (1, 3, 4)
+    ]
+
+    # окно далеко от начала серии не перебирает ранние повторения
+    after = BASE + timedelta(weeks=100_000)
+    assert next(occurrence_times(series, after)) == after
+
+    times = occurrence_times(
+        series,
+        before=BASE + timedelta(weeks=3),
+        reverse=True
+    )
+    assert list(times) == [BASE + timedelta(weeks=1), BASE]
+
+
+def test_monthly_occurrences_skip_missing_days():
+    """Тест ежемесячной серии 31 числа и окончания серии"""
+    series = make_series(
+        starts_at=datetime(2031, 1, 31, 9),
+        frequency=MeetingFrequency.monthly,
+        until=datetime(2031, 8, 31, 9)
+    )
+
+    assert [moment.month for moment in occurrence_times(series)] == [
+        1, 3, 5, 7, 8
+    ]
+
+
+def test_expand_merges_series():
+    """Тест объединения нескольких серий в один поток"""
+    daily = make_series(
+        1,
+        starts_at=BASE,
+        frequency=MeetingFrequency.daily,
+        interval=2
+    )
+    weekly = make_series(
+        2,
+        starts_at=BASE,
+        frequency=MeetingFrequency.weekly
+    )
+
+    occurrences = expand(
+        [daily, weekly],
+        BASE,
+        BASE + timedelta(days=8)
+    )
+    assert [
+        (occurrence.scheduled_at - BASE, occurrence.series.id)
+        for occurrence in occurrences
+    ] == [
+        (timedelta(0), 2),
+        (timedelta(0), 1),
+        (timedelta(days=2), 1),
+        (timedelta(days=4), 1),
+        (timedelta(days=6), 1),
+        (timedelta(days=7), 2),
+    ]
+
+
+async def create_team(session) -> list[User]:
+    users = [
+        User(
+            id=user_id,
+            first_name='User',
+            last_name=str(user_id),
+            email=f'user{user_id}@test.com',
+            hashed_password='password',
+            role='manager' if user_id == 1 else 'user',
+            team_id=1
+        )
+        for user_id in (1, 2)
+    ]
+    session.add_all(users)
+    await session.commit()
+    app.dependency_overrides[get_current_user] = lambda: users[0]
+    return users
+
+
+@pytest.mark.asyncio
+async def test_series_api(client, session):
+    """Тест создания серии, ее встреч и отмены одной встречи"""
+    await create_team(session)
+
+    response = await client.post('/meetings/series', json={
+        'title': 'Стендап',
+        'starts_at': BASE.isoformat(),
+        'duration_minutes': 15,
+        'frequency': 'daily',
+        'participants_id': [2]
+    })
+    assert response.status_code == status.HTTP_200_OK
+    series = response.json()
+    assert [p['user_id'] for p in series['participants']] == [2]
+
+    url = f'/meetings/series/{series["id"]}'
+    response = await client.post(
+        f'{url}/exceptions',
+        json={'occurs_at': (BASE + timedelta(days=1)).isoformat()}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()['exceptions']) == 1
+
+    response = await client.post(
+        f'{url}/exceptions',
+        json={'occurs_at': (BASE + timedelta(hours=1)).isoformat()}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    response = await client.get(f'{url}/occurrences', params={'limit': 3})
+    assert [
+        datetime.fromisoformat(occurrence['scheduled_at']) - BASE
+        for occurrence in response.json()
+    ] == [timedelta(0), timedelta(days=2), timedelta(days=3)]
+
+    response = await client.post('/meetings/create', data={
+        'title': 'Планирование',
+        'scheduled_at': BASE.isoformat(),
+        'team_id': 1,
+        'frequency': 'weekly'
+    })
+    assert response.status_code == status.HTTP_303_SEE_OTHER
+    assert response.headers['location'] == '/meetings?status=upcoming'
+    assert await session.scalar(select(func.count(Meeting.id))) == 0
+
+    response = await client.delete(url)
+    assert response.status_code == status.HTTP_200_OK
+    response = await client.get(url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_meetings_page_merges_occurrences(client, session):
+    """Тест страницы встреч с повторениями серии и курсорами"""
+    await create_team(session)
+    session.add_all([
+        MeetingSeries(
+            title='Стендап',
+            starts_at=BASE,
+            frequency=MeetingFrequency.daily,
+            organizer_id=1,
+            team_id=1
+        ),
+        *(
+            Meeting(
+                title=f'Ревью {day}',
+                scheduled_at=BASE + timedelta(days=day, hours=2),
+                organizer_id=1,
+                team_id=1
+            )
+            for day in range(3)
+        ),
+    ])
+    await session.commit()
+
+    response = await client.get(
+        '/meetings/',
+        params={'status': 'upcoming', 'count': 'exact'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.text.count('повтор</span>') == 7
+    assert 'Ревью 2' in response.text
+    assert 'Всего:' not in response.text
+
+    def page_url(text: str, position: int) -> str:
+        query = text.split('href="/meetings/?')[position].split('"')[0]
+        return '/meetings/?' + query.replace('&amp;', '&')
+
+    response = await client.get(page_url(response.text, -1))
+    assert response.text.count('повтор</span>') == 10
+    assert 'Ревью' not in response.text
+
+    response = await client.get(page_url(response.text, -2))
+    assert response.text.count('повтор</span>') == 7
+    assert 'Ревью 2' in response.text
+
+
+@pytest.mark.asyncio
+async def test_index_counts_series_occurrences(client, session):
+    """Тест ближайших встреч участника серии на главной странице"""
+    users = await create_team(session)
+    app.dependency_overrides[get_current_user] = lambda: users[1]
+    series = MeetingSeries(
+        title='Стендап',
+        starts_at=BASE,
+        frequency=MeetingFrequency.weekly,
+        organizer_id=1,
+        team_id=1
+    )
+    meeting = Meeting(
+        title='Ревью',
+        scheduled_at=BASE + timedelta(hours=2),
+        organizer_id=1,
+        team_id=1
+    )
+    session.add_all([series, meeting])
+    await session.flush()
+    session.add_all([
+        MeetingSeriesParticipant(series_id=series.id, user_id=2),
+        MeetingParticipant(meeting_id=meeting.id, user_id=2),
+    ])
+    await session.commit()
+
+    response = await client.get('/')
+    assert response.status_code == status.HTTP_200_OK
+    # две недели: встречи серии через 1 и 8 дней и одна обычная встреча
+    assert 'Встреч за 14 дн.: <strong>3</strong>' in response.text
+
+
+@pytest.mark.asyncio
+async def test_series_occurrences_block_schedule(client, session):
+    """Тест занятости участников встречами серий"""
+    await create_team(session)
+    series = MeetingSeries(
+        title='Стендап',
+        starts_at=BASE,
+        duration_minutes=30,
+        frequency=MeetingFrequency.daily,
+        organizer_id=1,
+        team_id=1
+    )
+    session.add(series)
+    await session.flush()
+    session.add(MeetingSeriesParticipant(series_id=series.id, user_id=2))
+    await session.commit()
+
+    form = {
+        'title': 'Синк',
+        'scheduled_at': (BASE + timedelta(days=3, minutes=15)).isoformat(),
+        'duration_minutes': 30,
+        'team_id': 1,
+        'participant_ids': [2]
+    }
+    response = await client.post('/meetings/create', data=form)
+    assert response.status_code == status.HTTP_200_OK
+    assert 'user2@test.com: «Стендап»' in response.text
+
+    response = await client.get('/meetings/free-slots', params={
+        'user_ids': [2],
+        'start': (BASE + timedelta(days=3, minutes=-30)).isoformat(),
+        'end': (BASE + timedelta(days=3, hours=1)).isoformat(),
+        'duration_minutes': 30
+    })
+    assert [
+        (slot['start'], slot['end']) for slot in response.json()
+    ] == [
+        (
+            (BASE + timedelta(days=3, minutes=-30)).isoformat(),
+            (BASE + timedelta(days=3)).isoformat()
+        ),
+        (
+            (BASE + timedelta(days=3, minutes=30)).isoformat(),
+            (BASE + timedelta(days=3, hours=1)).isoformat()
+        ),
+    ]
+
+    # новая серия проверяется по всем встречам, а не только по первой
+    meeting = Meeting(
+        title='Ревью',
+        scheduled_at=BASE + timedelta(weeks=1, hours=1),
+        organizer_id=1,
+        team_id=1
+    )
+    session.add(meeting)
+    await session.flush()
+    session.add(MeetingParticipant(meeting_id=meeting.id, user_id=2))
+    await session.commit()
+
+    response = await client.post('/meetings/create', data={
+        **form,
+        'scheduled_at': (BASE + timedelta(hours=1)).isoformat(),
+        'frequency': 'weekly'
+    })
+    assert response.status_code == status.HTTP_200_OK
+    assert 'user2@test.com: «Ревью»' in response.text
+
+    response = await client.post('/meetings/create', data={
+        **form,
+        'scheduled_at': (BASE + timedelta(hours=3)).isoformat(),
+        'frequency': 'weekly'
+    })
+    assert response.status_code == status.HTTP_303_SEE_OTHER
+
+
+@pytest.mark.asyncio
+async def test_new_series_hides_foreign_schedule(client, session):
+    """Тест проверки прав и участников до развертывания новой серии"""
+    await create_team(session)
+    session.add(User(
+        id=3,
+        first_name='User',
+        last_name='3',
+        email='user3@test.com',
+        hashed_password='password',
+        team_id=2
+    ))
+    series = MeetingSeries(
+        title='Закрытый стендап',
+        starts_at=BASE,
+        frequency=MeetingFrequency.daily,
+        organizer_id=3,
+        team_id=2
+    )
+    session.add(series)
+    await session.flush()
+    session.add(MeetingSeriesParticipant(series_id=series.id, user_id=3))
+    await session.commit()
+
+    form = {
+        'title': 'Синк',
+        'scheduled_at': (BASE + timedelta(days=1)).isoformat(),
+        'team_id': 2,
+        'add_all_team': True,
+        'frequency': 'weekly'
+    }
+    response = await client.post('/meetings/create', data=form)
+    assert response.status_code == status.HTTP_200_OK
+    assert 'Недостаточно прав' in response.text
+    assert 'Закрытый стендап' not in response.text
+
+    response = await client.post('/meetings/create', data={
+        **form,
+        'team_id': 1,
+        'add_all_team': False,
+        'participant_ids': [3]
+    })
+    assert response.status_code == status.HTTP_200_OK
+    assert 'не состоят в команде' in response.text
+    assert 'Закрытый стендап' not in response.text
+    assert await session.scalar(select(func.count(MeetingSeries.id))) == 1
@@ -130,3 +130,155 @@ async def test_delete_meeting_submit(client, session, monkeypatch):
     response = await client.post(f'/meetings/{meeting.id}/delete')
     assert response.status_code == status.HTTP_303_SEE_OTHER
     assert response.headers['location'] == '/meetings'
+
+
+@pytest.mark.asyncio
+async def test_admin_update_meeting_if_match(client, session):
+    """Тест изменения участников встречи с проверкой версии"""
+    admin = User(
+        id=1,
+        first_name='Admin',
+        last_name='User',
+        email='admin@test.com',
+        hashed_password='password',
+        role='admin',
+        team_id=1
+    )
+    meeting = Meeting(
+        title='Meeting 1',
+        scheduled_at=datetime.now(timezone.utc) + timedelta(days=1),
+        organizer_id=1,
+        team_id=1
+    )
+    session.add_all([admin, meeting])
+    await session.commit()
+
+    app.dependency_overrides[get_current_user] = lambda: admin
+
+    response = await client.put(
+        f'/meetings/admin/{meeting.id}',
+        json={'participants': [{'user_id': 1}]},
+        headers={'If-Match': '"1"'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['etag'] == '"2"'
+    assert [p['user_id'] for p in response.json()['participants']] == [1]
+
+    response = await client.put(
+        f'/meetings/admin/{meeting.id}',
+        json={'title': 'Stale'},
+        headers={'If-Match': '"1"'}
+    )
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+
+@pytest.mark.asyncio
+async def test_admin_update_meeting_participants_diff(client, session):
+    """Тест замены участников встречи по разнице множеств"""
+    users = [
+        User(
+            id=user_id,
+            first_name='User',
+            last_name=str(user_id),
+            email=f'user{user_id}@test.com',
+            hashed_password='password',
+            role='admin' if user_id == 1 else 'user',
+            team_id=2 if user_id == 4 else 1
+        )
+        for user_id in (1, 2, 3, 4)
+    ]
+    meeting = Meeting(
+        title='Meeting 1',
+        scheduled_at=datetime.now(timezone.utc) + timedelta(days=1),
+        organizer_id=1,
+        team_id=1
+    )
+    session.add_all([*users, meeting])
+    await session.commit()
+
+    app.dependency_overrides[get_current_user] = lambda: users[0]
+
+    response = await client.put(
+        f'/meetings/admin/{meeting.id}',
+        json={'participants': [{'user_id': 1}, {'user_id': 2}]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    kept = {p['user_id']: p['id'] for p in response.json()['participants']}
+
+    response = await client.put(
+        f'/meetings/admin/{meeting.id}',
+        json={'participants': [{'user_id': 2}, {'user_id': 3}]}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    participants = {
+        p['user_id']: p['id'] for p in response.json()['participants']
+    }
+    assert set(participants) == {2, 3}
+    # оставшийся участник не пересоздается
+    assert participants[2] == kept[2]
+
+    response = await client.put(
+        f'/meetings/admin/{meeting.id}',
+        json={'title': 'Other team', 'participants': [{'user_id': 4}]}
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    # откат транзакции сбрасывает загруженные объекты общей сессии
+    await session.refresh(users[0])
+    response = await client.get('/meetings/admin/all')
+    stored = response.json()[0]
+    assert stored['title'] == 'Meeting 1'
+    assert stored['version'] == 3
+    assert {p['user_id'] for p in stored['participants']} == {2, 3}
+
+
+@pytest.mark.asyncio
+async def test_admin_create_meeting_with_team_members(client, session):
+    """Тест создания встречи с участниками из команды"""
+    users = [
+        User(
+            id=user_id,
+            first_name='User',
+            last_name=str(user_id),
+            email=f'user{user_id}@test.com',
+            hashed_password='password',
+            role='admin' if user_id == 1 else 'user',
+            team_id=2 if user_id == 3 else 1
+        )
+        for user_id in (1, 2, 3)
+    ]
+    session.add_all(users)
+    await session.commit()
+
+    app.dependency_overrides[get_current_user] = lambda: users[0]
+    scheduled_at = (datetime.now() + timedelta(days=1)).isoformat()
+
+    response = await client.post(
+        '/meetings/admin/create',
+        json={
+            'title': 'All hands',
+            'scheduled_at': scheduled_at,
+            'participants_id': [2],
+            'add_team_members': True
+        }
+    )
+    assert response.status_code == status.HTTP_200_OK
+    meeting = response.json()
+    assert meeting['team_id'] == 1
+    assert meeting['organizer_id'] == 1
+    assert meeting['version'] == 1
+    assert [p['user_id'] for p in meeting['participants']] == [1, 2]
+
+    response = await client.post(
+        '/meetings/admin/create',
+        json={
+            'title': 'Other team',
+            'scheduled_at': scheduled_at,
+            'participants_id': [2, 3]
+        }
+    )
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    await session.refresh(users[0])
+    response = await client.get('/meetings/admin/all')
+    assert [m['title'] for m in response.json()] == ['All hands']
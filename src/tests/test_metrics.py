@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.app.main import app
+from src.app.models.user import User
+from src.app.auth.dependencies import get_current_user
+from src.app.metrics import TimedAsyncAdaptedQueuePool, instrument_engine
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_record_waits_and_timeouts(tmp_path):
+    """Тест учета ожидания и таймаутов при исчерпании пула"""
+    engine = create_async_engine(
+        f'sqlite+aiosqlite:///{tmp_path / "pool.sqlite3"}',
+        poolclass=TimedAsyncAdaptedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1
+    )
+    metrics = instrument_engine(engine)
+
+    async with engine.connect() as conn:
+        await conn.execute(text('SELECT 1'))
+        with pytest.raises(exc.TimeoutError):
+            async with engine.connect():
+                pass
+
+    async def release_later(conn):
+        await asyncio.sleep(0.05)
+        await conn.close()
+
+    conn = await engine.connect()
+    release = asyncio.create_task(release_later(conn))
+    async with engine.connect() as second:
+        await second.execute(text('SELECT 1'))
+    await release
+
+    snapshot = metrics.snapshot(engine.sync_engine.pool)
+    await engine.dispose()
+
+    assert snapshot['timeouts'] == 1
+    assert snapshot['checkouts'] == 3
+    assert snapshot['checkins'] == 3
+    assert snapshot['wait_ms']['count'] == 4
+    assert snapshot['wait_ms']['max'] >= 50
+    assert snapshot['size'] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_metrics_admin_only(client):
+    """Тест доступа к метрикам пула только для admin"""
+    user = User(id=1, email='u@test.com', role='user')
+    app.dependency_overrides[get_current_user] = lambda: user
+    response = await client.get('/metrics/pool')
+    assert response.status_code == 403
+
+    user.role = 'admin'
+    response = await client.get('/metrics/pool')
+    assert response.status_code == 200
+    assert response.json()['pool_class'] == 'TimedAsyncAdaptedQueuePool'
+    assert 'buckets' in response.json()['wait_ms']
@@ -0,0 +1,207 @@
+from datetime import datetime, timedelta, UTC
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+from sqlalchemy import insert, literal, select
+
+from src.app.models.user import User
+from src.app.models.task import Task
+from src.app.models.meeting import Meeting
+from src.app.models.meeting_participants import MeetingParticipant
+from src.app.main import app
+from src.app.config import Settings
+from src.app.auth.dependencies import get_current_user
+from src.app.services.pagination import (
+    CountMode,
+    count_cache,
+    count_rows,
+    paginate
+)
+
+
+async def create_tasks(session, user: User, count: int) -> None:
+    session.add_all(
+        Task(
+            title=f'Task {i}',
+            description='',
+            team_id=1,
+            performer_id=user.id
+        )
+        for i in range(count)
+    )
+    await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_paginate_walks_forward_and_back(session, current_user):
+    """Тест обхода страниц курсорами в обе стороны"""
+    await create_tasks(session, current_user, 25)
+    stmt = select(Task).where(Task.team_id == 1)
+
+    pages = []
+    page = await paginate(session, stmt, [Task.id], 10)
+    assert page.prev_cursor is None
+    pages.append([task.id for task in page.items])
+    while page.next_cursor:
+        page = await paginate(session, stmt, [Task.id], 10, page.next_cursor)
+        pages.append([task.id for task in page.items])
+
+    assert [len(ids) for ids in pages] == [10, 10, 5]
+    assert sum(pages, []) == list(range(1, 26))
+
+    page = await paginate(session, stmt, [Task.id], 10, page.prev_cursor)
+    assert [task.id for task in page.items] == pages[1]
+    page = await paginate(session, stmt, [Task.id], 10, page.prev_cursor)
+    assert [task.id for task in page.items] == pages[0]
+    assert page.prev_cursor is None
+    assert page.next_cursor is not None
+
+
+@pytest.mark.asyncio
+async def test_paginate_mixed_order_with_ties(session, current_user):
+    """Тест сортировки по дате с одинаковыми значениями и убыванию id"""
+    scheduled_at = datetime(2030, 1, 1, tzinfo=UTC)
+    session.add_all(
+        Meeting(
+            title=f'Meeting {i}',
+            scheduled_at=scheduled_at + timedelta(days=i // 3),
+            organizer_id=current_user.id,
+            team_id=1
+        )
+        for i in range(7)
+    )
+    await session.commit()
+
+    order_by = [Meeting.scheduled_at, Meeting.id.desc()]
+    expected = [3, 2, 1, 6, 5, 4, 7]
+
+    seen = []
+    cursor = None
+    while True:
+        page = await paginate(session, select(Meeting), order_by, 2, cursor)
+        seen.extend(meeting.id for meeting in page.items)
+        if not page.next_cursor:
+            break
+        cursor = page.next_cursor
+
+    assert seen == expected
+
+
+@pytest.mark.asyncio
+async def test_paginate_invalid_cursor(session):
+    """Тест ошибки при некорректном курсоре"""
+    with pytest.raises(HTTPException) as exc_info:
+        await paginate(session, select(Task), [Task.id], 10, 'broken')
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_tasks_page_cursor_links(client, session, current_user):
+    """Тест курсорных ссылок и совместимости page= на странице задач"""
+    await create_tasks(session, current_user, 15)
+
+    response = await client.get('/tasks/', params={'page': 2})
+    assert response.status_code == 200
+    assert 'Task 10' in response.text
+    assert 'Task 5' not in response.text
+    assert '/tasks/?cursor=' in response.text
+
+    admin = User(
+        first_name='Admin',
+        last_name='User',
+        email='admin@test.com',
+        hashed_password='password',
+        role='admin',
+        team_id=1
+    )
+    session.add(admin)
+    await session.commit()
+    app.dependency_overrides[get_current_user] = lambda: admin
+    response = await client.get('/tasks/admin/all', params={'limit': 10})
+    assert response.status_code == 200
+    assert len(response.json()) == 10
+
+    response = await client.get(
+        '/tasks/admin/all',
+        params={'limit': 10, 'cursor': response.headers['X-Next-Cursor']}
+    )
+    assert [task['id'] for task in response.json()] == list(range(11, 16))
+    assert 'X-Next-Cursor' not in response.headers
+    assert 'X-Prev-Cursor' in response.headers
+
+
+@pytest.mark.asyncio
+async def test_count_modes_and_cache_invalidation(session, current_user):
+    """Тест режимов подсчета и сброса кэша при добавлении задачи"""
+    await create_tasks(session, current_user, 3)
+    stmt = select(Task).where(Task.team_id == 1)
+    key = ('tasks', 1, None, None)
+
+    assert await count_rows(session, stmt, CountMode.none) is None
+
+    total = await count_rows(session, stmt, CountMode.exact)
+    assert (total.value, total.estimated) == (3, False)
+
+    total = await count_rows(session, stmt, CountMode.estimate, key)
+    assert (total.value, total.estimated) == (3, True)
+    assert count_cache.get(key) == 3
+
+    await create_tasks(session, current_user, 1)
+    assert count_cache.get(key) is None
+    total = await count_rows(session, stmt, CountMode.estimate, key)
+    assert total.value == 4
+
+
+@pytest.mark.asyncio
+async def test_tasks_page_count_override(client, session, current_user):
+    """Тест выбора режима подсчета параметром count"""
+    await create_tasks(session, current_user, 2)
+
+    response = await client.get('/tasks/', params={'count': 'none'})
+    assert 'Всего' not in response.text
+
+    response = await client.get('/tasks/', params={'count': 'exact'})
+    assert 'Всего: 2' in response.text
+
+    response = await client.get('/tasks/')
+    assert 'Всего: ~2' in response.text
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_invalidates_counts(session, current_user):
+    """Тест сброса кэша подсчетов при INSERT в обход unit of work"""
+    count_cache.set(('tasks', 1, None, None), 3)
+    count_cache.set(('meetings', 1, None, None), 2)
+
+    await session.execute(insert(Task), [{
+        'title': 'Imported',
+        'description': '',
+        'team_id': 1,
+        'performer_id': current_user.id
+    }])
+    assert count_cache.get(('tasks', 1, None, None)) is None
+    assert count_cache.get(('meetings', 1, None, None)) == 2
+
+    meeting = Meeting(
+        title='Планерка',
+        scheduled_at=datetime(2030, 1, 1, tzinfo=UTC),
+        team_id=1,
+        organizer_id=current_user.id
+    )
+    session.add(meeting)
+    await session.flush()
+    count_cache.set(('meetings', 1, None, None), 2)
+    await session.execute(
+        insert(MeetingParticipant).from_select(
+            ['meeting_id', 'user_id'],
+            select(literal(meeting.id), User.id).where(User.team_id == 1)
+        )
+    )
+    assert count_cache.get(('meetings', 1, None, None)) is None
+
+
+def test_page_count_setting_validated():
+    """Тест проверки режима подсчета в настройках при запуске"""
+    with pytest.raises(ValidationError):
+        Settings(TASKS_PAGE_COUNT='exactly')
@@ -0,0 +1,39 @@
+import pytest
+from fastapi import HTTPException, status
+
+from src.app.auth.password_pool import PasswordWorkerPool
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_in_thread_pool():
+    """Тест хеширования и проверки пароля в пуле потоков"""
+    pool = PasswordWorkerPool(executor='thread', workers=2, max_queue=10)
+
+    hashed = await pool.hash('Password123')
+    verified, updated_hash = await pool.verify_and_update(
+        'Password123',
+        hashed
+    )
+    wrong, _ = await pool.verify_and_update('Wrong123', hashed)
+    pool.shutdown()
+
+    assert verified is True
+    assert updated_hash is None
+    assert wrong is False
+    stats = pool.stats()
+    assert stats['completed'] == 3
+    assert stats['queued'] == 0
+    assert stats['in_flight'] == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_rejects_when_queue_is_full():
+    """Тест отказа при переполнении очереди"""
+    pool = PasswordWorkerPool(executor='thread', workers=1, max_queue=0)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await pool.hash('Password123')
+    pool.shutdown()
+
+    assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert pool.stats()['rejected'] == 1
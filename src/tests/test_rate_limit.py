@@ -0,0 +1,65 @@
+import pytest
+from fastapi import status
+
+from src.app.main import app
+from src.app.auth.user_manager import get_user_manager
+from src.app.auth.rate_limit import (
+    MemoryRateLimitStorage,
+    TokenBucketLimiter,
+    login_email_limiter
+)
+
+
+class CountingUserManager:
+    def __init__(self):
+        self.calls = 0
+
+    async def authenticate(self, credentials):
+        self.calls += 1
+        return None
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_refills(monkeypatch):
+    """Тест исчерпания и пополнения бакета"""
+    now = [1000.0]
+    monkeypatch.setattr(
+        'src.app.auth.rate_limit.time.monotonic',
+        lambda: now[0]
+    )
+    limiter = TokenBucketLimiter('test', 2, MemoryRateLimitStorage())
+
+    assert await limiter.hit('key') == 0
+    assert await limiter.hit('key') == 0
+    assert await limiter.hit('key') == 30
+    assert await limiter.hit('other') == 0
+
+    now[0] += 30
+    assert await limiter.hit('key') == 0
+    assert limiter.stats()['allowed'] == 4
+    assert limiter.stats()['throttled'] == 1
+
+
+@pytest.mark.asyncio
+async def test_login_throttled_before_authenticate(client):
+    """Тест отклонения входа до проверки пароля"""
+    user_manager = CountingUserManager()
+    app.dependency_overrides[get_user_manager] = lambda: user_manager
+    throttled = login_email_limiter.throttled
+
+    for _ in range(login_email_limiter.capacity):
+        response = await client.post(
+            '/auth/login',
+            data={'username': 'victim@email.com', 'password': 'wrong'}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+    response = await client.post(
+        '/auth/login',
+        data={'username': 'Victim@email.com', 'password': 'wrong'}
+    )
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert 'Retry-After' in response.headers
+    assert 'Слишком много попыток' in response.text
+    assert user_manager.calls == login_email_limiter.capacity
+    assert login_email_limiter.throttled == throttled + 1
@@ -0,0 +1,71 @@
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from src.app import database
+from src.app.database import Base, PRIMARY_PIN_COOKIE
+from src.app.main import app
+from src.app.models.team import Team
+from src.app.models.user import User
+from src.app.auth.dependencies import get_current_user
+
+
+@pytest_asyncio.fixture
+async def routed_client(tmp_path, monkeypatch):
+    """Клиент с основной БД и репликой в двух SQLite файлах"""
+    factories = {}
+    engines = []
+    for name in ('primary', 'replica'):
+        engine = create_async_engine(
+            f'sqlite+aiosqlite:///{tmp_path / name}.sqlite3'
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factories[name] = async_sessionmaker(engine, expire_on_commit=False)
+        engines.append(engine)
+
+        async with factories[name]() as session:
+            session.add(Team(id=1, name=f'{name} team', code=name))
+            await session.commit()
+
+    monkeypatch.setattr(database, 'async_session', factories['primary'])
+    monkeypatch.setattr(database, 'replica_session', factories['replica'])
+
+    admin = User(id=1, email='admin@test.com', role='admin')
+    app.dependency_overrides[get_current_user] = lambda: admin
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url='http://test') as c:
+        yield c
+
+    app.dependency_overrides.clear()
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_reads_from_replica(routed_client):
+    """Тест чтения GET запросов из реплики"""
+    response = await routed_client.get('/teams/admin/all')
+    assert response.status_code == 200
+    assert response.json()[0]['name'] == 'replica team'
+    assert PRIMARY_PIN_COOKIE not in response.headers.get('set-cookie', '')
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes_after_update(routed_client):
+    """Тест чтения из основной БД после записи того же клиента"""
+    response = await routed_client.put(
+        '/teams/admin/1',
+        json={'name': 'renamed'}
+    )
+    assert response.status_code == 200
+    assert PRIMARY_PIN_COOKIE in response.headers['set-cookie']
+
+    response = await routed_client.get('/teams/admin/all')
+    assert response.json()[0]['name'] == 'renamed'
+
+    routed_client.cookies.clear()
+    response = await routed_client.get('/teams/admin/all')
+    assert response.json()[0]['name'] == 'replica team'
@@ -0,0 +1,95 @@
+import pytest
+from fastapi import status
+
+from src.app.auth.auth import access_backend, refresh_backend
+from src.app.auth.revocation import RevocationStore, revocation_store
+from src.app.models.user import User
+
+
+class FakeUserManager:
+    def __init__(self, user: User):
+        self.user = user
+
+    def parse_id(self, id: str) -> int:
+        return int(id)
+
+    async def get(self, id: int) -> User:
+        return self.user
+
+
+@pytest.fixture(autouse=True)
+def clear_revocation_store():
+    revocation_store.clear()
+    yield
+    revocation_store.clear()
+
+
+async def create_user(session) -> User:
+    user = User(
+        first_name='Test',
+        last_name='User',
+        email='revoke@test.com',
+        hashed_password='password'
+    )
+    session.add(user)
+    await session.commit()
+    await session.refresh(user)
+    return user
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_tokens(client, session):
+    """Тест отзыва access и refresh токенов при выходе"""
+    test_user = await create_user(session)
+    access_token = await access_backend.get_strategy().write_token(test_user)
+    refresh_token = await refresh_backend.get_strategy().write_token(
+        test_user
+    )
+
+    client.cookies.set('access_token', f'"Bearer {access_token}"')
+    client.cookies.set('refresh_token', f'"Bearer {refresh_token}"')
+    response = await client.post('/auth/logout')
+    assert response.status_code == status.HTTP_303_SEE_OTHER
+
+    user_manager = FakeUserManager(test_user)
+    assert await access_backend.get_strategy().read_token(
+        access_token,
+        user_manager
+    ) is None
+    assert await refresh_backend.get_strategy().read_token(
+        refresh_token,
+        user_manager
+    ) is None
+
+
+@pytest.mark.asyncio
+async def test_revoke_user_keeps_new_tokens(session):
+    """Тест отзыва всех ранее выпущенных токенов пользователя"""
+    test_user = await create_user(session)
+    strategy = refresh_backend.get_strategy()
+    old_token = await strategy.write_token(test_user)
+
+    await revocation_store.revoke_user(session, test_user.id, 3600)
+    await session.commit()
+    new_token = await strategy.write_token(test_user)
+
+    user_manager = FakeUserManager(test_user)
+    assert await strategy.read_token(old_token, user_manager) is None
+    assert await strategy.read_token(new_token, user_manager) is test_user
+
+
+@pytest.mark.asyncio
+async def test_revocations_synced_between_workers(session):
+    """Тест синхронизации отозванных токенов другим процессом"""
+    test_user = await create_user(session)
+    strategy = access_backend.get_strategy()
+    token = await strategy.write_token(test_user)
+    payload = strategy.decode_token(token)
+
+    await revocation_store.revoke_token(session, payload)
+    await session.commit()
+
+    other_worker = RevocationStore()
+    assert other_worker.is_revoked(payload) is False
+    await other_worker.sync(session)
+    assert other_worker.is_revoked(payload) is True
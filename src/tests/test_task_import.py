@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from sqlalchemy import select
+
+from src.app.config import settings
+from src.app.models.team import Team
+from src.app.models.task import Task, TaskStatus
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('current_user', ['admin'], indirect=True)
+async def test_import_tasks_csv(client, session, current_user, monkeypatch):
+    """Тест импорта CSV с поиском исполнителя по email и отчетом об ошибках"""
+    # строки проверяются и вставляются пачками
+    monkeypatch.setattr(settings, 'TASK_IMPORT_BATCH_SIZE', 2)
+    session.add(Team(id=1, name='Team', code='TEAM'))
+    await session.commit()
+    content = (
+        'title,description,status,team_id,performer_email,deadline_date\n'
+        'First,,,1,Admin@Test.com,2099-01-01T10:00:00\n'
+        'Second,Описание,in_progress,1,,\n'
+        ',No title,,1,,\n'
+        'Unknown,,,1,nobody@test.com,\n'
+        'Past,,,1,,2000-01-01T10:00:00\n'
+        'Wrong team,,,42,,\n'
+    )
+
+    response = await client.post(
+        '/tasks/admin/import',
+        files={'file': ('tasks.csv', content.encode(), 'text/csv')}
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report['total'] == 6
+    assert report['imported'] == 2
+    assert [error['line'] for error in report['errors']] == [4, 5, 6, 7]
+    assert 'title' in report['errors'][0]['errors'][0]
+    assert report['errors'][1]['errors'] == [
+        'Пользователь nobody@test.com не найден'
+    ]
+    assert report['errors'][3]['errors'] == ['Команда 42 не найдена']
+
+    tasks = (await session.execute(
+        select(Task).order_by(Task.id)
+    )).scalars().all()
+    assert [task.title for task in tasks] == ['First', 'Second']
+    assert tasks[0].performer_id == current_user.id
+    assert tasks[0].description == ''
+    assert tasks[1].status == TaskStatus.in_progress
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('current_user', ['admin'], indirect=True)
+async def test_import_tasks_ndjson(client, session, current_user):
+    """Тест импорта JSON lines с некорректными строками"""
+    session.add(Team(id=1, name='Team', code='TEAM'))
+    await session.commit()
+    lines = [
+        json.dumps({
+            'title': 'One',
+            'team_id': 1,
+            'performer_id': current_user.id
+        }),
+        '{broken',
+        '',
+        json.dumps(['not', 'an', 'object']),
+        json.dumps({'title': 'Two', 'team_id': 1, 'manager_id': 999}),
+    ]
+
+    response = await client.post(
+        '/tasks/admin/import',
+        files={'file': ('tasks.jsonl', '\n'.join(lines).encode())}
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report['imported'] == 1
+    assert report['errors'] == [
+        {'line': 2, 'errors': ['Ожидается JSON объект']},
+        {'line': 4, 'errors': ['Ожидается JSON объект']},
+        {'line': 5, 'errors': ['Пользователь 999 не найден']},
+    ]
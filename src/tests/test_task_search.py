@@ -0,0 +1,94 @@
+import pytest
+
+from src.app.models.user import User
+from src.app.models.task import Task
+
+
+async def create_tasks(session, user: User) -> list[Task]:
+    tasks = [
+        Task(
+            title='Подготовить отчет',
+            description='Квартальный отчет для руководства',
+            team_id=1,
+            performer_id=user.id
+        ),
+        Task(
+            title='Починить сборку',
+            description='После сборки приложить отчет о тестах',
+            team_id=1,
+            performer_id=user.id
+        ),
+        Task(
+            title='<b>Отчет</b> о безопасности',
+            description='',
+            team_id=1,
+            performer_id=user.id
+        ),
+        Task(
+            title='Обновить зависимости',
+            description='Без отчетов',
+            team_id=1,
+            performer_id=user.id
+        ),
+        Task(
+            title='Отчет другой команды',
+            description='',
+            team_id=2,
+            performer_id=user.id
+        ),
+    ]
+    session.add_all(tasks)
+    await session.commit()
+    return tasks
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('current_user', ['admin'], indirect=True)
+async def test_admin_search_ranked_with_cursor(client, session, current_user):
+    """Тест поиска с сортировкой по релевантности и курсорами"""
+    tasks = await create_tasks(session, current_user)
+
+    response = await client.get(
+        '/tasks/admin/search',
+        params={'q': 'отчет', 'team_id': 1, 'limit': 2}
+    )
+    assert response.status_code == 200
+    first_page = response.json()
+    assert len(first_page) == 2
+    # совпадение в описании ранжируется ниже совпадений в названии
+    assert tasks[1].id not in [hit['id'] for hit in first_page]
+
+    response = await client.get(
+        '/tasks/admin/search',
+        params={
+            'q': 'отчет',
+            'team_id': 1,
+            'limit': 2,
+            'cursor': response.headers['X-Next-Cursor']
+        }
+    )
+    second_page = response.json()
+    assert [hit['id'] for hit in second_page] == [tasks[1].id]
+    assert 'X-Next-Cursor' not in response.headers
+
+    snippets = {hit['id']: hit['snippet'] for hit in first_page}
+    assert '<mark>отчет</mark>' in snippets[tasks[0].id]
+    assert '&lt;b&gt;<mark>Отчет</mark>&lt;/b&gt;' in snippets[tasks[2].id]
+
+
+@pytest.mark.asyncio
+async def test_search_follows_updates(client, session, current_user):
+    """Тест обновления поискового индекса при изменении задачи"""
+    tasks = await create_tasks(session, current_user)
+
+    tasks[3].title = 'Срочный отчет по зависимостям'
+    await session.commit()
+    await session.delete(tasks[0])
+    await session.commit()
+
+    response = await client.get('/tasks/', params={'q': 'ОТЧЕТ'})
+    assert response.status_code == 200
+    assert 'Срочный <mark>отчет</mark>' in response.text
+    assert 'Подготовить отчет' not in response.text
+    assert 'Отчет другой команды' not in response.text
+    assert 'Всего: ~3' in response.text
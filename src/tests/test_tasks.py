@@ -95,3 +95,173 @@ async def test_update_task_status(client, session):
 
     await session.refresh(test_task)
     assert test_task.status == TaskStatus.done
+
+
+@pytest.mark.asyncio
+async def test_update_tasks_status_batch(client, session):
+    """Тест изменения статуса нескольких задач с отчетом о пропущенных"""
+    test_user = User(
+        first_name='User',
+        last_name='User',
+        email='user@test.com',
+        hashed_password='password',
+        role='user',
+        team_id=1
+    )
+    other_user = User(
+        first_name='Other',
+        last_name='User',
+        email='other@test.com',
+        hashed_password='password',
+        role='user',
+        team_id=1
+    )
+    session.add_all([test_user, other_user])
+    await session.commit()
+    await session.refresh(test_user)
+    await session.refresh(other_user)
+
+    def make_task(title, task_status, performer, team_id=1):
+        return Task(
+            title=title,
+            description='Описание',
+            performer_id=performer.id,
+            team_id=team_id,
+            status=task_status
+        )
+
+    tasks = [
+        make_task('Open 1', 'open', test_user),
+        make_task('Open 2', 'open', test_user),
+        make_task('Done', 'done', test_user),
+        make_task('In progress', 'in_progress', test_user),
+        make_task('Other performer', 'open', other_user),
+        make_task('Other team', 'open', test_user, team_id=2),
+    ]
+    session.add_all(tasks)
+    await session.commit()
+    ids = [task.id for task in tasks]
+
+    app.dependency_overrides[get_current_user] = lambda: test_user
+
+    response = await client.post(
+        '/tasks/status/batch',
+        json={'task_ids': ids + [999, ids[0]], 'status': 'in_progress'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    result = response.json()
+    assert result['updated'] == ids[:2]
+    assert result['skipped'] == [
+        {
+            'id': ids[2],
+            'reason': 'Невозможно изменение статуса done на in_progress'
+        },
+        {'id': ids[3], 'reason': 'Задача уже в статусе in_progress'},
+        {
+            'id': ids[4],
+            'reason': 'Только исполнитель может менять статус задачи'
+        },
+        {'id': ids[5], 'reason': 'Задача не найдена'},
+        {'id': 999, 'reason': 'Задача не найдена'},
+    ]
+
+    for task in tasks:
+        await session.refresh(task)
+    assert [task.status for task in tasks[:2]] == [TaskStatus.in_progress] * 2
+    assert tasks[4].status == TaskStatus.open
+
+    app.dependency_overrides[get_current_user] = lambda: None
+    response = await client.post(
+        '/tasks/status/batch',
+        json={'task_ids': ids, 'status': 'done'}
+    )
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    # задачи другой команды недоступны и админу, как в /tasks/{id}/status
+    admin = User(
+        first_name='Admin',
+        last_name='User',
+        email='admin@test.com',
+        hashed_password='password',
+        role='admin',
+        team_id=1
+    )
+    session.add(admin)
+    await session.commit()
+    app.dependency_overrides[get_current_user] = lambda: admin
+
+    response = await client.post(
+        '/tasks/status/batch',
+        json={'task_ids': [ids[4], ids[5]], 'status': 'in_progress'}
+    )
+    assert response.json() == {
+        'updated': [ids[4]],
+        'skipped': [{'id': ids[5], 'reason': 'Задача не найдена'}]
+    }
+
+
+@pytest.mark.asyncio
+async def test_admin_update_task_if_match(client, session):
+    """Тест изменения задачи с проверкой версии через If-Match"""
+    admin = User(
+        first_name='Admin',
+        last_name='User',
+        email='admin@test.com',
+        hashed_password='password',
+        role='admin',
+        team_id=1
+    )
+    session.add(admin)
+    await session.commit()
+    test_task = Task(title='Versioned', description='', team_id=1)
+    session.add(test_task)
+    await session.commit()
+    assert test_task.version == 1
+
+    app.dependency_overrides[get_current_user] = lambda: admin
+
+    response = await client.get(f'/tasks/admin/{test_task.id}')
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()['title'] == 'Versioned'
+    etag = response.headers['etag']
+    assert etag == '"1"'
+
+    response = await client.get('/tasks/admin/team/1')
+    assert [task['id'] for task in response.json()] == [test_task.id]
+
+    response = await client.put(
+        f'/tasks/admin/{test_task.id}',
+        json={'title': 'First editor'},
+        headers={'If-Match': etag}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['etag'] == '"2"'
+    assert response.json()['version'] == 2
+
+    response = await client.put(
+        f'/tasks/admin/{test_task.id}',
+        json={'title': 'Second editor'},
+        headers={'If-Match': '"1"'}
+    )
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+    await session.refresh(test_task)
+    assert test_task.title == 'First editor'
+
+    test_task.status = TaskStatus.in_progress
+    await session.commit()
+    assert test_task.version == 3
+
+    response = await client.put(
+        f'/tasks/admin/{test_task.id}',
+        json={'title': 'Without check'}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['etag'] == '"4"'
+
+    response = await client.put(
+        '/tasks/admin/999',
+        json={'title': 'Missing'},
+        headers={'If-Match': '"1"'}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
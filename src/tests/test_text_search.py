@@ -0,0 +1,151 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.app.models.user import User
+from src.app.models.team import Team
+from src.app.admin.views.team import TeamAdmin
+from src.app.services.text_search import (
+    TextSearch,
+    TrigramIndex,
+    get_text_search
+)
+
+
+async def create_users(session) -> None:
+    session.add_all([
+        User(
+            first_name='John',
+            last_name='Smith',
+            email='john.smith@mail.example',
+            hashed_password='password'
+        ),
+        User(
+            first_name='Jane',
+            last_name='Doe',
+            email='jane_doe@mail.example',
+            hashed_password='password'
+        ),
+    ])
+    await session.commit()
+
+
+def test_trigram_index_candidates_and_similarity():
+    """Тест кандидатов подстроки и нечеткого совпадения"""
+    index = TrigramIndex(User.email)
+    index.add(1, 'john.smith@mail.ru')
+    index.add(2, 'jane_doe@gmail.com')
+    index.add(3, 'smithers@corp.org')
+
+    assert index.candidates('smith') == {1, 3}
+    assert index.candidates('h.sm') is None
+    assert index.candidates('xyz@q') == set()
+    assert index.similar('jon.smith@mail.ru') == [1]
+
+    index.add(3, 'other@corp.org')
+    assert index.candidates('smith') == {1}
+    index.remove(1)
+    assert index.candidates('smith') == set()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('current_user', ['admin'], indirect=True)
+async def test_admin_users_substring_and_fuzzy(client, session, current_user):
+    """Тест поиска пользователей по части email и нечеткого поиска"""
+    await create_users(session)
+
+    response = await client.get(
+        '/users/admin/all',
+        params={'email': 'SMITH@mail'}
+    )
+    assert response.status_code == 200
+    assert [u['email'] for u in response.json()] == [
+        'john.smith@mail.example'
+    ]
+
+    # _ в строке поиска не является шаблоном LIKE
+    response = await client.get('/users/admin/all', params={'email': 'e_d'})
+    assert [u['email'] for u in response.json()] == ['jane_doe@mail.example']
+
+    response = await client.get(
+        '/users/admin/all',
+        params={'email': 'jon.smith@mail.exmaple', 'match': 'fuzzy'}
+    )
+    assert [u['email'] for u in response.json()] == [
+        'john.smith@mail.example'
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('current_user', ['admin'], indirect=True)
+async def test_index_follows_committed_changes(
+        client,
+        session,
+        engine,
+        current_user
+):
+    """Тест обновления индекса в памяти после коммита"""
+    await create_users(session)
+    response = await client.get('/users/admin/all', params={'email': 'smith'})
+    assert len(response.json()) == 1
+
+    async with async_sessionmaker(engine)() as other:
+        user = await other.scalar(select(User).where(User.last_name == 'Doe'))
+        user.email = 'jane.smithers@mail.example'
+        await other.flush()
+        await other.rollback()
+
+    user = await session.scalar(select(User).where(User.last_name == 'Doe'))
+    user.email = 'jane.smithson@mail.example'
+    await session.commit()
+
+    response = await client.get(
+        '/users/admin/all',
+        params={'email': 'smithson', 'match': 'fuzzy'}
+    )
+    assert [u['email'] for u in response.json()] == [
+        'jane.smithson@mail.example'
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('current_user', ['admin'], indirect=True)
+async def test_admin_teams_filter_and_sqladmin_search(
+        client,
+        session,
+        engine,
+        monkeypatch,
+        current_user
+):
+    """Тест поиска команд в API и в sqladmin"""
+    session.add_all([
+        Team(name='Backend platform', code='BACK01'),
+        Team(name='Frontend', code='FRONT01'),
+    ])
+    await session.commit()
+
+    response = await client.get(
+        '/teams/admin/all',
+        params={'name': 'platf'}
+    )
+    assert [team['name'] for team in response.json()] == ['Backend platform']
+
+    response = await client.get('/teams/admin/all', params={'code': 'ront'})
+    assert [team['name'] for team in response.json()] == ['Frontend']
+
+    monkeypatch.setattr(
+        TeamAdmin,
+        'session_maker',
+        async_sessionmaker(engine),
+        raising=False
+    )
+    view = TeamAdmin()
+    assert view.text_search.dialect == 'sqlite'
+    await view.refresh_search()
+    teams = await session.scalars(
+        view.search_query(select(Team), 'end').order_by(Team.id)
+    )
+    assert [team.name for team in teams] == ['Backend platform', 'Frontend']
+
+    condition = TextSearch('postgresql').similar(Team.name, 'frontent')
+    assert 'name %' in str(condition)
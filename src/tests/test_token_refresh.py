@@ -0,0 +1,115 @@
+import pytest
+from fastapi import status
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.app.auth import middleware
+from src.app.auth.auth import refresh_backend
+from src.app.auth.middleware import refresh_cache
+from src.app.auth.user_cache import user_cache
+from src.app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    user_cache.clear()
+    refresh_cache.clear()
+    yield
+    user_cache.clear()
+    refresh_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_access_token_refreshed_inline(
+    client,
+    session,
+    engine,
+    monkeypatch
+):
+    """Тест выпуска access токена без редиректа на /auth/refresh"""
+    test_user = User(
+        first_name='Test',
+        last_name='User',
+        email='refresh@test.com',
+        hashed_password='password'
+    )
+    session.add(test_user)
+    await session.commit()
+    await session.refresh(test_user)
+
+    monkeypatch.setattr(
+        middleware,
+        'async_session',
+        async_sessionmaker(engine, expire_on_commit=False)
+    )
+    refresh_token = await refresh_backend.get_strategy().write_token(
+        test_user
+    )
+    client.cookies.set('refresh_token', f'"Bearer {refresh_token}"')
+    client.cookies.set('access_token', '"Bearer expired"')
+
+    response = await client.get('/users/profile')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert 'refresh@test.com' in response.text
+    assert response.headers['set-cookie'].startswith('access_token=')
+
+
+@pytest.mark.asyncio
+async def test_valid_access_token_is_not_refreshed(client, monkeypatch):
+    """Тест пропуска запроса с действующим access токеном"""
+    def fail_session():
+        raise AssertionError('Refresh токен не должен проверяться')
+
+    monkeypatch.setattr(middleware, 'async_session', fail_session)
+    monkeypatch.setattr(
+        middleware,
+        '_is_access_token_valid',
+        lambda token: True
+    )
+    client.cookies.set('refresh_token', '"Bearer refresh"')
+    client.cookies.set('access_token', '"Bearer access"')
+
+    response = await client.get('/auth/login')
+
+    assert response.status_code == status.HTTP_200_OK
+    assert 'set-cookie' not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_logout_with_expired_access_token(
+    client,
+    session,
+    engine,
+    monkeypatch
+):
+    """Тест выхода из аккаунта, когда access токен истек"""
+    test_user = User(
+        first_name='Test',
+        last_name='User',
+        email='logout@test.com',
+        hashed_password='password'
+    )
+    session.add(test_user)
+    await session.commit()
+    await session.refresh(test_user)
+
+    monkeypatch.setattr(
+        middleware,
+        'async_session',
+        async_sessionmaker(engine, expire_on_commit=False)
+    )
+    refresh_token = await refresh_backend.get_strategy().write_token(
+        test_user
+    )
+    client.cookies.set('refresh_token', f'"Bearer {refresh_token}"')
+    client.cookies.set('access_token', '"Bearer expired"')
+
+    response = await client.post('/auth/logout')
+
+    assert response.status_code == status.HTTP_303_SEE_OTHER
+    cookies = response.headers.get_list('set-cookie')
+    access_cookies = [
+        cookie for cookie in cookies if cookie.startswith('access_token=')
+    ]
+    assert len(access_cookies) == 1
+    assert 'Max-Age=0' in access_cookies[0]
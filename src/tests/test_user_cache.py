@@ -0,0 +1,104 @@
+import pytest
+from sqlalchemy import update
+from starlette.requests import Request
+
+from src.app.models.user import User
+from src.app.auth.auth import access_backend
+from src.app.auth.dependencies import get_current_user
+from src.app.auth.user_cache import user_cache
+from src.app.auth.user_manager import get_user_db
+
+
+class FailingUserManager:
+    def parse_id(self, id: str) -> int:
+        return int(id)
+
+    async def get(self, id: int):
+        raise AssertionError('Пользователь должен быть получен из кэша')
+
+
+def make_request(token: str) -> Request:
+    return Request({
+        'type': 'http',
+        'method': 'GET',
+        'path': '/',
+        'headers': [(b'cookie', f'access_token="Bearer {token}"'.encode())]
+    })
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    user_cache.clear()
+    yield
+    user_cache.clear()
+
+
+async def create_user(session) -> User:
+    user = User(
+        first_name='Test',
+        last_name='User',
+        email='cached@test.com',
+        hashed_password='password',
+        role='user'
+    )
+    session.add(user)
+    await session.commit()
+    await session.refresh(user)
+    return user
+
+
+@pytest.mark.asyncio
+async def test_current_user_served_from_cache(session):
+    """Тест получения пользователя из кэша без обращения к БД"""
+    test_user = await create_user(session)
+    token = await access_backend.get_strategy().write_token(test_user)
+    user_cache.set(token, test_user)
+    session.expunge(test_user)
+
+    user = await get_current_user(
+        make_request(token),
+        db=session,
+        user_manager=FailingUserManager()
+    )
+
+    assert user is not test_user
+    assert user in session
+    assert user.id == test_user.id
+    assert user.email == 'cached@test.com'
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidated_on_role_change(session):
+    """Тест сброса кэша при изменении роли пользователя"""
+    test_user = await create_user(session)
+    token = await access_backend.get_strategy().write_token(test_user)
+    user_cache.set(token, test_user)
+
+    test_user.role = 'manager'
+    await session.commit()
+
+    assert user_cache.get(token) is None
+
+
+@pytest.mark.asyncio
+async def test_cache_invalidated_on_bulk_update(session):
+    """Тест сброса кэша при массовом обновлении пользователей"""
+    test_user = await create_user(session)
+    token = await access_backend.get_strategy().write_token(test_user)
+    user_cache.set(token, test_user)
+
+    await session.execute(
+        update(User)
+        .where(User.id == test_user.id)
+        .values(is_active=False)
+    )
+
+    assert user_cache.get(token) is None
+
+
+@pytest.mark.asyncio
+async def test_user_db_shares_request_session(session):
+    """Тест использования адаптером fastapi-users сессии запроса"""
+    user_db = await anext(get_user_db(session))
+
+    assert user_db.session is session
@@ -120,6 +120,9 @@ async def test_change_password(client, session, monkeypatch):
         async def authenticate(self, credentials: OAuth2PasswordRequestForm):
             return test_user if credentials.password == "oldpass" else None
 
+        async def hash_password(self, pwd: str) -> str:
+            return self.password_helper.hash(pwd)
+
     app.dependency_overrides[get_current_user] = lambda: test_user
     app.dependency_overrides[get_user_manager] = lambda: FakeUserManager()
 